@@ -0,0 +1,86 @@
+"""
+Micro-benchmark for letter PDF rendering.
+
+Compares the previous per-call FPDF setup against the cached renderer used by
+`helpers.cv.convert_text_to_pdf`. Run from the repository root:
+
+    python -m benchmarks.bench_convert_text_to_pdf
+"""
+
+import os
+import random
+import statistics
+import time
+import tracemalloc
+from fpdf import FPDF
+from helpers.cv import convert_text_to_pdf
+
+ITERATIONS = 50
+
+LETTER = (
+    "Dear Hiring Manager,\n\n"
+    + (
+        "I am excited to apply for the Backend Developer position. Over the "
+        "last five years I have built REST APIs with Python, FastAPI and "
+        "PostgreSQL, and I enjoy turning vague requirements into reliable "
+        "services. Zażółć gęślą jaźń.\n\n"
+    )
+    * 4
+    + "Sincerely,\nJan Kowalski"
+)
+
+
+def sample_letters():
+    """Shuffled variants of LETTER so glyph sets differ between renders."""
+    rng = random.Random(42)
+    words = LETTER.split(" ")
+    for _ in range(ITERATIONS + 1):
+        rng.shuffle(words)
+        yield " ".join(words[: rng.randint(len(words) // 2, len(words))])
+
+
+def legacy_convert_text_to_pdf(letter_content):
+    """The renderer before the cached module: new font setup on every call."""
+    pdf = FPDF()
+    pdf.add_page()
+
+    font_path = os.path.join("fonts", "DejaVuSans.ttf")
+    pdf.add_font("DejaVu", "", font_path, uni=True)
+    pdf.set_font("DejaVu", size=12)
+
+    for line in letter_content.split("\n"):
+        pdf.multi_cell(0, 10, line)
+
+    return pdf.output(dest="S").encode("latin1")
+
+
+def measure(render):
+    letters = list(sample_letters())
+    render(letters.pop())
+
+    timings = []
+    for letter in letters:
+        start = time.perf_counter()
+        render(letter)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    render(LETTER)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return statistics.median(timings), max(timings), peak / 1024
+
+
+def main():
+    print(f"{'renderer':<10} {'median ms':>10} {'max ms':>10} {'peak KiB':>10}")
+    for name, render in (
+        ("legacy", legacy_convert_text_to_pdf),
+        ("cached", convert_text_to_pdf),
+    ):
+        median, worst, peak = measure(render)
+        print(f"{name:<10} {median:>10.2f} {worst:>10.2f} {peak:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
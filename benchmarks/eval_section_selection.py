@@ -0,0 +1,85 @@
+"""
+Offline evaluation of CV section selection.
+
+For every CV/job description pair it compares the compacted CV with the
+sections selected for the job: prompt tokens saved and how many of the job
+terms found in the CV are still present after selection (term recall). Run
+from the repository root:
+
+    python -m benchmarks.eval_section_selection CV_DIR JOBS_DIR [--budget N]
+
+CV_DIR holds PDF files and JOBS_DIR plain-text job descriptions.
+"""
+
+import argparse
+import statistics
+from pathlib import Path
+from config import CV_SECTION_TOKEN_BUDGET
+from helpers.cv import extract_text_from_pdf
+from helpers.cv_sections import build_section_index, select_sections, tokenize
+from helpers.text_compaction import compact_cv_text, estimate_tokens
+
+
+def term_recall(job_text, full_text, selected_text):
+    """Share of the job terms present in the full CV that survive selection."""
+    job_terms = set(tokenize(job_text))
+    in_cv = job_terms & set(tokenize(full_text))
+    if not in_cv:
+        return 1.0
+    return len(in_cv & set(tokenize(selected_text))) / len(in_cv)
+
+
+def evaluate(cv_dir, jobs_dir, budget):
+    jobs = {path.name: path.read_text() for path in sorted(jobs_dir.glob("*.txt"))}
+    rows = []
+
+    for cv_path in sorted(cv_dir.glob("*.pdf")):
+        cv_text = extract_text_from_pdf(cv_path.read_bytes()).text
+        compacted = compact_cv_text(cv_text)
+        section_index = build_section_index(cv_text)
+
+        for job_name, job_text in jobs.items():
+            selected = select_sections(section_index, job_text, budget)
+            rows.append(
+                (
+                    cv_path.name,
+                    job_name,
+                    len(section_index["sections"]),
+                    estimate_tokens(compacted),
+                    estimate_tokens(selected),
+                    term_recall(job_text, compacted, selected),
+                )
+            )
+
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("cv_dir", type=Path)
+    parser.add_argument("jobs_dir", type=Path)
+    parser.add_argument("--budget", type=int, default=CV_SECTION_TOKEN_BUDGET)
+    args = parser.parse_args()
+
+    rows = evaluate(args.cv_dir, args.jobs_dir, args.budget)
+    if not rows:
+        print("No CV/job description pairs found")
+        return
+
+    print(
+        f"{'cv':<30} {'job':<30} {'sections':>8} {'full':>6} {'sel':>6} {'recall':>7}"
+    )
+    for cv_name, job_name, sections, full, selected, recall in rows:
+        print(
+            f"{cv_name[:30]:<30} {job_name[:30]:<30} {sections:>8} "
+            f"{full:>6} {selected:>6} {recall:>7.2f}"
+        )
+
+    saved = [1 - row[4] / row[3] for row in rows if row[3]]
+    print(f"\nbudget: {args.budget} tokens, pairs: {len(rows)}")
+    print(f"mean tokens saved: {statistics.mean(saved):.1%}")
+    print(f"mean term recall: {statistics.mean(row[5] for row in rows):.2f}")
+
+
+if __name__ == "__main__":
+    main()
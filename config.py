@@ -4,10 +4,24 @@ import os
 load_dotenv()
 
 URL_DATABASE = f"postgresql://{os.getenv('DB_USER')}:{os.getenv('DB_PASS')}@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
+ASYNC_URL_DATABASE = URL_DATABASE.replace("postgresql://", "postgresql+asyncpg://", 1)
+# Connection pool settings, per engine and process
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", 15000))
+# Startup readiness check: attempts and seconds between them
+DB_STARTUP_RETRIES = int(os.getenv("DB_STARTUP_RETRIES", 5))
+DB_STARTUP_RETRY_DELAY = float(os.getenv("DB_STARTUP_RETRY_DELAY", 2))
+# SQL logging: "false" (default), "true" for statements, "debug" to add result rows
+DB_ECHO = {"true": True, "debug": "debug"}.get(os.getenv("DB_ECHO", "").lower(), False)
 REDIS_URL = f"redis://{os.getenv('REDIS_HOST')}:{os.getenv('REDIS_PORT')}/{os.getenv('REDIS_DB')}"
 BASE_DOMAIN = os.getenv("BASE_DOMAIN") or "http://127.0.0.1:8000"
 JWT_SECRET = os.getenv("JWT_SECRET")
 JWT_ALGORITHM = os.getenv("JWT_ALGORITHM")
+# bcrypt cost factor; hashes with another cost are upgraded on the next login
 BCRYPT_SALT = 8
 SMTP_USER = os.getenv("SMTP_USER")
 SMTP_PASS = os.getenv("SMTP_PASS")
@@ -19,6 +33,9 @@ ACCOUNT_CONFIRMATION_TOKEN = 3600
 JWT_REFRESH_EXPIRE = 86400
 JWT_ACCESS_TOKEN = 900
 RESET_PASSWORD_TOKEN = 3600
+# Where one-time verification and reset tokens live: "redis" (falls back to
+# the database while Redis is unavailable) or "database"
+TOKEN_STORE_BACKEND = os.getenv("TOKEN_STORE_BACKEND", "redis")
 # RATE LIMITS
 RATE_LIMIT_REGISTER = "10/hour"
 RATE_LIMIT_VERIFY = "10/hour"
@@ -28,12 +45,34 @@ RATE_LIMIT_REFRESH_TOKEN = "200/hour"
 RATE_LIMIT_FORGOT_PASSWORD = "10/hour"
 RATE_LIMIT_RESET_PASSWORD = "10/hour"
 RATE_LIMIT_UPLOAD_CV = "5/hour"
+RATE_LIMIT_COMPLETE_UPLOAD_CV = "10/hour"
 RATE_LIMIT_GENERATE_LETTER = "5/hour"
+RATE_LIMIT_GENERATE_LETTER_BATCH = "2/hour"
+RATE_LIMIT_GET_LETTER = "60/hour"
+RATE_LIMIT_GET_LETTER_JOB = "600/hour"
 
 
 # CV FILE LIMITS
 MAX_FILE_SIZE_MB = 5
 ALLOWED_MIME_TYPES = ["application/pdf"]
+# Direct browser uploads: presigned POST lifetime and bytes sniffed on completion
+CV_UPLOAD_URL_EXPIRE = 600
+# Uploads through the API are read and validated in chunks of this size
+UPLOAD_CHUNK_SIZE = 64 * 1024
+CV_SNIFF_BYTES = 2048
+# GET /cvs page size: default and upper bound for ?limit
+CV_PAGE_SIZE = 20
+CV_PAGE_MAX_SIZE = 100
+# Bump when extraction changes so stored CV texts are re-extracted lazily
+CV_TEXT_EXTRACTION_VERSION = 5
+# Extraction budget: stop after this many pages, characters or seconds
+CV_MAX_PAGES = 20
+CV_MAX_CHARS = 30000
+CV_EXTRACTION_TIMEOUT = 10
+# Upper bound for the compacted CV text sent to the model (~4 chars per token)
+CV_PROMPT_MAX_TOKENS = 4000
+# Token budget for the CV sections selected against a job description
+CV_SECTION_TOKEN_BUDGET = int(os.getenv("CV_SECTION_TOKEN_BUDGET", 1500))
 
 
 # S3 BUCKET
@@ -41,6 +80,54 @@ AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
 AWS_REGION = os.getenv("AWS_REGION")
 S3_BUCKET_NAME = os.getenv("S3_BUCKET_NAME")
+S3_MAX_POOL_CONNECTIONS = int(os.getenv("S3_MAX_POOL_CONNECTIONS", 50))
+S3_RETRY_MODE = os.getenv("S3_RETRY_MODE", "adaptive")
+S3_MAX_ATTEMPTS = int(os.getenv("S3_MAX_ATTEMPTS", 3))
+S3_CONNECT_TIMEOUT = float(os.getenv("S3_CONNECT_TIMEOUT", 2))
+S3_READ_TIMEOUT = float(os.getenv("S3_READ_TIMEOUT", 10))
+STORAGE_CHUNK_SIZE = 64 * 1024
+STORAGE_MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+# Local read-through cache of CV PDFs; 0 disables it
+CV_CACHE_DIR = os.getenv("CV_CACHE_DIR", "/tmp/cv_cache")
+CV_CACHE_MAX_BYTES = int(os.getenv("CV_CACHE_MAX_BYTES", 512 * 1024 * 1024))
 
 # OPENAI
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+OPENAI_LETTER_MODEL = "gpt-4o"
+
+# AUTHENTICATED USER CACHE (seconds); local entries expire sooner so
+# invalidations from other processes are picked up quickly
+USER_CACHE_TTL = 300
+USER_CACHE_LOCAL_TTL = 10
+USER_CACHE_LOCAL_MAX_ENTRIES = 10000
+
+# LETTERS
+LETTER_PDF_TTL = 3600
+LETTER_CACHE_TTL = 7 * 86400
+LETTER_CACHE_MAX_ENTRIES = 10000
+LETTER_CACHE_MAX_PDF_BYTES = 512 * 1024
+LETTER_BATCH_MAX_JOBS = 50
+LETTER_BATCH_CONCURRENCY = 5
+LETTER_FONT_PATH = os.path.join("fonts", "DejaVuSans.ttf")
+LETTER_FONT_SIZE = 12
+LETTER_LINE_HEIGHT = 10
+PDF_FONT_SUBSET_CACHE_SIZE = 64
+
+# PDF PROCESS POOL
+# Workers per app process: every uvicorn/gunicorn worker starts its own pool,
+# so keep PDF_POOL_SIZE * app workers at or below the CPU count.
+# 0 disables the pool and runs PDF work in the threadpool
+PDF_POOL_SIZE = int(os.getenv("PDF_POOL_SIZE", 2))
+PDF_TASK_TIMEOUT = 30
+
+# PASSWORD HASHING POOL
+# bcrypt releases the GIL, so a small thread pool hashes in parallel; logins
+# beyond BCRYPT_MAX_PENDING waiting calls are rejected with 503
+BCRYPT_POOL_SIZE = int(os.getenv("BCRYPT_POOL_SIZE", os.cpu_count() or 1))
+BCRYPT_MAX_PENDING = int(os.getenv("BCRYPT_MAX_PENDING") or 64)
+
+# LETTER JOBS
+LETTER_JOB_TTL = 86400
+LETTER_JOB_MAX_ATTEMPTS = 3
+LETTER_WORKER_CONCURRENCY = int(os.getenv("LETTER_WORKER_CONCURRENCY") or 8)
+LETTER_WORKER_ID = os.getenv("LETTER_WORKER_ID") or os.getenv("HOSTNAME") or "worker"
@@ -1,26 +1,94 @@
-from sqlmodel import SQLModel, Session, create_engine
+import asyncio
+from sqlalchemy import text
+from sqlmodel import SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from fastapi import Depends
 from typing import Annotated
-from config import URL_DATABASE
+from config import (
+    URL_DATABASE,
+    ASYNC_URL_DATABASE,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+    DB_STATEMENT_TIMEOUT_MS,
+    DB_ECHO,
+    DB_STARTUP_RETRIES,
+    DB_STARTUP_RETRY_DELAY,
+)
+from helpers.db_pool import (
+    InstrumentedQueuePool,
+    InstrumentedAsyncAdaptedQueuePool,
+    instrument_engine,
+)
 
+ENGINE_OPTIONS = {
+    "echo": DB_ECHO,
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_timeout": DB_POOL_TIMEOUT,
+    "pool_recycle": DB_POOL_RECYCLE,
+    "pool_pre_ping": DB_POOL_PRE_PING,
+}
+
+# Sync engine for schema management, scripts and test fixtures
 engine = create_engine(
     URL_DATABASE,
-    echo=True,
+    poolclass=InstrumentedQueuePool,
+    connect_args={"options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"},
+    **ENGINE_OPTIONS,
+)
+
+# Async engine used by the app and the worker
+async_engine = create_async_engine(
+    ASYNC_URL_DATABASE,
+    poolclass=InstrumentedAsyncAdaptedQueuePool,
+    connect_args={
+        "server_settings": {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}
+    },
+    **ENGINE_OPTIONS,
+)
+
+instrument_engine(engine, "sync")
+instrument_engine(async_engine.sync_engine, "async")
+
+async_session_maker = async_sessionmaker(
+    async_engine, class_=AsyncSession, expire_on_commit=False
 )
 
 
 def create_db_and_tables():
-    """Creates tables in the chosen database."""
+    """
+    Creates tables in the chosen database. Only used by tests: the schema is
+    managed with Alembic migrations (alembic upgrade head).
+    """
     SQLModel.metadata.create_all(engine)
 
 
-create_db_and_tables()
+async def check_database():
+    """Runs a trivial query, raising if the database is unreachable."""
+    async with async_engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+
+async def wait_for_database(retries=DB_STARTUP_RETRIES, delay=DB_STARTUP_RETRY_DELAY):
+    """Startup readiness check: retries check_database before giving up."""
+    for attempt in range(1, retries + 1):
+        try:
+            await check_database()
+            return
+        except Exception:
+            if attempt == retries:
+                raise
+            await asyncio.sleep(delay)
 
 
-def get_session():
-    """Yields a session from the selected database engine."""
-    with Session(engine) as session:
+async def get_session():
+    """Yields an async session from the selected database engine."""
+    async with async_session_maker() as session:
         yield session
 
 
-SessionDep = Annotated[Session, Depends(get_session)]
+SessionDep = Annotated[AsyncSession, Depends(get_session)]
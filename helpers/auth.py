@@ -32,6 +32,14 @@ def compare_password(input_password, user_db_password):
     return bcrypt.checkpw(input_password.encode(), user_db_password.encode())
 
 
+def password_needs_rehash(password_hash):
+    """Returns True if the bcrypt hash was made with a cost other than BCRYPT_SALT."""
+    try:
+        return int(password_hash.split("$")[2]) != BCRYPT_SALT
+    except (IndexError, ValueError):
+        return True
+
+
 def sign_jwt(data: dict, expires_in: int = 3600):
     """
     Generates a JSON Web Token (JWT) for the given data with an expiration time.
@@ -1,34 +1,75 @@
-from fastapi import HTTPException
-import io
+from typing import NamedTuple
 import fitz
-from fpdf import FPDF
-import os
+import time
+from config import CV_MAX_PAGES, CV_MAX_CHARS, CV_EXTRACTION_TIMEOUT
+from helpers.pdf_renderer import get_pdf_renderer
+import zlib
 
 
-def get_user_cv_by_id(user, cv_id):
-    selected_cv = next((cv for cv in user.cvs if cv.id == cv_id), None)
-    if selected_cv is None:
-        raise HTTPException(status_code=404, detail="CV not found")
-    return selected_cv
+# Separates pages in extracted text so page furniture can be detected later
+PAGE_SEPARATOR = "\f"
 
 
-def extract_text_from_pdf(binary_pdf):
-    pdf_stream = io.BytesIO(binary_pdf)
-    doc = fitz.open(stream=pdf_stream, filetype="pdf")
-    return "".join([page.get_text() for page in doc])
+class ExtractionResult(NamedTuple):
+    text: str
+    pages_processed: int
+    page_count: int
+    truncated: bool
 
 
-def convert_text_to_pdf(letter_content):
-    pdf = FPDF()
-    pdf.add_page()
+def iter_pdf_pages(doc, max_pages, deadline):
+    """Yields page texts one by one until `max_pages` or the monotonic `deadline`."""
+    for page_number in range(min(doc.page_count, max_pages)):
+        if time.monotonic() > deadline:
+            return
+        yield doc.load_page(page_number).get_text()
+
+
+def extract_text_from_pdf(
+    binary_pdf,
+    max_pages=CV_MAX_PAGES,
+    max_chars=CV_MAX_CHARS,
+    timeout=CV_EXTRACTION_TIMEOUT,
+):
+    """
+    Extracts text page by page within a page, character and wall-clock budget.
+
+    The timeout is checked between pages; a single pathological page is
+    bounded by the process pool's task timeout instead.
+    """
+    deadline = time.monotonic() + timeout
+    pages = []
+    chars = 0
+    truncated = False
+
+    with fitz.open(stream=binary_pdf, filetype="pdf") as doc:
+        page_count = doc.page_count
+
+        for text in iter_pdf_pages(doc, max_pages, deadline):
+            remaining = max_chars - chars
+            if len(text) > remaining:
+                pages.append(text[:remaining])
+                truncated = True
+                break
 
-    font_path = os.path.join("fonts", "DejaVuSans.ttf")
-    pdf.add_font("DejaVu", "", font_path, uni=True)
-    pdf.set_font("DejaVu", size=12)
+            pages.append(text)
+            chars += len(text)
 
-    for line in letter_content.split("\n"):
-        pdf.multi_cell(0, 10, line)
+    return ExtractionResult(
+        text=PAGE_SEPARATOR.join(pages),
+        pages_processed=len(pages),
+        page_count=page_count,
+        truncated=truncated or len(pages) < page_count,
+    )
 
-    pdf_bytes = pdf.output(dest="S").encode("latin1")
 
-    return pdf_bytes
+def compress_text(text):
+    return zlib.compress(text.encode("utf-8"))
+
+
+def decompress_text(data):
+    return zlib.decompress(data).decode("utf-8")
+
+
+def convert_text_to_pdf(letter_content):
+    return get_pdf_renderer().render(letter_content)
@@ -0,0 +1,201 @@
+import math
+import re
+from collections import Counter
+from config import CV_PROMPT_MAX_TOKENS
+from helpers.text_compaction import (
+    compact_cv_text,
+    estimate_tokens,
+    truncate_to_tokens,
+)
+
+BM25_K1 = 1.5
+BM25_B = 0.75
+# Longer sections (e.g. a CV without recognised headings) are split into
+# chunks of whole lines so they can be ranked and selected separately
+SECTION_MAX_TOKENS = 400
+
+HEADING_WORDS = {
+    "about",
+    "achievements",
+    "awards",
+    "certificates",
+    "certifications",
+    "courses",
+    "education",
+    "employment",
+    "experience",
+    "history",
+    "hobbies",
+    "interests",
+    "languages",
+    "objective",
+    "profile",
+    "projects",
+    "publications",
+    "qualifications",
+    "references",
+    "skills",
+    "summary",
+    "technologies",
+    "training",
+    "volunteering",
+}
+STOP_WORDS = {
+    "a",
+    "an",
+    "and",
+    "are",
+    "as",
+    "at",
+    "be",
+    "by",
+    "for",
+    "from",
+    "in",
+    "is",
+    "of",
+    "on",
+    "or",
+    "our",
+    "the",
+    "to",
+    "we",
+    "will",
+    "with",
+    "you",
+    "your",
+}
+TOKEN_RE = re.compile(r"[^\W_][\w+#.]*")
+
+
+def tokenize(text):
+    return [
+        token.rstrip(".")
+        for token in TOKEN_RE.findall(text.casefold())
+        if token not in STOP_WORDS
+    ]
+
+
+def is_heading(line):
+    """Short line that is upper case or made of typical CV heading words."""
+    words = line.rstrip(":").split()
+    if not words or len(words) > 4 or len(line) > 40 or line.endswith("."):
+        return False
+    if line.isupper():
+        return True
+    return any(word.strip("&/").casefold() in HEADING_WORDS for word in words)
+
+
+def split_sections(text):
+    """Splits compacted CV text into sections that start at heading lines."""
+    sections = []
+    current = []
+    for line in text.split("\n"):
+        if current and is_heading(line):
+            sections.append("\n".join(current).strip())
+            current = []
+        current.append(line)
+    sections.append("\n".join(current).strip())
+    return [section for section in sections if section]
+
+
+def chunk_section(section, max_tokens=SECTION_MAX_TOKENS):
+    """
+    Splits a section over `max_tokens` into chunks of whole lines, ending a
+    chunk early at a paragraph break once it is half full.
+    """
+    if estimate_tokens(section) <= max_tokens:
+        return [section]
+
+    chunks = []
+    current = []
+    size = 0
+    for line in section.split("\n"):
+        line_tokens = estimate_tokens(line) + 1
+        paragraph_break = not line and size >= max_tokens // 2
+        if current and (size + line_tokens > max_tokens or paragraph_break):
+            chunks.append("\n".join(current).strip())
+            current = []
+            size = 0
+        current.append(line)
+        size += line_tokens
+    chunks.append("\n".join(current).strip())
+    return [chunk for chunk in chunks if chunk]
+
+
+def build_section_index(cv_text):
+    """
+    Builds a small, JSON-serializable BM25 index over the CV's sections. It is
+    computed once per CV and stored next to the extracted text.
+    """
+    sections = [
+        chunk
+        for section in split_sections(compact_cv_text(cv_text, max_tokens=None))
+        for chunk in chunk_section(section)
+    ]
+    entries = []
+    for section in sections:
+        tokens = tokenize(section)
+        entries.append(
+            {
+                "text": section,
+                "tokens": estimate_tokens(section),
+                "length": len(tokens),
+                "tf": dict(Counter(tokens)),
+            }
+        )
+
+    document_frequency = Counter(term for entry in entries for term in entry["tf"])
+    return {
+        "sections": entries,
+        "df": dict(document_frequency),
+        "avgdl": sum(entry["length"] for entry in entries) / max(len(entries), 1),
+    }
+
+
+def score_sections(index, query):
+    """BM25 score of every section against the query, in section order."""
+    sections = index["sections"]
+    total = len(sections)
+    avgdl = index["avgdl"] or 1
+    terms = set(tokenize(query))
+
+    scores = []
+    for section in sections:
+        score = 0.0
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * section["length"] / avgdl)
+        for term in terms:
+            tf = section["tf"].get(term)
+            if not tf:
+                continue
+            df = index["df"][term]
+            idf = math.log((total - df + 0.5) / (df + 0.5) + 1)
+            score += idf * tf * (BM25_K1 + 1) / (tf + norm)
+        scores.append(score)
+    return scores
+
+
+def select_sections(index, job_text, max_tokens):
+    """
+    Returns the CV text made of the sections most relevant to `job_text` that
+    fit in `max_tokens`. The first section (name, contact, summary) is always
+    kept and the original section order is preserved. The result never exceeds
+    `max_tokens` or CV_PROMPT_MAX_TOKENS.
+    """
+    sections = index["sections"]
+    if not sections:
+        return ""
+
+    max_tokens = min(max_tokens, CV_PROMPT_MAX_TOKENS)
+    scores = score_sections(index, job_text)
+    ranked = sorted(range(1, len(sections)), key=lambda i: scores[i], reverse=True)
+
+    selected = {0}
+    used = sections[0]["tokens"]
+    for position in ranked:
+        if used + sections[position]["tokens"] <= max_tokens:
+            selected.add(position)
+            used += sections[position]["tokens"]
+
+    text = "\n\n".join(sections[position]["text"] for position in sorted(selected))
+    return truncate_to_tokens(text, max_tokens)
@@ -1,13 +1,152 @@
-from sqlmodel import select
-from models.user import User
+import json
+from sqlmodel import select, func, tuple_
+from models.user import User, UserCV, UserCVText, CvObject
 from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+from helpers.cv import compress_text, decompress_text
+from helpers.cv_sections import build_section_index
+from config import CV_TEXT_EXTRACTION_VERSION
 
 
-def get_user_by_email(session, user_email):
+async def get_user_by_email(session, user_email):
     statement = select(User).where(User.email == user_email)
-    db_user = session.exec(statement).first()
+    db_user = (await session.exec(statement)).first()
 
     if db_user is None:
         raise HTTPException(status_code=404, detail="User not found")
 
     return db_user
+
+
+async def get_user_cv(session, user_id, cv_id):
+    """Returns the CV if it belongs to `user_id`, otherwise None."""
+    statement = select(UserCV).where(UserCV.user_id == user_id, UserCV.id == cv_id)
+    return (await session.exec(statement)).first()
+
+
+async def get_user_cvs(session, user_id, limit=None, order="asc", after=None):
+    """
+    Returns the id, name and upload time of the CVs owned by `user_id`, ordered
+    by (created_at, id). `after` is the (created_at, id) key of the last row of
+    the previous page.
+    """
+    key = tuple_(UserCV.created_at, UserCV.id)
+    statement = select(UserCV.id, UserCV.original_name, UserCV.created_at).where(
+        UserCV.user_id == user_id
+    )
+
+    if order == "desc":
+        if after is not None:
+            statement = statement.where(key < tuple_(*after))
+        statement = statement.order_by(UserCV.created_at.desc(), UserCV.id.desc())
+    else:
+        if after is not None:
+            statement = statement.where(key > tuple_(*after))
+        statement = statement.order_by(UserCV.created_at, UserCV.id)
+
+    if limit is not None:
+        statement = statement.limit(limit)
+
+    return [row._asdict() for row in (await session.exec(statement)).all()]
+
+
+async def get_user_cvs_version(session, user_id):
+    """
+    Returns (count, latest created_at) of the user's CVs. CVs are never updated
+    in place, so any upload or deletion changes it.
+    """
+    statement = select(func.count(), func.max(UserCV.created_at)).where(
+        UserCV.user_id == user_id
+    )
+    return tuple((await session.exec(statement)).one())
+
+
+async def get_current_cv_text(session, cv_id):
+    cv_text = await session.get(UserCVText, cv_id)
+
+    if cv_text is None or cv_text.extraction_version != CV_TEXT_EXTRACTION_VERSION:
+        return None
+
+    return cv_text
+
+
+async def get_cv_text(session, cv_id):
+    """Returns the stored CV text, or None if missing or extracted by an older version."""
+    cv_text = await get_current_cv_text(session, cv_id)
+    return decompress_text(cv_text.content) if cv_text else None
+
+
+async def get_cv_section_index(session, cv_id):
+    """Returns the stored section index of a CV, or None if it is not available."""
+    cv_text = await get_current_cv_text(session, cv_id)
+
+    if cv_text is None or cv_text.sections_index is None:
+        return None
+
+    return json.loads(decompress_text(cv_text.sections_index))
+
+
+async def save_cv_text(session, cv_id, text):
+    """Stores the extracted text of a CV together with its section index."""
+    section_index = await run_in_threadpool(build_section_index, text)
+    cv_text = UserCVText(
+        cv_id=cv_id,
+        content=compress_text(text),
+        sections_index=compress_text(json.dumps(section_index)),
+        extraction_version=CV_TEXT_EXTRACTION_VERSION,
+    )
+    await session.merge(cv_text)
+    await session.commit()
+
+
+async def get_cv_object_by_hash(session, sha256):
+    """Returns the stored CV file with this content hash, locked for update."""
+    statement = select(CvObject).where(CvObject.sha256 == sha256).with_for_update()
+    return (await session.exec(statement)).first()
+
+
+async def release_cv_object(session, s3_key):
+    """
+    Drops one reference to a stored CV file. Returns True when nothing refers
+    to it anymore and the S3 object can be deleted. Files uploaded before
+    deduplication have no CvObject and belong to a single CV.
+    """
+    statement = select(CvObject).where(CvObject.s3_key == s3_key).with_for_update()
+    cv_object = (await session.exec(statement)).first()
+
+    if cv_object is None:
+        return True
+
+    cv_object.ref_count -= 1
+    if cv_object.ref_count > 0:
+        session.add(cv_object)
+        return False
+
+    await session.delete(cv_object)
+    return True
+
+
+async def copy_cv_text(session, s3_key, cv_id):
+    """Reuses text already extracted from the same CV file. Returns False if none."""
+    statement = (
+        select(UserCVText)
+        .join(UserCV, UserCV.id == UserCVText.cv_id)
+        .where(
+            UserCV.s3_key == s3_key,
+            UserCVText.extraction_version == CV_TEXT_EXTRACTION_VERSION,
+        )
+    )
+    source = (await session.exec(statement)).first()
+
+    if source is None:
+        return False
+
+    session.add(
+        UserCVText(
+            cv_id=cv_id,
+            content=source.content,
+            sections_index=source.sections_index,
+            extraction_version=source.extraction_version,
+        )
+    )
+    return True
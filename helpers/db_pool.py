@@ -0,0 +1,58 @@
+import time
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+from helpers.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_OVERFLOW,
+    DB_POOL_CHECKOUT_WAIT,
+    DB_QUERY_DURATION,
+)
+
+
+class CheckoutTimingMixin:
+    """Records how long each checkout waits for a connection."""
+
+    metrics_label = "sync"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.labels(engine=self.metrics_label).observe(
+                time.perf_counter() - start
+            )
+
+
+class InstrumentedQueuePool(CheckoutTimingMixin, QueuePool):
+    metrics_label = "sync"
+
+
+class InstrumentedAsyncAdaptedQueuePool(CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    metrics_label = "async"
+
+
+def instrument_engine(engine, label):
+    """Exports pool usage and query durations of a (sync) engine to Prometheus."""
+
+    # Read from the pool at scrape time; engine.pool is replaced on dispose()
+    DB_POOL_CHECKED_OUT.labels(engine=label).set_function(
+        lambda: engine.pool.checkedout()
+    )
+    DB_POOL_OVERFLOW.labels(engine=label).set_function(lambda: engine.pool.overflow())
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def stop_query_timer(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info["query_start"].pop()
+        DB_QUERY_DURATION.labels(engine=label).observe(time.perf_counter() - start)
+
+    @event.listens_for(engine, "handle_error")
+    def drop_query_timer(context):
+        if context.connection is not None:
+            timers = context.connection.info.get("query_start")
+            if timers:
+                timers.pop()
@@ -0,0 +1,149 @@
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from helpers.metrics import CV_CACHE_REQUESTS, CV_CACHE_EVICTIONS
+
+# Temporary files left by a crashed process are removed after this many seconds;
+# younger ones may still be written by another worker sharing the directory
+TEMP_FILE_MAX_AGE = 3600
+
+
+def remove_file(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class DiskLRUCache:
+    """
+    Bounded on-disk LRU cache of immutable blobs.
+
+    Entries are written to a temporary file and atomically renamed into
+    place, so readers never see partial files. Reads return the whole entry
+    as bytes with a single read. The LRU index lives in memory and is rebuilt
+    from file mtimes on first use; an entry removed by another process is
+    treated as a miss. Several processes may share the directory: each writes
+    temporary files under its own pid prefix and only removes its own, or
+    stale ones.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.loaded = False
+        self.lock = threading.Lock()
+
+    @property
+    def temp_prefix(self):
+        return f".tmp-{os.getpid()}-"
+
+    def path(self, key):
+        return os.path.join(self.directory, hashlib.sha256(key.encode()).hexdigest())
+
+    def load(self):
+        os.makedirs(self.directory, exist_ok=True)
+
+        files = []
+        now = time.time()
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                if entry.name.startswith("."):
+                    if (
+                        entry.name.startswith(self.temp_prefix)
+                        or now - stat.st_mtime > TEMP_FILE_MAX_AGE
+                    ):
+                        remove_file(entry.path)
+                    continue
+                files.append((stat.st_mtime, entry.path, stat.st_size))
+
+        for _, path, size in sorted(files):
+            self.entries[path] = size
+            self.size += size
+        self.loaded = True
+        self.evict()
+
+    def ensure_loaded(self):
+        if not self.loaded:
+            self.load()
+
+    def get(self, key):
+        path = self.path(key)
+
+        with self.lock:
+            self.ensure_loaded()
+            if path in self.entries:
+                self.entries.move_to_end(path)
+
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            with self.lock:
+                self.forget(path)
+            CV_CACHE_REQUESTS.labels(result="miss").inc()
+            return None
+
+        CV_CACHE_REQUESTS.labels(result="hit").inc()
+        return data
+
+    def put(self, key, data):
+        self.put_file(key, io.BytesIO(data))
+
+    def put_file(self, key, fileobj):
+        """Copies a file object into the cache without loading it into memory."""
+        path = self.path(key)
+        with self.lock:
+            self.ensure_loaded()
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=self.temp_prefix)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                shutil.copyfileobj(fileobj, file)
+                size = file.tell()
+
+            if not size or size > self.max_bytes:
+                remove_file(tmp_path)
+                return
+
+            os.replace(tmp_path, path)
+        except BaseException:
+            remove_file(tmp_path)
+            raise
+
+        with self.lock:
+            self.forget(path)
+            self.entries[path] = size
+            self.size += size
+            self.evict()
+
+    def delete(self, key):
+        path = self.path(key)
+
+        with self.lock:
+            self.forget(path)
+
+        remove_file(path)
+
+    def forget(self, path):
+        size = self.entries.pop(path, None)
+        if size is not None:
+            self.size -= size
+
+    def evict(self):
+        while self.size > self.max_bytes and self.entries:
+            path, size = self.entries.popitem(last=False)
+            self.size -= size
+            remove_file(path)
+            CV_CACHE_EVICTIONS.inc()
@@ -0,0 +1,75 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+PDF_POOL_PENDING_TASKS = Gauge(
+    "pdf_pool_pending_tasks",
+    "PDF tasks submitted to the process pool that have not finished yet.",
+)
+PDF_POOL_TASK_DURATION = Histogram(
+    "pdf_pool_task_duration_seconds",
+    "Time from submitting a PDF task to the process pool until it finishes.",
+    ["task"],
+)
+CV_PROMPT_TOKENS = Histogram(
+    "cv_prompt_tokens",
+    "Estimated tokens of CV text per letter, before and after compaction.",
+    ["stage"],
+    buckets=(250, 500, 1000, 2000, 3000, 4000, 6000, 8000, 12000),
+)
+S3_REQUEST_DURATION = Histogram(
+    "s3_request_duration_seconds",
+    "Duration of S3 calls, including botocore retries.",
+    ["operation"],
+)
+S3_REQUEST_ERRORS = Counter(
+    "s3_request_errors_total",
+    "S3 calls that raised an error.",
+    ["operation"],
+)
+CV_CACHE_REQUESTS = Counter(
+    "cv_cache_requests_total",
+    "Lookups in the local CV PDF disk cache.",
+    ["result"],
+)
+CV_CACHE_EVICTIONS = Counter(
+    "cv_cache_evictions_total",
+    "CV PDFs evicted from the local disk cache to stay under its byte cap.",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Database connections currently checked out of the pool.",
+    ["engine"],
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "Connections open beyond pool_size (negative while the pool is not full).",
+    ["engine"],
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection from the pool, including connecting.",
+    ["engine"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Duration of SQL statements executed by the application.",
+    ["engine"],
+)
+PASSWORD_HASH_PENDING = Gauge(
+    "password_hash_pending",
+    "bcrypt calls waiting for or running on the password hashing pool.",
+)
+PASSWORD_HASH_QUEUE_WAIT = Histogram(
+    "password_hash_queue_wait_seconds",
+    "Time a bcrypt call waits for a free password hashing worker.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "Duration of bcrypt calls on the password hashing pool.",
+    ["operation"],
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "bcrypt calls rejected because too many were already pending.",
+)
@@ -0,0 +1,44 @@
+import base64
+import hashlib
+import json
+import uuid
+from datetime import datetime
+from fastapi import HTTPException
+
+
+def encode_cursor(created_at, id):
+    """Encodes the (created_at, id) key of a row as an opaque page cursor."""
+    payload = json.dumps([created_at.isoformat(), str(id)]).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(id, str):
+            raise TypeError("cursor id is not a string")
+        created_at = datetime.fromisoformat(created_at)
+        # created_at columns are naive UTC; encode_cursor never adds an offset
+        if created_at.tzinfo is not None:
+            raise ValueError("cursor timestamp has a time zone")
+        return created_at, uuid.UUID(id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def weak_etag(*parts):
+    digest = hashlib.sha1(":".join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest[:20]}"'
+
+
+def etag_matches(if_none_match, etag):
+    """Weak comparison of an If-None-Match header against `etag`."""
+    if not if_none_match:
+        return False
+
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or any(
+        candidate.removeprefix("W/") == etag.removeprefix("W/")
+        for candidate in candidates
+    )
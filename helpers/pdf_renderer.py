@@ -0,0 +1,125 @@
+import types
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from fpdf import FPDF
+from fpdf.ttfonts import TTFontFile
+from config import (
+    LETTER_FONT_PATH,
+    LETTER_FONT_SIZE,
+    LETTER_LINE_HEIGHT,
+    PDF_FONT_SUBSET_CACHE_SIZE,
+)
+
+FONT_FAMILY = "DejaVu"
+FONT_KEY = "dejavu"
+
+# Printable ASCII, Latin-1 and Latin Extended-A (covers Polish and most
+# European letters). Seeding every document's font subset with them makes
+# the subset, and therefore the embedded font program, identical across
+# almost all letters so it can be served from the subset cache.
+PRELOADED_CODEPOINTS = frozenset(range(32, 127)) | frozenset(range(160, 384))
+
+
+class CachedTTFontFile(TTFontFile):
+    """
+    TTFontFile whose font subsetting is memoized per (font file, glyph set).
+
+    Subsetting re-parses the whole TTF and dominates FPDF render time, while
+    its output depends only on the file and the code points used.
+    """
+
+    subsets = OrderedDict()
+    lock = Lock()
+
+    def makeSubset(self, file, subset):
+        key = (file, frozenset(subset))
+
+        with self.lock:
+            cached = self.subsets.get(key)
+            if cached is not None:
+                self.subsets.move_to_end(key)
+
+        if cached is not None:
+            stream, self.codeToGlyph, self.maxUni = cached
+            return stream
+
+        stream = super().makeSubset(file, subset)
+
+        with self.lock:
+            self.subsets[key] = (stream, self.codeToGlyph, self.maxUni)
+            if len(self.subsets) > PDF_FONT_SUBSET_CACHE_SIZE:
+                self.subsets.popitem(last=False)
+
+        return stream
+
+
+def with_globals(function, **overrides):
+    """Copy of `function` that resolves the given module globals to `overrides`."""
+    return types.FunctionType(
+        function.__code__,
+        {**function.__globals__, **overrides},
+        function.__name__,
+        function.__defaults__,
+        function.__closure__,
+    )
+
+
+class CachedFontFPDF(FPDF):
+    """
+    FPDF that embeds TrueType fonts through CachedTTFontFile.
+
+    FPDF looks TTFontFile up as a module global in `_putfonts`, so only this
+    subclass gets a copy of it bound to the cached class; plain FPDF
+    documents elsewhere keep the stock TTFontFile.
+    """
+
+    _putfonts = with_globals(FPDF._putfonts, TTFontFile=CachedTTFontFile)
+
+
+class PdfRenderer:
+    """
+    Renders letters to PDF with font metrics parsed once per process.
+
+    The TTF metrics and font registration are built on a template document
+    at construction. Each render copies that registration into a fresh
+    document and lays the text out with a single `multi_cell` call.
+    """
+
+    def __init__(
+        self,
+        font_path=LETTER_FONT_PATH,
+        font_size=LETTER_FONT_SIZE,
+        line_height=LETTER_LINE_HEIGHT,
+    ):
+        template = FPDF()
+        template.add_font(FONT_FAMILY, "", font_path, uni=True)
+
+        self.font = template.fonts[FONT_KEY]
+        self.font_files = template.font_files
+        self.base_subset = sorted(set(self.font["subset"]) | PRELOADED_CODEPOINTS)
+        self.font_size = font_size
+        self.line_height = line_height
+
+    def new_document(self):
+        pdf = CachedFontFPDF()
+        # `cw` and the other metrics are shared read-only; `subset` is
+        # filled per document so it gets its own list.
+        pdf.fonts[FONT_KEY] = {**self.font, "subset": list(self.base_subset)}
+        pdf.font_files.update(self.font_files)
+        pdf.add_page()
+        pdf.set_font(FONT_FAMILY, size=self.font_size)
+        return pdf
+
+    def render(self, text):
+        pdf = self.new_document()
+        pdf.multi_cell(0, self.line_height, text)
+        # FPDF 1.7 builds the document as a latin1-mapped str, so this single
+        # encode is the only conversion to bytes.
+        return pdf.output(dest="S").encode("latin1")
+
+
+@lru_cache(maxsize=None)
+def get_pdf_renderer():
+    """Returns the process-wide renderer, created on first use."""
+    return PdfRenderer()
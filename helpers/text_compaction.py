@@ -0,0 +1,105 @@
+import math
+import re
+import unicodedata
+from collections import Counter
+from config import CV_PROMPT_MAX_TOKENS
+from helpers.cv import PAGE_SEPARATOR
+
+CHARS_PER_TOKEN = 4
+# How many lines at the top and bottom of a page can be headers or footers
+FURNITURE_LINES = 2
+
+BULLET_RE = re.compile(r"^[•●▪■◦‣∙·○◆◇►▶➢✓✔*]+\s*")
+HYPHENATED_BREAK_RE = re.compile(r"(?<=[^\W\d_])-\n\s*(?=[^\W\d_A-Z])")
+INLINE_WHITESPACE_RE = re.compile(r"[^\S\n]+")
+PAGE_NUMBER_RE = re.compile(r"^(page\s*)?\d+(\s*(/|of)\s*\d+)?$", re.IGNORECASE)
+DIGITS_RE = re.compile(r"\d+")
+
+
+def estimate_tokens(text):
+    """Cheap, model-agnostic token estimate (~4 characters per token)."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def furniture_key(line):
+    """Normalizes a line so 'Page 1 of 3' and 'Page 2 of 3' compare equal."""
+    return DIGITS_RE.sub("#", line.casefold())
+
+
+def page_edges(lines):
+    """Indexes of the first and last non-empty lines of a page."""
+    filled = [index for index, line in enumerate(lines) if line]
+    return set(filled[:FURNITURE_LINES] + filled[-FURNITURE_LINES:])
+
+
+def drop_page_furniture(pages):
+    """
+    Removes headers, footers and page numbers: lines at the top or bottom of
+    a page that repeat at the edges of at least half of the pages. The first
+    occurrence is kept, since a running header usually carries the name.
+    """
+    page_lines = [page.split("\n") for page in pages]
+    edge_counts = Counter()
+    for lines in page_lines:
+        edge_counts.update({furniture_key(lines[index]) for index in page_edges(lines)})
+
+    min_repeats = max(2, math.ceil(len(pages) / 2))
+    seen = set()
+    compacted = []
+    for lines in page_lines:
+        edges = page_edges(lines)
+        kept = []
+        for index, line in enumerate(lines):
+            if index in edges:
+                if PAGE_NUMBER_RE.match(line):
+                    continue
+
+                key = furniture_key(line)
+                if edge_counts[key] >= min_repeats:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+
+            kept.append(line)
+        compacted.append("\n".join(kept))
+    return compacted
+
+
+def normalize_line(line):
+    line = INLINE_WHITESPACE_RE.sub(" ", line).strip()
+    return BULLET_RE.sub("- ", line)
+
+
+def truncate_to_tokens(text, max_tokens):
+    if max_tokens is None:
+        return text
+
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+
+    cut = text.rfind("\n", 0, max_chars)
+    return text[: cut if cut > 0 else max_chars]
+
+
+def compact_cv_text(text, max_tokens=CV_PROMPT_MAX_TOKENS):
+    """
+    Deterministically shrinks extracted CV text before it goes into a prompt:
+    normalizes Unicode and bullet glyphs, collapses whitespace, drops repeated
+    page furniture, joins words hyphenated across lines and caps the result
+    at `max_tokens` estimated tokens (no cap when None).
+    """
+    text = unicodedata.normalize("NFKC", text)
+    pages = [
+        "\n".join(normalize_line(line) for line in page.split("\n"))
+        for page in text.split(PAGE_SEPARATOR)
+    ]
+
+    if len(pages) > 1:
+        pages = drop_page_furniture(pages)
+
+    text = "\n".join(pages)
+    text = HYPHENATED_BREAK_RE.sub("", text)
+    text = re.sub(r"\n{3,}", "\n\n", text).strip()
+
+    return truncate_to_tokens(text, max_tokens)
@@ -1,26 +1,52 @@
+import hashlib
+from typing import NamedTuple
 from fastapi import UploadFile, HTTPException
-from config import ALLOWED_MIME_TYPES, MAX_FILE_SIZE_MB
+from config import ALLOWED_MIME_TYPES, MAX_FILE_SIZE_MB, UPLOAD_CHUNK_SIZE
 import magic
 
 
+class ValidatedUpload(NamedTuple):
+    size: int
+    sha256: str
+
+
+def is_pdf(buffer):
+    return magic.from_buffer(buffer, mime=True) == "application/pdf"
+
+
 async def validate_upload_file(file: UploadFile):
+    """
+    Validates an uploaded CV by reading it in UPLOAD_CHUNK_SIZE chunks: the
+    PDF sniff runs on the first chunk only and the upload is rejected as soon
+    as it exceeds MAX_FILE_SIZE_MB. The SHA-256 of the content is computed
+    in the same pass. The file is rewound for the caller.
+    """
     if file.content_type not in ALLOWED_MIME_TYPES:
         raise HTTPException(
             status_code=400,
             detail="Only PDF files are allowed.",
         )
 
-    content = await file.read()
+    max_bytes = MAX_FILE_SIZE_MB * 1024 * 1024
+    size = 0
+    digest = hashlib.sha256()
 
-    file_size_mb = len(content) / (1024 * 1024)
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        if size == 0 and not is_pdf(chunk):
+            raise HTTPException(
+                status_code=400,
+                detail="Uploaded file is not a valid PDF.",
+            )
 
-    if file_size_mb > MAX_FILE_SIZE_MB:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File size exceeds {MAX_FILE_SIZE_MB}MB limit.",
-        )
-    mime = magic.from_buffer(content, mime=True)
-    if mime != "application/pdf":
+        size += len(chunk)
+        digest.update(chunk)
+        if size > max_bytes:
+            raise HTTPException(
+                status_code=400,
+                detail=f"File size exceeds {MAX_FILE_SIZE_MB}MB limit.",
+            )
+
+    if size == 0:
         raise HTTPException(
             status_code=400,
             detail="Uploaded file is not a valid PDF.",
@@ -28,4 +54,4 @@ async def validate_upload_file(file: UploadFile):
 
     await file.seek(0)
 
-    return content
+    return ValidatedUpload(size, digest.hexdigest())
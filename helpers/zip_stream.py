@@ -0,0 +1,23 @@
+class ZipStreamBuffer:
+    """
+    Write-only file object for `zipfile.ZipFile`.
+
+    ZipFile falls back to data descriptors on unseekable targets, so each
+    member can be drained and sent as soon as it is written instead of
+    building the whole archive in memory.
+    """
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
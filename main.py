@@ -1,19 +1,39 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from sqlalchemy.exc import IntegrityError
 from fastapi.exceptions import RequestValidationError
-from routers import auth, cv, letter
+from routers import auth, cv, letter, health
 from slowapi.errors import RateLimitExceeded
 from jwt import InvalidSignatureError, ExpiredSignatureError, DecodeError
 from prometheus_fastapi_instrumentator import Instrumentator
+from database import async_engine, wait_for_database
+from services.pdf_pool import pdf_pool
+from services.password_hasher import password_hasher
+from services.s3 import get_s3_client, close_s3_client
 import errors
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await wait_for_database()
+    get_s3_client()
+    pdf_pool.start()
+    password_hasher.start()
+    yield
+    password_hasher.shutdown()
+    pdf_pool.shutdown()
+    close_s3_client()
+    await async_engine.dispose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 Instrumentator().instrument(app).expose(app)
 
 app.include_router(auth.router)
 app.include_router(cv.router)
 app.include_router(letter.router)
+app.include_router(health.router)
 
 app.add_exception_handler(RateLimitExceeded, errors.rate_limit_exceeded_handler)
 app.add_exception_handler(IntegrityError, errors.integrity_error_handler)
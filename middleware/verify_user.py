@@ -1,6 +1,8 @@
-from fastapi import Depends
+from fastapi import Depends, HTTPException
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from database import SessionDep
 from helpers.auth import verify_jwt
+from services.user_cache import load_principal
 
 security = HTTPBearer()
 
@@ -12,3 +14,16 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
 
     if verified_token:
         return verified_token
+
+
+async def get_current_user(session: SessionDep, token=Depends(verify_token)):
+    """
+    Resolves the authenticated user from the signed token id through the
+    user cache, instead of looking the user up by email on every request.
+    """
+    principal = await load_principal(session, token.get("id"))
+
+    if principal is None or principal["email"] != token.get("email"):
+        raise HTTPException(status_code=404, detail="User not found")
+
+    return principal
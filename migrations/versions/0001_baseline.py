@@ -0,0 +1,55 @@
+"""baseline: users and user_cvs
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+
+Databases created by SQLModel.metadata.create_all before migrations were
+introduced already have these tables: run `alembic stamp 0001` on them once
+before `alembic upgrade head`.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("email", sqlmodel.AutoString(), nullable=False),
+        sa.Column("password_hash", sqlmodel.AutoString(), nullable=False),
+        sa.Column("role", sqlmodel.AutoString(), nullable=False),
+        sa.Column("is_verified", sa.Boolean(), nullable=False),
+        sa.Column("verification_token", sqlmodel.AutoString(), nullable=True),
+        sa.Column("password_reset_token", sqlmodel.AutoString(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "user_cvs",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("s3_key", sqlmodel.AutoString(), nullable=False),
+        sa.Column("original_name", sqlmodel.AutoString(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_user_cvs_id", "user_cvs", ["id"], unique=False)
+
+
+def downgrade():
+    op.drop_index("ix_user_cvs_id", table_name="user_cvs")
+    op.drop_table("user_cvs")
+    op.drop_index("ix_users_email", table_name="users")
+    op.drop_table("users")
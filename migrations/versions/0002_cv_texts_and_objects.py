@@ -0,0 +1,47 @@
+"""user_cv_texts and cv_objects
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "user_cv_texts",
+        sa.Column("cv_id", sa.Uuid(), nullable=False),
+        sa.Column("content", sa.LargeBinary(), nullable=False),
+        sa.Column("sections_index", sa.LargeBinary(), nullable=True),
+        sa.Column("extraction_version", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["cv_id"], ["user_cvs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("cv_id"),
+    )
+
+    op.create_table(
+        "cv_objects",
+        sa.Column("s3_key", sqlmodel.AutoString(), nullable=False),
+        sa.Column("sha256", sqlmodel.AutoString(), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("ref_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("s3_key"),
+    )
+    op.create_index("ix_cv_objects_sha256", "cv_objects", ["sha256"], unique=True)
+
+
+def downgrade():
+    op.drop_index("ix_cv_objects_sha256", table_name="cv_objects")
+    op.drop_table("cv_objects")
+    op.drop_table("user_cv_texts")
@@ -0,0 +1,38 @@
+"""index user_cvs.user_id
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+
+Every CV lookup filters by owner. CREATE INDEX CONCURRENTLY keeps the table
+writable while the index is built, so it runs outside the migration
+transaction.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_cvs_user_id",
+            "user_cvs",
+            ["user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_user_cvs_user_id",
+            table_name="user_cvs",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,52 @@
+"""composite owner index on user_cvs
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+
+Replaces the single-column user_id index with (user_id, id), covering
+original_name and created_at, so CV ownership checks and the CV list are
+single index lookups. Both indexes are built concurrently outside the
+migration transaction.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_cvs_user_id_id",
+            "user_cvs",
+            ["user_id", "id"],
+            unique=False,
+            postgresql_include=["original_name", "created_at"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_user_cvs_user_id",
+            table_name="user_cvs",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_cvs_user_id",
+            "user_cvs",
+            ["user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_user_cvs_user_id_id",
+            table_name="user_cvs",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,38 @@
+"""keyset pagination index on user_cvs
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+
+GET /cvs pages on (created_at, id) within a user, and the list ETag reads
+count(*) and max(created_at); both are served by this index.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_cvs_user_id_created_at_id",
+            "user_cvs",
+            ["user_id", "created_at", "id"],
+            unique=False,
+            postgresql_include=["original_name"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_user_cvs_user_id_created_at_id",
+            table_name="user_cvs",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,51 @@
+"""one_time_tokens; drop token columns from users
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+
+Verification and password reset tokens move to the token store (Redis,
+with this table as its fallback). Links sent before the upgrade stop
+working; users can request a new one.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "one_time_tokens",
+        sa.Column("token_hash", sqlmodel.AutoString(), nullable=False),
+        sa.Column("purpose", sqlmodel.AutoString(), nullable=False),
+        sa.Column("email", sqlmodel.AutoString(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("token_hash"),
+    )
+    op.create_index("ix_one_time_tokens_email", "one_time_tokens", ["email"])
+    op.create_index("ix_one_time_tokens_expires_at", "one_time_tokens", ["expires_at"])
+
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_column("verification_token")
+        batch_op.drop_column("password_reset_token")
+
+
+def downgrade():
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.add_column(
+            sa.Column("password_reset_token", sqlmodel.AutoString(), nullable=True)
+        )
+        batch_op.add_column(
+            sa.Column("verification_token", sqlmodel.AutoString(), nullable=True)
+        )
+
+    op.drop_index("ix_one_time_tokens_expires_at", table_name="one_time_tokens")
+    op.drop_index("ix_one_time_tokens_email", table_name="one_time_tokens")
+    op.drop_table("one_time_tokens")
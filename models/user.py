@@ -1,9 +1,17 @@
-from sqlmodel import SQLModel, Field, Relationship
+from sqlmodel import SQLModel, Field, Relationship, Index
 from datetime import datetime, timezone
 from typing import Optional, List
 import uuid
 
 
+def utc_now():
+    """
+    Current UTC time without tzinfo: the timestamp columns have no time zone
+    and asyncpg rejects aware datetimes for them.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class User(SQLModel, table=True):
     __tablename__ = "users"
 
@@ -12,15 +20,31 @@ class User(SQLModel, table=True):
     password_hash: str
     role: str = Field(default="user")
     is_verified: bool = Field(default=False)
-    verification_token: Optional[str] = Field(nullable=True)
-    password_reset_token: Optional[str] = Field(nullable=True)
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utc_now)
 
     cvs: List["UserCV"] = Relationship(back_populates="user")
 
 
 class UserCV(SQLModel, table=True):
     __tablename__ = "user_cvs"
+    # Serves owner-scoped lookups and listings; the included columns let the
+    # CV list be answered from the index alone.
+    __table_args__ = (
+        Index(
+            "ix_user_cvs_user_id_id",
+            "user_id",
+            "id",
+            postgresql_include=["original_name", "created_at"],
+        ),
+        # Keyset pagination of the CV list on (created_at, id)
+        Index(
+            "ix_user_cvs_user_id_created_at_id",
+            "user_id",
+            "created_at",
+            "id",
+            postgresql_include=["original_name"],
+        ),
+    )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True, index=True)
     user_id: int = Field(foreign_key="users.id", nullable=False)
@@ -28,6 +52,45 @@ class UserCV(SQLModel, table=True):
     s3_key: str
     original_name: str
 
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utc_now)
 
     user: Optional[User] = Relationship(back_populates="cvs")
+
+
+class CvObject(SQLModel, table=True):
+    """A stored CV file, shared by every UserCV with the same content."""
+
+    __tablename__ = "cv_objects"
+
+    s3_key: str = Field(primary_key=True)
+    sha256: str = Field(unique=True, index=True)
+    size: int
+    ref_count: int = Field(default=1)
+
+    created_at: datetime = Field(default_factory=utc_now)
+
+
+class UserCVText(SQLModel, table=True):
+    __tablename__ = "user_cv_texts"
+
+    cv_id: uuid.UUID = Field(
+        foreign_key="user_cvs.id", primary_key=True, ondelete="CASCADE"
+    )
+    # zlib-compressed UTF-8 text extracted from the CV PDF
+    content: bytes
+    # zlib-compressed JSON BM25 index over the CV sections
+    sections_index: Optional[bytes] = Field(default=None, nullable=True)
+    extraction_version: int
+
+    created_at: datetime = Field(default_factory=utc_now)
+
+
+class OneTimeToken(SQLModel, table=True):
+    """Database fallback of the token store, used while Redis is unavailable."""
+
+    __tablename__ = "one_time_tokens"
+
+    token_hash: str = Field(primary_key=True)
+    purpose: str
+    email: str = Field(index=True)
+    expires_at: datetime = Field(index=True)
@@ -7,8 +7,8 @@ from fastapi import (
 )
 from schemas.user import UserCreate, UserBase, UserLogin, UserPasswordReset
 from models.user import User
-from database import SessionDep
-from helpers.auth import hash_password, sign_jwt, verify_jwt, compare_password
+from database import SessionDep, async_session_maker
+from helpers.auth import sign_jwt, verify_jwt, password_needs_rehash
 from helpers.email_sender import EmailSender
 from helpers.limiter import RateLimiterService
 from config import (
@@ -24,9 +24,12 @@ from config import (
     RATE_LIMIT_FORGOT_PASSWORD,
     RATE_LIMIT_RESET_PASSWORD,
 )
-from sqlmodel import select
+from sqlmodel import select, update
 from helpers.logger import AppLogger
 from helpers.db import get_user_by_email
+from services.user_cache import invalidate_user
+from services.token_store import token_store, VERIFY_EMAIL, RESET_PASSWORD
+from services.password_hasher import password_hasher
 import uuid
 
 logger = AppLogger(log_file="app.log")
@@ -37,6 +40,27 @@ limiter = RateLimiterService()
 router = APIRouter(prefix="/auth")
 
 
+async def rehash_password(user_id, password, old_hash):
+    """
+    Upgrades a password hash made with an old bcrypt cost. Runs as a
+    background task after the login response, in its own session, so it adds
+    no latency and a failure never affects the login. The update only applies
+    while the stored hash is still `old_hash`, so a password changed in the
+    meantime is never overwritten.
+    """
+    try:
+        password_hash = await password_hasher.hash(password)
+        async with async_session_maker() as session:
+            await session.execute(
+                update(User)
+                .where(User.id == user_id, User.password_hash == old_hash)
+                .values(password_hash=password_hash)
+            )
+            await session.commit()
+    except Exception as e:
+        logger.log_exception(f"Password rehash failed for user {user_id}: {e}")
+
+
 @router.post("/register", status_code=201)
 @limiter.limit(RATE_LIMIT_REGISTER)
 async def register(
@@ -49,15 +73,14 @@ async def register(
         verification_token = sign_jwt(
             {"email": user_data.email}, expires_in=(ACCOUNT_CONFIRMATION_TOKEN)
         )
-        password_hash = hash_password(user_data.password)
-        user = User(
-            email=user_data.email,
-            password_hash=password_hash,
-            verification_token=verification_token,
-        )
+        password_hash = await password_hasher.hash(user_data.password)
+        user = User(email=user_data.email, password_hash=password_hash)
         session.add(user)
-        session.commit()
-        session.refresh(user)
+        await session.commit()
+        await session.refresh(user)
+        await token_store.issue(
+            VERIFY_EMAIL, user.email, verification_token, ACCOUNT_CONFIRMATION_TOKEN
+        )
 
         background_tasks.add_task(
             email_sender.account_confirmation,
@@ -67,7 +90,7 @@ async def register(
 
         return {"data": {"message": "User created successfully"}}
     except Exception:
-        session.rollback()
+        await session.rollback()
         raise
 
 
@@ -84,17 +107,17 @@ async def verify(request: Request, session: SessionDep, token: str):
         if not user_email:
             raise HTTPException(status_code=400, detail="Invalid token: Email missing")
 
-        user = get_user_by_email(session, user_email)
+        user = await get_user_by_email(session, user_email)
 
-        if user.verification_token != token:
+        if not await token_store.consume(VERIFY_EMAIL, user_email, token):
             raise HTTPException(status_code=403, detail="Invalid verification token")
 
         if not user.is_verified:
             user.is_verified = True
-            user.verification_token = None
             session.add(user)
-            session.commit()
-            session.refresh(user)
+            await session.commit()
+            await session.refresh(user)
+            await invalidate_user(user.id)
 
         return {
             "data": {
@@ -104,7 +127,7 @@ async def verify(request: Request, session: SessionDep, token: str):
         }
 
     except Exception as e:
-        session.rollback()
+        await session.rollback()
         logger.log_exception(
             f"Verification failed for {user_email if 'user_email' in locals() else 'Unknown'}: {e}"
         )
@@ -120,7 +143,7 @@ async def resend_verification_token(
     background_tasks: BackgroundTasks,
 ):
     try:
-        user = get_user_by_email(session, user_data.email)
+        user = await get_user_by_email(session, user_data.email)
 
         if user.is_verified:
             return {"data": {"message": "User is already verified"}}
@@ -128,11 +151,9 @@ async def resend_verification_token(
         verification_token = sign_jwt(
             {"email": user_data.email}, expires_in=ACCOUNT_CONFIRMATION_TOKEN
         )
-        user.verification_token = verification_token
-
-        session.add(user)
-        session.commit()
-        session.refresh(user)
+        await token_store.issue(
+            VERIFY_EMAIL, user.email, verification_token, ACCOUNT_CONFIRMATION_TOKEN
+        )
 
         background_tasks.add_task(
             email_sender.account_confirmation,
@@ -144,7 +165,7 @@ async def resend_verification_token(
     except HTTPException:
         raise
     except Exception as e:
-        session.rollback()
+        await session.rollback()
         logger.log_exception(f"Verification failed for {user_data.email}: {e}")
         raise
 
@@ -156,15 +177,18 @@ async def login(
     response: Response,
     session: SessionDep,
     user_data: UserLogin,
+    background_tasks: BackgroundTasks,
 ):
     try:
         statement = select(User).where(User.email == user_data.email)
-        user = session.exec(statement).first()
+        user = (await session.exec(statement)).first()
 
         if not user:
             raise HTTPException(status_code=401, detail="Invalid email or password")
 
-        checked_password = compare_password(user_data.password, user.password_hash)
+        checked_password = await password_hasher.verify(
+            user_data.password, user.password_hash
+        )
 
         if not checked_password:
             raise HTTPException(status_code=401, detail="Invalid email or password")
@@ -175,6 +199,11 @@ async def login(
                 detail="Account not verified. Please verify your email or request a new verification link.",
             )
 
+        if password_needs_rehash(user.password_hash):
+            background_tasks.add_task(
+                rehash_password, user.id, user_data.password, user.password_hash
+            )
+
         csrfToken = str(uuid.uuid4())
 
         refresh_token = sign_jwt(
@@ -194,7 +223,7 @@ async def login(
     except HTTPException:
         raise
     except Exception as e:
-        session.rollback()
+        await session.rollback()
         logger.log_exception(f"Verification failed for {user_data.email}: {e}")
         raise
 
@@ -250,12 +279,12 @@ async def forgot_password(
 ):
     try:
         statement = select(User).where(User.email == user_data.email)
-        user = session.exec(statement).first()
+        user = (await session.exec(statement)).first()
         if user:
             password_reset_token = sign_jwt({"email": user.email}, RESET_PASSWORD_TOKEN)
-            user.password_reset_token = password_reset_token
-            session.add(user)
-            session.commit()
+            await token_store.issue(
+                RESET_PASSWORD, user.email, password_reset_token, RESET_PASSWORD_TOKEN
+            )
             background_tasks.add_task(
                 email_sender.forgot_password,
                 to_email=user.email,
@@ -283,20 +312,25 @@ async def reset_password(
             raise HTTPException(status_code=400, detail="Invalid token: Email missing")
 
         statement = select(User).where(User.email == email)
-        user = session.exec(statement).first()
-        if not user or user.password_reset_token != user_data.token:
+        user = (await session.exec(statement)).first()
+        if not user:
+            raise HTTPException(status_code=401, detail="Unauthorized")
+
+        # Hash before consuming, so a busy hasher (503) leaves the token usable
+        password_hash = await password_hasher.hash(user_data.password)
+
+        if not await token_store.consume(RESET_PASSWORD, email, user_data.token):
             raise HTTPException(status_code=401, detail="Unauthorized")
 
-        password_hash = hash_password(user_data.password)
         user.password_hash = password_hash
-        user.password_reset_token = None
         session.add(user)
-        session.commit()
+        await session.commit()
+        await invalidate_user(user.id)
 
         return {"data": {"message": "Password reset successful"}}
     except HTTPException:
         raise
     except Exception as e:
-        session.rollback()
+        await session.rollback()
         logger.log_exception(f"Password reset failed: {e}")
         raise
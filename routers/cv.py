@@ -1,82 +1,286 @@
 import uuid
 import urllib.parse
-from typing import List
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, Request
-from config import RATE_LIMIT_UPLOAD_CV
+from typing import Literal, Optional
+from fastapi import (
+    APIRouter,
+    UploadFile,
+    File,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    BackgroundTasks,
+)
+from config import (
+    RATE_LIMIT_UPLOAD_CV,
+    RATE_LIMIT_COMPLETE_UPLOAD_CV,
+    MAX_FILE_SIZE_MB,
+    CV_UPLOAD_URL_EXPIRE,
+    CV_SNIFF_BYTES,
+    CV_PAGE_SIZE,
+    CV_PAGE_MAX_SIZE,
+)
+from sqlalchemy.exc import IntegrityError
 from database import SessionDep
-from middleware.verify_user import verify_token
-from services.s3 import upload_to_s3, delete_from_s3
-from models.user import UserCV
-from helpers.validate_upload_file import validate_upload_file
+from middleware.verify_user import verify_token, get_current_user
+from services.storage import storage
+from models.user import UserCV, CvObject
+from helpers.validate_upload_file import validate_upload_file, is_pdf
+from helpers.auth import sign_jwt, verify_jwt
 from helpers.limiter import RateLimiterService
-from schemas.cv import CvListItem
-from schemas.base import DataResponse
-from helpers.db import get_user_by_email
+from schemas.cv import CvListResponse, CvUploadUrlRequest, CvUploadComplete
+from helpers.pagination import encode_cursor, decode_cursor, weak_etag, etag_matches
+from helpers.db import (
+    get_user_cv,
+    get_user_cvs,
+    get_user_cvs_version,
+    get_cv_object_by_hash,
+    release_cv_object,
+    copy_cv_text,
+)
+from services.cv_text import store_cv_text_from_storage
 
 limiter = RateLimiterService()
 
 router = APIRouter(prefix="/cvs", dependencies=[Depends(verify_token)])
 
 
+async def add_user_cv(session, cv_object, cv_id, user_id, original_name, uploaded):
+    """
+    Commits a new UserCV referring to `cv_object`. Text already extracted from
+    a shared file is copied; returns (user_cv, has_text).
+    """
+    user_cv = UserCV(
+        id=cv_id,
+        user_id=user_id,
+        s3_key=cv_object.s3_key,
+        original_name=original_name,
+    )
+
+    session.add(cv_object)
+    session.add(user_cv)
+    has_text = not uploaded and await copy_cv_text(
+        session, cv_object.s3_key, user_cv.id
+    )
+    await session.commit()
+    return user_cv, has_text
+
+
 @router.post("", status_code=200)
 @limiter.limit(RATE_LIMIT_UPLOAD_CV)
 async def upload_file(
     request: Request,
     session: SessionDep,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
-    user=Depends(verify_token),
+    user=Depends(get_current_user),
 ):
+    uploaded_file = False
     try:
-        content = await validate_upload_file(file)
+        upload = await validate_upload_file(file)
 
         safe_filename = urllib.parse.quote_plus(file.filename)
-        file_uuid = str(uuid.uuid4())
-        s3_key = f"{file_uuid}.pdf"
+        file_uuid = uuid.uuid4()
+
+        # Identical content is stored once and shared by reference count
+        cv_object = await get_cv_object_by_hash(session, upload.sha256)
+
+        if cv_object:
+            cv_object.ref_count += 1
+            s3_key = cv_object.s3_key
+        else:
+            s3_key = f"{file_uuid}.pdf"
+            tagging_str = f"original_name={safe_filename}"
+
+            uploaded_file = await storage.put_file(
+                s3_key, file.file, "application/pdf", tagging_str
+            )
+
+            if not uploaded_file:
+                raise HTTPException(status_code=502, detail="Failed to upload a file")
+
+            cv_object = CvObject(s3_key=s3_key, sha256=upload.sha256, size=upload.size)
+
+        try:
+            user_cv, has_text = await add_user_cv(
+                session, cv_object, file_uuid, user["id"], safe_filename, uploaded_file
+            )
+        except IntegrityError:
+            if not uploaded_file:
+                raise
+
+            # A concurrent upload of the same content registered it first:
+            # share its object and drop the copy this request uploaded
+            await session.rollback()
+            cv_object = await get_cv_object_by_hash(session, upload.sha256)
+            if cv_object is None:
+                raise
+
+            cv_object.ref_count += 1
+            user_cv, has_text = await add_user_cv(
+                session, cv_object, file_uuid, user["id"], safe_filename, False
+            )
+
+            duplicate_key = s3_key
+            s3_key = cv_object.s3_key
+            uploaded_file = False
+            await storage.delete(duplicate_key)
+
+        if not has_text:
+            background_tasks.add_task(store_cv_text_from_storage, user_cv.id, s3_key)
+
+        return {
+            "message": "CV uploaded successfully",
+        }
+
+    except Exception:
+        await session.rollback()
+        if uploaded_file:
+            await storage.delete(s3_key)
+        raise
+
+
+@router.post("/upload-url", status_code=200)
+@limiter.limit(RATE_LIMIT_UPLOAD_CV)
+async def create_upload_url(
+    request: Request,
+    upload_request: CvUploadUrlRequest,
+    user=Depends(get_current_user),
+):
+    """
+    Returns a presigned POST for uploading a CV straight to S3, and a token
+    to hand to /cvs/complete once the upload has finished.
+    """
+    safe_filename = urllib.parse.quote_plus(upload_request.filename)
+    file_uuid = str(uuid.uuid4())
+    s3_key = f"{file_uuid}.pdf"
 
-        tagging_str = f"original_name={safe_filename}"
+    presigned = await storage.presign_upload(
+        s3_key,
+        "application/pdf",
+        MAX_FILE_SIZE_MB * 1024 * 1024,
+        CV_UPLOAD_URL_EXPIRE,
+        {"original_name": safe_filename},
+    )
+    upload_token = sign_jwt(
+        {
+            "purpose": "cv_upload",
+            "user_id": user["id"],
+            "cv_id": file_uuid,
+            "s3_key": s3_key,
+            "original_name": safe_filename,
+        },
+        CV_UPLOAD_URL_EXPIRE,
+    )
 
-        uploaded_file = upload_to_s3(content, s3_key, "application/pdf", tagging_str)
+    return {
+        "data": {
+            "url": presigned["url"],
+            "fields": presigned["fields"],
+            "upload_token": upload_token,
+        }
+    }
+
+
+@router.post("/complete", status_code=200)
+@limiter.limit(RATE_LIMIT_COMPLETE_UPLOAD_CV)
+async def complete_upload(
+    request: Request,
+    session: SessionDep,
+    background_tasks: BackgroundTasks,
+    upload: CvUploadComplete,
+    user=Depends(get_current_user),
+):
+    """Registers a CV uploaded through /cvs/upload-url after sniffing its content."""
+    upload_data = verify_jwt(token=upload.upload_token)
+
+    # Other tokens signed with the same key (e.g. access tokens) are rejected
+    if (
+        upload_data.get("purpose") != "cv_upload"
+        or upload_data.get("user_id") != user["id"]
+    ):
+        raise HTTPException(status_code=403, detail="Invalid upload token")
 
-        if not uploaded_file:
-            raise HTTPException(status_code=502, detail="Failed to upload a file")
-        get_user_by_email(session, user["email"])
+    s3_key = upload_data["s3_key"]
+    head = await storage.get_range(s3_key, CV_SNIFF_BYTES)
 
+    if not head:
+        raise HTTPException(status_code=404, detail="Uploaded file not found")
+
+    if not is_pdf(head):
+        await storage.delete(s3_key)
+        raise HTTPException(status_code=400, detail="Uploaded file is not a valid PDF.")
+
+    try:
         user_cv = UserCV(
-            id=file_uuid,
+            id=uuid.UUID(upload_data["cv_id"]),
             user_id=user["id"],
             s3_key=s3_key,
-            original_name=safe_filename,
+            original_name=upload_data["original_name"],
         )
 
         session.add(user_cv)
-        session.commit()
-        return {
-            "message": "CV uploaded successfully",
-        }
-
+        await session.commit()
     except Exception:
-        session.rollback()
+        await session.rollback()
         raise
 
+    background_tasks.add_task(store_cv_text_from_storage, user_cv.id, s3_key)
+
+    return {
+        "message": "CV uploaded successfully",
+    }
+
+
+@router.get("", status_code=200, response_model=CvListResponse)
+async def get_cvs(
+    request: Request,
+    response: Response,
+    session: SessionDep,
+    limit: int = Query(CV_PAGE_SIZE, ge=1, le=CV_PAGE_MAX_SIZE),
+    order: Literal["asc", "desc"] = "desc",
+    cursor: Optional[str] = None,
+    user=Depends(get_current_user),
+):
+    """
+    Returns a page of the user's CVs ordered by upload time. Pass `next_cursor`
+    back as `cursor` for the following page. The weak ETag changes with any
+    upload or deletion, so unchanged pages are answered with 304.
+    """
+    after = decode_cursor(cursor) if cursor else None
+
+    count, latest = await get_user_cvs_version(session, user["id"])
+    etag = weak_etag(user["id"], count, latest, order, limit, cursor)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
 
-@router.get("", status_code=200, response_model=DataResponse[List[CvListItem]])
-async def get_cvs(request: Request, session: SessionDep, user=Depends(verify_token)):
-    db_user = get_user_by_email(session, user["email"])
-    return {"data": db_user.cvs}
+    rows = await get_user_cvs(session, user["id"], limit + 1, order, after)
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+
+    response.headers.update(headers)
+    return {"data": rows, "next_cursor": next_cursor}
 
 
 @router.delete("", status_code=204)
 async def delete_cv(
-    request: Request, session: SessionDep, id: str, user=Depends(verify_token)
+    request: Request, session: SessionDep, id: uuid.UUID, user=Depends(get_current_user)
 ):
-    get_user_by_email(session, user["email"])
-
-    user_cv = session.get(UserCV, id)
+    user_cv = await get_user_cv(session, user["id"], id)
 
     if not user_cv:
         raise HTTPException(status_code=404, detail="Cv not found")
 
-    delete_from_s3(key=user_cv.s3_key)
+    s3_key = user_cv.s3_key
+
+    await session.delete(user_cv)
+    delete_object = await release_cv_object(session, s3_key)
+    await session.commit()
 
-    session.delete(user_cv)
-    session.commit()
+    if delete_object:
+        await storage.delete(s3_key)
@@ -0,0 +1,32 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from database import check_database
+from helpers.logger import AppLogger
+from services.redis_client import redis_client
+
+logger = AppLogger(log_file="app.log")
+
+router = APIRouter(prefix="/health")
+
+
+@router.get("", status_code=200)
+async def health():
+    """Readiness probe: reports whether the database and Redis are reachable."""
+    checks = {}
+
+    try:
+        await check_database()
+        checks["database"] = "ok"
+    except Exception as e:
+        logger.log_error(f"Health check: database unavailable: {e}")
+        checks["database"] = "unavailable"
+
+    try:
+        await redis_client.ping()
+        checks["redis"] = "ok"
+    except Exception as e:
+        logger.log_error(f"Health check: redis unavailable: {e}")
+        checks["redis"] = "unavailable"
+
+    status_code = 200 if all(v == "ok" for v in checks.values()) else 503
+    return JSONResponse(status_code=status_code, content={"data": checks})
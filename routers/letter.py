@@ -1,45 +1,167 @@
 from fastapi import APIRouter, Depends, Request, HTTPException, Response
-from middleware.verify_user import verify_token
+from fastapi.responses import StreamingResponse, JSONResponse
+from middleware.verify_user import verify_token, get_current_user
 from database import SessionDep
-from schemas.letter import GenerateCoverLetter
-from services.s3 import get_from_s3
-from helpers.cv import get_user_cv_by_id, extract_text_from_pdf, convert_text_to_pdf
-from helpers.db import get_user_by_email
+from schemas.letter import GenerateCoverLetter, GenerateCoverLetterBatch
 from helpers.limiter import RateLimiterService
-from services.client_openai import generate_cover_letter
-from config import RATE_LIMIT_GENERATE_LETTER
+from services.letter import (
+    get_selected_cv,
+    load_cv_text,
+    load_cv_section_index,
+    prepare_cv_text,
+    build_letter,
+    letter_event_stream,
+    letter_zip_stream,
+    get_letter_pdf,
+)
+from services.letter_cache import letter_cache_key, lookup_cached_letter
+from services.letter_jobs import enqueue_letter_job, get_letter_job
+from config import (
+    RATE_LIMIT_GENERATE_LETTER,
+    RATE_LIMIT_GENERATE_LETTER_BATCH,
+    RATE_LIMIT_GET_LETTER,
+    RATE_LIMIT_GET_LETTER_JOB,
+)
 
 router = APIRouter(prefix="/letter", dependencies=[Depends(verify_token)])
 limiter = RateLimiterService()
 
+CACHE_HEADER = "X-Letter-Cache"
+
+
+def pdf_response(pdf_bytes, headers=None):
+    return Response(
+        content=pdf_bytes,
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": "attachment; filename=cover_letter.pdf",
+            **(headers or {}),
+        },
+    )
+
+
+async def stream_response(user, cv_text, job_text, regenerate):
+    cache_key = letter_cache_key(cv_text, job_text)
+    cached, cache_status = await lookup_cached_letter(cache_key, regenerate)
+
+    return StreamingResponse(
+        letter_event_stream(user["id"], cv_text, job_text, cache_key, cached),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+            CACHE_HEADER: cache_status,
+        },
+    )
+
 
 @limiter.limit(RATE_LIMIT_GENERATE_LETTER)
 @router.post("/", status_code=200)
-def generate_letter(
+async def generate_letter(
     request: Request,
     session: SessionDep,
     letter_data: GenerateCoverLetter,
-    user=Depends(verify_token),
+    regenerate: bool = False,
+    user=Depends(get_current_user),
 ):
+    selected_cv = await get_selected_cv(session, user["id"], letter_data.cv_id)
 
-    db_user = get_user_by_email(session, user["email"])
-    cv_id = letter_data.cv_id
-    selected_cv = get_user_cv_by_id(db_user, cv_id)
+    job_text = letter_data.job_desc
 
-    cv_binary = get_from_s3(selected_cv.s3_key)
-    if not cv_binary:
-        raise HTTPException(status_code=404, detail="CV not found")
+    if "respond-async" in request.headers.get("prefer", ""):
+        job_id = await enqueue_letter_job(
+            user, selected_cv.id, job_text, regenerate, letter_data.select_sections
+        )
+        return JSONResponse(
+            status_code=202,
+            content={
+                "data": {
+                    "job_id": job_id,
+                    "status": "queued",
+                    "status_url": f"/letter/jobs/{job_id}",
+                }
+            },
+        )
 
-    cv_text = extract_text_from_pdf(cv_binary)
+    cv_text = await prepare_cv_text(
+        session, selected_cv, job_text, letter_data.select_sections
+    )
 
-    job_text = letter_data.job_desc
+    if "text/event-stream" in request.headers.get("accept", ""):
+        return await stream_response(user, cv_text, job_text, regenerate)
 
-    letter_content = generate_cover_letter(cv=cv_text, job=job_text)
+    _, pdf_bytes, cache_status = await build_letter(cv_text, job_text, regenerate)
 
-    pdf_bytes = convert_text_to_pdf(letter_content)
+    return pdf_response(pdf_bytes, {CACHE_HEADER: cache_status})
 
-    return Response(
-        content=pdf_bytes,
-        media_type="application/pdf",
-        headers={"Content-Disposition": "attachment; filename=cover_letter.pdf"},
+
+@router.post("/stream", status_code=200)
+@limiter.limit(RATE_LIMIT_GENERATE_LETTER)
+async def stream_letter(
+    request: Request,
+    session: SessionDep,
+    letter_data: GenerateCoverLetter,
+    regenerate: bool = False,
+    user=Depends(get_current_user),
+):
+    selected_cv = await get_selected_cv(session, user["id"], letter_data.cv_id)
+    cv_text = await prepare_cv_text(
+        session, selected_cv, letter_data.job_desc, letter_data.select_sections
     )
+
+    return await stream_response(user, cv_text, letter_data.job_desc, regenerate)
+
+
+@router.post("/batch", status_code=200)
+@limiter.limit(RATE_LIMIT_GENERATE_LETTER_BATCH)
+async def generate_letter_batch(
+    request: Request,
+    session: SessionDep,
+    batch_data: GenerateCoverLetterBatch,
+    regenerate: bool = False,
+    user=Depends(get_current_user),
+):
+    selected_cv = await get_selected_cv(session, user["id"], batch_data.cv_id)
+
+    cv_text, section_index = None, None
+    if batch_data.select_sections:
+        section_index = await load_cv_section_index(session, selected_cv)
+    else:
+        cv_text = await load_cv_text(session, selected_cv)
+
+    return StreamingResponse(
+        letter_zip_stream(cv_text, batch_data.job_descs, regenerate, section_index),
+        media_type="application/zip",
+        headers={"Content-Disposition": "attachment; filename=cover_letters.zip"},
+    )
+
+
+@router.get("/pdf/{letter_id}", status_code=200)
+@limiter.limit(RATE_LIMIT_GET_LETTER)
+async def download_letter(
+    request: Request, letter_id: str, user=Depends(get_current_user)
+):
+    pdf_bytes = await get_letter_pdf(user["id"], letter_id)
+
+    if not pdf_bytes:
+        raise HTTPException(status_code=404, detail="Letter not found")
+
+    return pdf_response(pdf_bytes)
+
+
+@router.get("/jobs/{job_id}", status_code=200)
+@limiter.limit(RATE_LIMIT_GET_LETTER_JOB)
+async def get_job(request: Request, job_id: str, user=Depends(get_current_user)):
+    job = await get_letter_job(user["id"], job_id)
+
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    if job["status"] == "done":
+        return pdf_response(job["pdf"])
+
+    data = {"job_id": job_id, "status": job["status"]}
+    if job["status"] == "failed":
+        data["error"] = job.get("error")
+
+    return {"data": data}
@@ -1,5 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
+from typing import List, Optional
+from schemas.base import DataResponse
 import uuid
 
 
@@ -7,3 +9,15 @@ class CvListItem(BaseModel):
     id: uuid.UUID
     original_name: str
     created_at: datetime
+
+
+class CvListResponse(DataResponse[List[CvListItem]]):
+    next_cursor: Optional[str] = None
+
+
+class CvUploadUrlRequest(BaseModel):
+    filename: str = Field(min_length=1, max_length=255)
+
+
+class CvUploadComplete(BaseModel):
+    upload_token: str
@@ -1,19 +1,33 @@
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, AfterValidator, Field, field_validator
+from typing import Annotated, List
+from config import LETTER_BATCH_MAX_JOBS
 import uuid
 
 
+def check_job_description(value):
+    if len(value) < 50:
+        raise ValueError("Job description must be at least 50 characters")
+    if len(value) > 3000:
+        raise ValueError("Job description cannot be longer than 3000 characters long")
+    return value
+
+
 class JobDescriptionValidator:
     @field_validator("job_desc")
     def validate_job_description(cls, value):
-        if len(value) < 50:
-            raise ValueError("Job description must be at least 50 characters")
-        if len(value) > 3000:
-            raise ValueError(
-                "Job description cannot be longer than 3000 characters long"
-            )
-        return value
+        return check_job_description(value)
 
 
 class GenerateCoverLetter(BaseModel, JobDescriptionValidator):
     cv_id: uuid.UUID
     job_desc: str
+    # Send only the CV sections most relevant to the job description
+    select_sections: bool = False
+
+
+class GenerateCoverLetterBatch(BaseModel):
+    cv_id: uuid.UUID
+    job_descs: List[Annotated[str, AfterValidator(check_job_description)]] = Field(
+        min_length=1, max_length=LETTER_BATCH_MAX_JOBS
+    )
+    select_sections: bool = False
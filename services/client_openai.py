@@ -1,15 +1,33 @@
-from openai import OpenAI
-from config import OPENAI_API_KEY
+from openai import AsyncOpenAI
+from config import OPENAI_API_KEY, OPENAI_LETTER_MODEL
 from prompts import generate_letter_prompt
 
 
-client = OpenAI(api_key=OPENAI_API_KEY)
+client = AsyncOpenAI(api_key=OPENAI_API_KEY)
 
 
-def generate_cover_letter(cv, job):
-    response = client.responses.create(
-        model="gpt-4o",
+async def generate_cover_letter(cv, job):
+    response = await client.responses.create(
+        model=OPENAI_LETTER_MODEL,
         instructions=generate_letter_prompt,
         input=f"<cv> {cv} </cv> <job> {job} </job>",
     )
     return response.output_text
+
+
+async def stream_cover_letter(cv, job):
+    """Yields the cover letter text deltas as the model produces them."""
+    stream = await client.responses.create(
+        model=OPENAI_LETTER_MODEL,
+        instructions=generate_letter_prompt,
+        input=f"<cv> {cv} </cv> <job> {job} </job>",
+        stream=True,
+    )
+
+    async for event in stream:
+        if event.type == "response.output_text.delta":
+            yield event.delta
+        elif event.type == "error":
+            raise RuntimeError(f"OpenAI stream error: {event.message}")
+        elif event.type == "response.failed":
+            raise RuntimeError(f"OpenAI response failed: {event.response.error}")
@@ -0,0 +1,38 @@
+from database import async_session_maker
+from helpers.cv import extract_text_from_pdf
+from helpers.db import save_cv_text
+from helpers.logger import AppLogger
+from services.pdf_pool import pdf_pool
+from services.storage import storage
+
+logger = AppLogger(log_file="app.log")
+
+
+async def save_cv_text_in_new_session(cv_id, text):
+    async with async_session_maker() as session:
+        await save_cv_text(session, cv_id, text)
+
+
+async def store_cv_text(cv_id, binary_pdf):
+    """Background stage run after upload: extracts the CV text and persists it."""
+    try:
+        extraction = await pdf_pool.run(extract_text_from_pdf, binary_pdf)
+        if extraction.truncated:
+            logger.log_warning(
+                f"CV {cv_id} text truncated after "
+                f"{extraction.pages_processed}/{extraction.page_count} pages"
+            )
+
+        await save_cv_text_in_new_session(cv_id, extraction.text)
+    except Exception as e:
+        logger.log_exception(f"CV text extraction failed for {cv_id}: {e}")
+
+
+async def store_cv_text_from_storage(cv_id, s3_key):
+    """Like `store_cv_text`, reading the PDF from storage (usually the local cache)."""
+    binary_pdf = await storage.get(s3_key)
+    if not binary_pdf:
+        logger.log_error(f"CV text extraction failed for {cv_id}: object not found")
+        return
+
+    await store_cv_text(cv_id, binary_pdf)
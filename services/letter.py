@@ -0,0 +1,262 @@
+import asyncio
+import json
+import uuid
+import zipfile
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+from config import LETTER_PDF_TTL, LETTER_BATCH_CONCURRENCY, CV_SECTION_TOKEN_BUDGET
+from helpers.cv import extract_text_from_pdf, convert_text_to_pdf
+from helpers.cv_sections import build_section_index, select_sections
+from helpers.db import (
+    get_user_cv,
+    get_cv_text,
+    get_cv_section_index,
+    save_cv_text,
+)
+from helpers.logger import AppLogger
+from helpers.metrics import CV_PROMPT_TOKENS
+from helpers.text_compaction import compact_cv_text, estimate_tokens
+from helpers.zip_stream import ZipStreamBuffer
+from services.client_openai import generate_cover_letter, stream_cover_letter
+from services.letter_cache import (
+    letter_cache_key,
+    lookup_cached_letter,
+    cache_letter,
+)
+from services.pdf_pool import pdf_pool
+from services.redis_client import redis_client
+from services.storage import storage
+
+logger = AppLogger(log_file="app.log")
+
+
+async def get_selected_cv(session, user_id, cv_id):
+    """Returns the CV the user selected, raising 404 if it is not theirs."""
+    selected_cv = await get_user_cv(session, user_id, cv_id)
+
+    if selected_cv is None:
+        raise HTTPException(status_code=404, detail="CV not found")
+
+    return selected_cv
+
+
+def compact_for_prompt(cv_text):
+    compacted = compact_cv_text(cv_text)
+    CV_PROMPT_TOKENS.labels(stage="extracted").observe(estimate_tokens(cv_text))
+    CV_PROMPT_TOKENS.labels(stage="compacted").observe(estimate_tokens(compacted))
+    return compacted
+
+
+def select_for_prompt(section_index, job_text):
+    selected = select_sections(section_index, job_text, CV_SECTION_TOKEN_BUDGET)
+    CV_PROMPT_TOKENS.labels(stage="selected").observe(estimate_tokens(selected))
+    return selected
+
+
+async def read_cv_text(session, selected_cv):
+    """
+    Returns the extracted text of a CV.
+
+    The text stored at upload time is used when present. CVs uploaded before
+    that, or extracted by an older version, are parsed from S3 once and
+    backfilled. PDF parsing runs in the process pool and DB/S3 calls are
+    awaited so the event loop stays free.
+    """
+    cv_text = await get_cv_text(session, selected_cv.id)
+    if cv_text is not None:
+        return cv_text
+
+    cv_binary = await storage.get(selected_cv.s3_key)
+    if not cv_binary:
+        raise HTTPException(status_code=404, detail="CV not found")
+
+    extraction = await pdf_pool.run(extract_text_from_pdf, cv_binary)
+    cv_text = extraction.text
+
+    if extraction.truncated:
+        logger.log_warning(
+            f"CV {selected_cv.id} text truncated after "
+            f"{extraction.pages_processed}/{extraction.page_count} pages"
+        )
+
+    try:
+        await save_cv_text(session, selected_cv.id, cv_text)
+    except Exception as e:
+        await session.rollback()
+        logger.log_exception(f"CV text backfill failed for {selected_cv.id}: {e}")
+
+    return cv_text
+
+
+async def load_cv_text(session, selected_cv):
+    """Returns the text of a CV, compacted for the prompt."""
+    cv_text = await read_cv_text(session, selected_cv)
+    return await run_in_threadpool(compact_for_prompt, cv_text)
+
+
+async def load_cv_section_index(session, selected_cv):
+    """Returns the stored section index of a CV, building it if the backfill failed."""
+    cv_text = await read_cv_text(session, selected_cv)
+    section_index = await get_cv_section_index(session, selected_cv.id)
+
+    if section_index is None:
+        section_index = await run_in_threadpool(build_section_index, cv_text)
+
+    return section_index
+
+
+async def prepare_cv_text(session, selected_cv, job_text, select_relevant=False):
+    """
+    Returns the CV text for the prompt: the whole compacted CV, or only the
+    sections most relevant to the job when `select_relevant` is set.
+    """
+    if not select_relevant:
+        return await load_cv_text(session, selected_cv)
+
+    section_index = await load_cv_section_index(session, selected_cv)
+    return await run_in_threadpool(select_for_prompt, section_index, job_text)
+
+
+async def build_letter(cv_text, job_text, regenerate=False):
+    """
+    Returns (letter_content, pdf_bytes, cache_status) for a CV and job
+    description, serving from the letter cache unless `regenerate` is set.
+    """
+    cache_key = letter_cache_key(cv_text, job_text)
+    cached, cache_status = await lookup_cached_letter(cache_key, regenerate)
+
+    if cached:
+        letter_content, pdf_bytes = cached
+    else:
+        letter_content = await generate_cover_letter(cv=cv_text, job=job_text)
+        pdf_bytes = None
+
+    if pdf_bytes is None:
+        pdf_bytes = await render_letter_pdf(letter_content)
+
+    if not cached:
+        await cache_letter(cache_key, letter_content, pdf_bytes)
+
+    return letter_content, pdf_bytes, cache_status
+
+
+async def render_letter_pdf(letter_content):
+    return await pdf_pool.run(convert_text_to_pdf, letter_content)
+
+
+def letter_pdf_key(user_id, letter_id):
+    return f"letter:pdf:{user_id}:{letter_id}"
+
+
+async def store_letter_pdf(user_id, pdf_bytes):
+    """Stores a rendered letter for later download and returns its id."""
+    letter_id = str(uuid.uuid4())
+    await redis_client.setex(
+        letter_pdf_key(user_id, letter_id), LETTER_PDF_TTL, pdf_bytes
+    )
+    return letter_id
+
+
+async def get_letter_pdf(user_id, letter_id):
+    return await redis_client.get(letter_pdf_key(user_id, letter_id))
+
+
+def format_sse(event, data):
+    """Formats a single Server-Sent Events message with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def letter_event_stream(user_id, cv_text, job_text, cache_key, cached=None):
+    """
+    Streams the letter as SSE `token` events, then renders the PDF and sends a
+    final `done` event pointing at the downloadable file. A cache hit is sent
+    as a single `token` event.
+    """
+    try:
+        if cached:
+            letter_content, pdf_bytes = cached
+            yield format_sse("token", {"text": letter_content})
+        else:
+            chunks = []
+            async for delta in stream_cover_letter(cv=cv_text, job=job_text):
+                chunks.append(delta)
+                yield format_sse("token", {"text": delta})
+            letter_content, pdf_bytes = "".join(chunks), None
+
+        if pdf_bytes is None:
+            pdf_bytes = await render_letter_pdf(letter_content)
+        if not cached:
+            await cache_letter(cache_key, letter_content, pdf_bytes)
+
+        letter_id = await store_letter_pdf(user_id, pdf_bytes)
+
+        yield format_sse(
+            "done",
+            {"letter_id": letter_id, "pdf_url": f"/letter/pdf/{letter_id}"},
+        )
+    except Exception as e:
+        logger.log_exception(e)
+        yield format_sse("error", {"errors": "An error occurred. Try again later!"})
+
+
+async def letter_zip_stream(cv_text, job_descs, regenerate=False, section_index=None):
+    """
+    Generates one letter per job description, at most LETTER_BATCH_CONCURRENCY
+    at a time, and streams them as a ZIP archive in completion order. Failed
+    items are listed in `errors.json` at the end of the archive.
+
+    With a `section_index`, each letter gets the CV sections most relevant to
+    its job description instead of `cv_text`.
+    """
+    semaphore = asyncio.Semaphore(LETTER_BATCH_CONCURRENCY)
+
+    async def build(index, job_text):
+        async with semaphore:
+            try:
+                letter_cv_text = cv_text
+                if section_index is not None:
+                    letter_cv_text = await run_in_threadpool(
+                        select_for_prompt, section_index, job_text
+                    )
+
+                _, pdf_bytes, _ = await build_letter(
+                    letter_cv_text, job_text, regenerate
+                )
+                return index, pdf_bytes
+            except Exception as e:
+                logger.log_exception(f"Batch letter {index} failed: {e}")
+                return index, None
+
+    tasks = [
+        asyncio.create_task(build(index, job_text))
+        for index, job_text in enumerate(job_descs, start=1)
+    ]
+    buffer = ZipStreamBuffer()
+    failed = []
+
+    try:
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            for next_done in asyncio.as_completed(tasks):
+                index, pdf_bytes = await next_done
+                if pdf_bytes is None:
+                    failed.append(index)
+                    continue
+
+                archive.writestr(f"cover_letter_{index:02d}.pdf", pdf_bytes)
+                yield buffer.drain()
+
+            if failed:
+                archive.writestr(
+                    "errors.json",
+                    json.dumps(
+                        {
+                            "failed": sorted(failed),
+                            "errors": "An error occurred. Try again later!",
+                        }
+                    ),
+                )
+
+        yield buffer.drain()
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,87 @@
+import hashlib
+import time
+from config import (
+    OPENAI_LETTER_MODEL,
+    LETTER_CACHE_TTL,
+    LETTER_CACHE_MAX_ENTRIES,
+    LETTER_CACHE_MAX_PDF_BYTES,
+)
+from prompts import generate_letter_prompt
+from helpers.logger import AppLogger
+from services.redis_client import redis_client
+
+logger = AppLogger(log_file="app.log")
+
+LETTER_CACHE_INDEX_KEY = "letter:cache:index"
+
+
+def normalize_text(text):
+    """Collapses whitespace so cosmetic differences map to the same cache entry."""
+    return " ".join(text.split())
+
+
+def letter_cache_key(cv_text, job_text):
+    """
+    Content-addressed key over the normalized CV, the normalized job
+    description, the prompt and the model, so a prompt or model change never
+    serves a stale letter.
+    """
+    digest = hashlib.sha256()
+    for part in (
+        generate_letter_prompt,
+        OPENAI_LETTER_MODEL,
+        normalize_text(cv_text),
+        normalize_text(job_text),
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return f"letter:cache:{digest.hexdigest()}"
+
+
+async def get_cached_letter(cache_key):
+    """Returns a cached (letter_text, pdf_bytes or None) tuple, or None on a miss."""
+    try:
+        entry = await redis_client.hgetall(cache_key)
+        if not entry:
+            return None
+
+        await redis_client.zadd(LETTER_CACHE_INDEX_KEY, {cache_key: time.time()})
+        return entry[b"text"].decode("utf-8"), entry.get(b"pdf")
+    except Exception as e:
+        logger.log_exception(f"Letter cache lookup failed: {e}")
+        return None
+
+
+async def lookup_cached_letter(cache_key, regenerate=False):
+    """Returns the cached letter (or None) and the cache outcome: HIT, MISS or BYPASS."""
+    if regenerate:
+        return None, "BYPASS"
+
+    cached = await get_cached_letter(cache_key)
+    return cached, "HIT" if cached else "MISS"
+
+
+async def cache_letter(cache_key, letter_text, pdf_bytes=None):
+    """
+    Stores a generated letter with a TTL. The index sorted set tracks last use
+    so the least recently used entries are evicted past LETTER_CACHE_MAX_ENTRIES.
+    """
+    entry = {"text": letter_text}
+    if pdf_bytes is not None and len(pdf_bytes) <= LETTER_CACHE_MAX_PDF_BYTES:
+        entry["pdf"] = pdf_bytes
+
+    try:
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.delete(cache_key)
+            pipe.hset(cache_key, mapping=entry)
+            pipe.expire(cache_key, LETTER_CACHE_TTL)
+            pipe.zadd(LETTER_CACHE_INDEX_KEY, {cache_key: time.time()})
+            pipe.zcard(LETTER_CACHE_INDEX_KEY)
+            results = await pipe.execute()
+
+        overflow = results[-1] - LETTER_CACHE_MAX_ENTRIES
+        if overflow > 0:
+            evicted = await redis_client.zpopmin(LETTER_CACHE_INDEX_KEY, overflow)
+            await redis_client.delete(*[key for key, _ in evicted])
+    except Exception as e:
+        logger.log_exception(f"Letter cache store failed: {e}")
@@ -0,0 +1,148 @@
+import time
+import uuid
+from fastapi import HTTPException
+from config import LETTER_JOB_TTL, LETTER_JOB_MAX_ATTEMPTS
+from database import async_session_maker
+from helpers.logger import AppLogger
+from services.letter import get_selected_cv, prepare_cv_text, build_letter
+from services.redis_client import redis_client
+
+logger = AppLogger(log_file="worker.log", logger_name="letter_worker")
+
+LETTER_JOBS_QUEUE_KEY = "letter:jobs:queue"
+
+
+def letter_job_key(job_id):
+    return f"letter:job:{job_id}"
+
+
+def processing_queue_key(worker_id):
+    return f"letter:jobs:processing:{worker_id}"
+
+
+async def enqueue_letter_job(
+    user, cv_id, job_desc, regenerate=False, select_sections=False
+):
+    """Stores a queued letter job and pushes it onto the work queue."""
+    job_id = str(uuid.uuid4())
+    job_key = letter_job_key(job_id)
+
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.hset(
+            job_key,
+            mapping={
+                "status": "queued",
+                "user_id": user["id"],
+                "cv_id": str(cv_id),
+                "job_desc": job_desc,
+                "regenerate": int(regenerate),
+                "select_sections": int(select_sections),
+                "attempts": 0,
+                "created_at": time.time(),
+            },
+        )
+        pipe.expire(job_key, LETTER_JOB_TTL)
+        pipe.lpush(LETTER_JOBS_QUEUE_KEY, job_id)
+        await pipe.execute()
+
+    return job_id
+
+
+async def get_letter_job(user_id, job_id):
+    """Returns the job owned by `user_id`, or None. The `pdf` field stays as bytes."""
+    job = await redis_client.hgetall(letter_job_key(job_id))
+
+    if not job or int(job[b"user_id"]) != user_id:
+        return None
+
+    return {
+        field.decode(): value if field == b"pdf" else value.decode()
+        for field, value in job.items()
+    }
+
+
+async def fail_letter_job(job_key, error):
+    await redis_client.hset(job_key, mapping={"status": "failed", "error": error})
+
+
+async def run_letter_job(job_id):
+    """
+    Runs the CV text → LLM → PDF pipeline for one job and records the outcome.
+    Unexpected failures are requeued until LETTER_JOB_MAX_ATTEMPTS is reached.
+    """
+    job_key = letter_job_key(job_id)
+    job = await redis_client.hgetall(job_key)
+
+    if not job:
+        logger.log_warning(f"Letter job {job_id} expired before it was processed")
+        return
+
+    attempts = await redis_client.hincrby(job_key, "attempts", 1)
+    await redis_client.hset(job_key, "status", "running")
+
+    try:
+        async with async_session_maker() as session:
+            selected_cv = await get_selected_cv(
+                session, int(job[b"user_id"]), uuid.UUID(job[b"cv_id"].decode())
+            )
+            job_text = job[b"job_desc"].decode()
+            cv_text = await prepare_cv_text(
+                session,
+                selected_cv,
+                job_text,
+                bool(int(job.get(b"select_sections", 0))),
+            )
+
+        _, pdf_bytes, _ = await build_letter(
+            cv_text, job_text, bool(int(job[b"regenerate"]))
+        )
+
+        await redis_client.hset(job_key, mapping={"status": "done", "pdf": pdf_bytes})
+        logger.log_info(f"Letter job {job_id} done")
+    except HTTPException as e:
+        await fail_letter_job(job_key, e.detail)
+    except Exception as e:
+        logger.log_exception(f"Letter job {job_id} attempt {attempts} failed: {e}")
+
+        if attempts >= LETTER_JOB_MAX_ATTEMPTS:
+            await fail_letter_job(job_key, "An error occurred. Try again later!")
+        else:
+            await redis_client.hset(job_key, "status", "queued")
+            await redis_client.lpush(LETTER_JOBS_QUEUE_KEY, job_id)
+
+
+async def requeue_orphaned_jobs(worker_id):
+    """
+    Moves jobs left in this worker's processing list by a previous crash or
+    restart back onto the queue.
+    """
+    processing_key = processing_queue_key(worker_id)
+    requeued = 0
+
+    while await redis_client.lmove(
+        processing_key, LETTER_JOBS_QUEUE_KEY, "RIGHT", "RIGHT"
+    ):
+        requeued += 1
+
+    if requeued:
+        logger.log_warning(f"Requeued {requeued} orphaned letter job(s)")
+
+
+async def process_letter_jobs(worker_id, poll_timeout=5):
+    """
+    Consumes the queue forever. Each job id is atomically moved into the
+    worker's processing list while it runs, so it survives a worker crash.
+    """
+    processing_key = processing_queue_key(worker_id)
+
+    while True:
+        job_id = await redis_client.blmove(
+            LETTER_JOBS_QUEUE_KEY, processing_key, poll_timeout, "RIGHT", "LEFT"
+        )
+        if job_id is None:
+            continue
+
+        try:
+            await run_letter_job(job_id.decode())
+        finally:
+            await redis_client.lrem(processing_key, 1, job_id)
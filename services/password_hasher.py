@@ -0,0 +1,87 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+from config import BCRYPT_POOL_SIZE, BCRYPT_MAX_PENDING
+from helpers.auth import hash_password, compare_password
+from helpers.logger import AppLogger
+from helpers.metrics import (
+    PASSWORD_HASH_PENDING,
+    PASSWORD_HASH_QUEUE_WAIT,
+    PASSWORD_HASH_DURATION,
+    PASSWORD_HASH_REJECTED,
+)
+
+logger = AppLogger(log_file="app.log")
+
+
+class PasswordHasher:
+    """
+    Dedicated thread pool for bcrypt, which releases the GIL while hashing.
+
+    At most `max_workers` calls run at once; the rest wait on a semaphore, and
+    beyond `max_pending` waiting calls requests fail fast with 503 instead of
+    piling up. Started from the app lifespan; until then calls go to the
+    shared threadpool.
+    """
+
+    def __init__(self, max_workers=BCRYPT_POOL_SIZE, max_pending=BCRYPT_MAX_PENDING):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.executor = None
+        self.semaphore = None
+        self.pending = 0
+
+    def start(self):
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="bcrypt"
+        )
+        self.semaphore = asyncio.Semaphore(self.max_workers)
+        logger.log_info(
+            f"Password hashing pool started with {self.max_workers} workers"
+        )
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+            self.semaphore = None
+
+    async def run(self, fn, *args):
+        if self.executor is None:
+            return await run_in_threadpool(fn, *args)
+
+        if self.pending >= self.max_workers + self.max_pending:
+            PASSWORD_HASH_REJECTED.inc()
+            raise HTTPException(
+                status_code=503, detail="Server busy, please try again shortly"
+            )
+
+        self.pending += 1
+        PASSWORD_HASH_PENDING.inc()
+        queued = time.perf_counter()
+        try:
+            async with self.semaphore:
+                started = time.perf_counter()
+                PASSWORD_HASH_QUEUE_WAIT.observe(started - queued)
+                try:
+                    return await asyncio.get_running_loop().run_in_executor(
+                        self.executor, fn, *args
+                    )
+                finally:
+                    PASSWORD_HASH_DURATION.labels(operation=fn.__name__).observe(
+                        time.perf_counter() - started
+                    )
+        finally:
+            self.pending -= 1
+            PASSWORD_HASH_PENDING.dec()
+
+    async def hash(self, password):
+        return await self.run(hash_password, password)
+
+    async def verify(self, password, password_hash):
+        return await self.run(compare_password, password, password_hash)
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,101 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+from config import PDF_POOL_SIZE, PDF_TASK_TIMEOUT
+from helpers.logger import AppLogger
+from helpers.metrics import PDF_POOL_PENDING_TASKS, PDF_POOL_TASK_DURATION
+from helpers.pdf_renderer import get_pdf_renderer
+
+logger = AppLogger(log_file="app.log")
+
+
+class PdfProcessPool:
+    """
+    Process pool for CPU-bound PDF work (PyMuPDF extraction, FPDF rendering).
+
+    Started from the app lifespan so each worker process is spawned and warmed
+    up once. Without a running pool (or with `max_workers=0`), tasks fall back
+    to the threadpool.
+    """
+
+    def __init__(self, max_workers=PDF_POOL_SIZE, task_timeout=PDF_TASK_TIMEOUT):
+        self.max_workers = max_workers
+        self.task_timeout = task_timeout
+        self.executor = None
+
+    def start(self):
+        if self.max_workers == 0:
+            return
+
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=get_pdf_renderer,
+        )
+        # Workers are spawned on demand; one no-op task each spawns and warms
+        # them all now instead of on the first requests.
+        for _ in range(self.max_workers):
+            self.executor.submit(int)
+        logger.log_info(f"PDF process pool started with {self.max_workers} workers")
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+
+    def restart(self, terminate=False):
+        """
+        Replaces the executor with a fresh one. With `terminate`, the old
+        workers are killed instead of left to finish their current tasks.
+        """
+        executor = self.executor
+        processes = []
+        if terminate and executor is not None:
+            # shutdown() drops the process table, so collect the workers first
+            processes = list((executor._processes or {}).values())
+
+        self.start()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.terminate()
+
+    async def run(self, fn, *args):
+        """
+        Runs `fn(*args)` in a worker process, raising 504 after `task_timeout`.
+
+        A timed out task cannot be interrupted inside its worker, so the pool
+        is recycled: the old workers are terminated and other tasks still
+        running on them fail with BrokenProcessPool.
+        """
+        if self.executor is None:
+            return await run_in_threadpool(fn, *args)
+
+        executor = self.executor
+        PDF_POOL_PENDING_TASKS.inc()
+        start = time.perf_counter()
+        try:
+            future = asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+            return await asyncio.wait_for(future, self.task_timeout)
+        except asyncio.TimeoutError:
+            logger.log_error(f"PDF task {fn.__name__} timed out")
+            if self.executor is executor:
+                self.restart(terminate=True)
+            raise HTTPException(status_code=504, detail="PDF processing timed out")
+        except BrokenProcessPool:
+            logger.log_error(f"PDF process pool broke while running {fn.__name__}")
+            if self.executor is executor:
+                self.restart()
+            raise
+        finally:
+            PDF_POOL_PENDING_TASKS.dec()
+            PDF_POOL_TASK_DURATION.labels(task=fn.__name__).observe(
+                time.perf_counter() - start
+            )
+
+
+pdf_pool = PdfProcessPool()
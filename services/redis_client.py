@@ -0,0 +1,4 @@
+import redis.asyncio as redis
+from config import REDIS_URL
+
+redis_client = redis.from_url(REDIS_URL)
@@ -1,31 +1,125 @@
+import threading
+import time
+from contextlib import contextmanager
+from xml.sax.saxutils import escape
 import boto3
-from config import AWS_ACCESS_KEY_ID, AWS_REGION, AWS_SECRET_ACCESS_KEY, S3_BUCKET_NAME
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from config import (
+    AWS_ACCESS_KEY_ID,
+    AWS_REGION,
+    AWS_SECRET_ACCESS_KEY,
+    S3_BUCKET_NAME,
+    S3_MAX_POOL_CONNECTIONS,
+    S3_RETRY_MODE,
+    S3_MAX_ATTEMPTS,
+    S3_CONNECT_TIMEOUT,
+    S3_READ_TIMEOUT,
+    STORAGE_MULTIPART_CHUNK_SIZE,
+)
 from botocore.exceptions import ClientError
 from helpers.logger import AppLogger
+from helpers.metrics import S3_REQUEST_DURATION, S3_REQUEST_ERRORS
 
 logger = AppLogger(log_file="s3.log", logger_name="s3_service")
 
+# S3 DeleteObjects accepts at most 1000 keys per request
+S3_DELETE_BATCH_SIZE = 1000
 
-def get_s3_client():
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+
+def create_s3_client():
     return boto3.client(
         "s3",
         aws_access_key_id=AWS_ACCESS_KEY_ID,
         aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
         region_name=AWS_REGION,
+        config=Config(
+            max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+            retries={"mode": S3_RETRY_MODE, "max_attempts": S3_MAX_ATTEMPTS},
+            connect_timeout=S3_CONNECT_TIMEOUT,
+            read_timeout=S3_READ_TIMEOUT,
+        ),
     )
 
 
+def get_s3_client():
+    """
+    Returns the process-wide S3 client. boto3 clients are thread-safe, but
+    creating one is not, so the first call is guarded by a lock.
+    """
+    global _s3_client
+
+    if _s3_client is None:
+        with _s3_client_lock:
+            if _s3_client is None:
+                _s3_client = create_s3_client()
+
+    return _s3_client
+
+
+def close_s3_client():
+    global _s3_client
+
+    with _s3_client_lock:
+        if _s3_client is not None:
+            _s3_client.close()
+            _s3_client = None
+
+
+@contextmanager
+def track_s3_call(operation):
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        S3_REQUEST_ERRORS.labels(operation=operation).inc()
+        raise
+    finally:
+        S3_REQUEST_DURATION.labels(operation=operation).observe(
+            time.perf_counter() - start
+        )
+
+
 def upload_to_s3(file_bytes: bytes, key: str, content_type: str, tags: str):
     s3 = get_s3_client()
     try:
-        s3.put_object(
-            Bucket=S3_BUCKET_NAME,
-            Key=key,
-            Body=file_bytes,
-            ContentType=content_type,
-            Tagging=tags,
-        )
+        with track_s3_call("put_object"):
+            s3.put_object(
+                Bucket=S3_BUCKET_NAME,
+                Key=key,
+                Body=file_bytes,
+                ContentType=content_type,
+                Tagging=tags,
+            )
+
+    except ClientError as e:
+        logger.log_error(f"Failed to upload S3 object '{key}': {e}")
+        return False
 
+    return True
+
+
+def upload_fileobj_to_s3(fileobj, key: str, content_type: str, tags: str):
+    """
+    Streams a file object to S3 without reading it into memory. Objects over
+    STORAGE_MULTIPART_CHUNK_SIZE are sent as a multipart upload.
+    """
+    s3 = get_s3_client()
+    try:
+        with track_s3_call("upload_fileobj"):
+            s3.upload_fileobj(
+                fileobj,
+                S3_BUCKET_NAME,
+                key,
+                ExtraArgs={"ContentType": content_type, "Tagging": tags},
+                Config=TransferConfig(
+                    multipart_threshold=STORAGE_MULTIPART_CHUNK_SIZE,
+                    multipart_chunksize=STORAGE_MULTIPART_CHUNK_SIZE,
+                ),
+            )
     except ClientError as e:
         logger.log_error(f"Failed to upload S3 object '{key}': {e}")
         return False
@@ -36,10 +130,11 @@ def upload_to_s3(file_bytes: bytes, key: str, content_type: str, tags: str):
 def delete_from_s3(key):
     s3 = get_s3_client()
     try:
-        s3.delete_object(
-            Bucket=S3_BUCKET_NAME,
-            Key=key,
-        )
+        with track_s3_call("delete_object"):
+            s3.delete_object(
+                Bucket=S3_BUCKET_NAME,
+                Key=key,
+            )
     except ClientError as e:
         logger.log_error(f"Failed to delete S3 object '{key}': {e}")
         return False
@@ -50,9 +145,89 @@ def delete_from_s3(key):
 def get_from_s3(key):
     s3 = get_s3_client()
     try:
-        response = s3.get_object(Bucket=S3_BUCKET_NAME, Key=key)
-        pdf_data = response["Body"].read()
+        with track_s3_call("get_object"):
+            response = s3.get_object(Bucket=S3_BUCKET_NAME, Key=key)
+            pdf_data = response["Body"].read()
         return pdf_data
     except ClientError as e:
         logger.log_error(f"Failed to retrieve S3 object '{key}': {e}")
         return None
+
+
+def open_s3_object(key):
+    """Returns the streaming body of an S3 object, or None if it can't be read."""
+    s3 = get_s3_client()
+    try:
+        with track_s3_call("get_object"):
+            return s3.get_object(Bucket=S3_BUCKET_NAME, Key=key)["Body"]
+    except ClientError as e:
+        logger.log_error(f"Failed to retrieve S3 object '{key}': {e}")
+        return None
+
+
+def delete_many_from_s3(keys):
+    """Deletes objects in batches of up to 1000 keys and returns the keys that failed."""
+    s3 = get_s3_client()
+    failed = []
+
+    for start in range(0, len(keys), S3_DELETE_BATCH_SIZE):
+        end = start + S3_DELETE_BATCH_SIZE
+        batch = keys[start:end]
+        try:
+            with track_s3_call("delete_objects"):
+                response = s3.delete_objects(
+                    Bucket=S3_BUCKET_NAME,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+                )
+        except ClientError as e:
+            logger.log_error(f"Failed to delete {len(batch)} S3 objects: {e}")
+            failed.extend(batch)
+            continue
+
+        for error in response.get("Errors", []):
+            logger.log_error(
+                f"Failed to delete S3 object '{error['Key']}': {error.get('Message')}"
+            )
+            failed.append(error["Key"])
+
+    return failed
+
+
+def get_s3_range(key, length):
+    """Returns the first `length` bytes of an S3 object, or None if it can't be read."""
+    s3 = get_s3_client()
+    try:
+        with track_s3_call("get_object_range"):
+            response = s3.get_object(
+                Bucket=S3_BUCKET_NAME, Key=key, Range=f"bytes=0-{length - 1}"
+            )
+            return response["Body"].read()
+    except ClientError as e:
+        logger.log_error(f"Failed to retrieve S3 object '{key}': {e}")
+        return None
+
+
+def presign_s3_post(key, content_type, max_bytes, expires_in, tags=None):
+    """
+    Returns the URL and form fields for a browser upload straight to S3. The
+    policy pins the key, content type, tags and allowed size range.
+    """
+    fields = {"Content-Type": content_type}
+    if tags:
+        tag_set = "".join(
+            f"<Tag><Key>{escape(name)}</Key><Value>{escape(value)}</Value></Tag>"
+            for name, value in tags.items()
+        )
+        fields["tagging"] = f"<Tagging><TagSet>{tag_set}</TagSet></Tagging>"
+
+    conditions = [{name: value} for name, value in fields.items()]
+    conditions.append(["content-length-range", 1, max_bytes])
+
+    with track_s3_call("presign_post"):
+        return get_s3_client().generate_presigned_post(
+            Bucket=S3_BUCKET_NAME,
+            Key=key,
+            Fields=fields,
+            Conditions=conditions,
+            ExpiresIn=expires_in,
+        )
@@ -0,0 +1,132 @@
+from starlette.concurrency import run_in_threadpool
+from config import STORAGE_CHUNK_SIZE, CV_CACHE_DIR, CV_CACHE_MAX_BYTES
+from helpers.disk_cache import DiskLRUCache
+from helpers.logger import AppLogger
+from services.s3 import (
+    upload_to_s3,
+    upload_fileobj_to_s3,
+    get_from_s3,
+    open_s3_object,
+    get_s3_range,
+    presign_s3_post,
+    delete_from_s3,
+    delete_many_from_s3,
+)
+
+logger = AppLogger(log_file="app.log")
+
+
+class S3Storage:
+    """
+    Async interface to the CV object store. Calls go through the shared,
+    pooled boto3 client on the threadpool, so S3 round trips never block the
+    event loop.
+    """
+
+    async def put(self, key, body, content_type, tags=""):
+        return await run_in_threadpool(upload_to_s3, body, key, content_type, tags)
+
+    async def put_file(self, key, fileobj, content_type, tags=""):
+        return await run_in_threadpool(
+            upload_fileobj_to_s3, fileobj, key, content_type, tags
+        )
+
+    async def get(self, key):
+        return await run_in_threadpool(get_from_s3, key)
+
+    async def get_range(self, key, length):
+        return await run_in_threadpool(get_s3_range, key, length)
+
+    async def presign_upload(self, key, content_type, max_bytes, expires_in, tags=None):
+        return await run_in_threadpool(
+            presign_s3_post, key, content_type, max_bytes, expires_in, tags
+        )
+
+    async def iter_chunks(self, key, chunk_size=STORAGE_CHUNK_SIZE):
+        """Streams an object in chunks; yields nothing if it can't be read."""
+        body = await run_in_threadpool(open_s3_object, key)
+        if body is None:
+            return
+
+        try:
+            while chunk := await run_in_threadpool(body.read, chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
+    async def delete(self, key):
+        return await run_in_threadpool(delete_from_s3, key)
+
+    async def delete_many(self, keys):
+        return await run_in_threadpool(delete_many_from_s3, list(keys))
+
+
+class CachedStorage:
+    """
+    Read-through disk cache in front of a storage backend. CV objects are
+    immutable once uploaded (keys are UUIDs), so cached entries never go
+    stale; they are only invalidated when the object is deleted.
+
+    The cache is best effort: a local cache failure is logged and treated as
+    a miss or a skipped fill, never raised to the caller.
+    """
+
+    def __init__(self, backend, cache):
+        self.backend = backend
+        self.cache = cache
+
+    async def call_cache(self, name, *args):
+        try:
+            return await run_in_threadpool(getattr(self.cache, name), *args)
+        except Exception as e:
+            logger.log_exception(f"CV cache {name} failed: {e}")
+            return None
+
+    async def put(self, key, body, content_type, tags=""):
+        uploaded = await self.backend.put(key, body, content_type, tags)
+        if uploaded:
+            await self.call_cache("put", key, body)
+        return uploaded
+
+    async def put_file(self, key, fileobj, content_type, tags=""):
+        uploaded = await self.backend.put_file(key, fileobj, content_type, tags)
+        if uploaded:
+            fileobj.seek(0)
+            await self.call_cache("put_file", key, fileobj)
+        return uploaded
+
+    async def get(self, key):
+        data = await self.call_cache("get", key)
+        if data is not None:
+            return data
+
+        data = await self.backend.get(key)
+        if data:
+            await self.call_cache("put", key, data)
+        return data
+
+    async def get_range(self, key, length):
+        return await self.backend.get_range(key, length)
+
+    async def presign_upload(self, key, content_type, max_bytes, expires_in, tags=None):
+        return await self.backend.presign_upload(
+            key, content_type, max_bytes, expires_in, tags
+        )
+
+    def iter_chunks(self, key, chunk_size=STORAGE_CHUNK_SIZE):
+        return self.backend.iter_chunks(key, chunk_size)
+
+    async def delete(self, key):
+        await self.call_cache("delete", key)
+        return await self.backend.delete(key)
+
+    async def delete_many(self, keys):
+        keys = list(keys)
+        for key in keys:
+            await self.call_cache("delete", key)
+        return await self.backend.delete_many(keys)
+
+
+storage = S3Storage()
+if CV_CACHE_MAX_BYTES > 0:
+    storage = CachedStorage(storage, DiskLRUCache(CV_CACHE_DIR, CV_CACHE_MAX_BYTES))
@@ -0,0 +1,118 @@
+import hashlib
+from datetime import timedelta
+from sqlmodel import delete
+from config import TOKEN_STORE_BACKEND
+from database import async_session_maker
+from helpers.logger import AppLogger
+from models.user import OneTimeToken, utc_now
+from services.redis_client import redis_client
+
+logger = AppLogger(log_file="app.log")
+
+VERIFY_EMAIL = "verify"
+RESET_PASSWORD = "reset"
+
+
+def token_digest(token):
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class RedisTokenStore:
+    """
+    One-time tokens as Redis keys with a TTL, so they expire on their own.
+    Only the latest token issued per email and purpose stays valid.
+    """
+
+    def token_key(self, purpose, digest):
+        return f"token:{purpose}:{digest}"
+
+    def latest_key(self, purpose, email):
+        return f"token:{purpose}:latest:{email}"
+
+    async def issue(self, purpose, email, token, ttl):
+        digest = token_digest(token)
+
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.setex(self.token_key(purpose, digest), ttl, email)
+            pipe.set(self.latest_key(purpose, email), digest, ex=ttl, get=True)
+            _, previous = await pipe.execute()
+
+        if previous and previous.decode() != digest:
+            await redis_client.delete(self.token_key(purpose, previous.decode()))
+
+    async def consume(self, purpose, email, token):
+        """Atomically deletes the token; True if it was valid for `email`."""
+        stored = await redis_client.getdel(self.token_key(purpose, token_digest(token)))
+        return stored is not None and stored.decode() == email
+
+
+class DatabaseTokenStore:
+    """One-time tokens in the one_time_tokens table, consumed with DELETE ... RETURNING."""
+
+    async def issue(self, purpose, email, token, ttl):
+        async with async_session_maker() as session:
+            await session.execute(
+                delete(OneTimeToken).where(
+                    ((OneTimeToken.purpose == purpose) & (OneTimeToken.email == email))
+                    | (OneTimeToken.expires_at < utc_now())
+                )
+            )
+            session.add(
+                OneTimeToken(
+                    token_hash=token_digest(token),
+                    purpose=purpose,
+                    email=email,
+                    expires_at=utc_now() + timedelta(seconds=ttl),
+                )
+            )
+            await session.commit()
+
+    async def consume(self, purpose, email, token):
+        async with async_session_maker() as session:
+            result = await session.execute(
+                delete(OneTimeToken)
+                .where(
+                    OneTimeToken.token_hash == token_digest(token),
+                    OneTimeToken.purpose == purpose,
+                    OneTimeToken.email == email,
+                    OneTimeToken.expires_at > utc_now(),
+                )
+                .returning(OneTimeToken.token_hash)
+            )
+            consumed = result.first() is not None
+            await session.commit()
+
+        return consumed
+
+
+class FallbackTokenStore:
+    """
+    Issues tokens in `primary` and switches to `fallback` when it fails.
+    Consuming checks both, so tokens issued during an outage stay usable.
+    """
+
+    def __init__(self, primary, fallback):
+        self.primary = primary
+        self.fallback = fallback
+
+    async def issue(self, purpose, email, token, ttl):
+        try:
+            await self.primary.issue(purpose, email, token, ttl)
+        except Exception as e:
+            logger.log_exception(f"Token store issue failed, using fallback: {e}")
+            await self.fallback.issue(purpose, email, token, ttl)
+
+    async def consume(self, purpose, email, token):
+        try:
+            if await self.primary.consume(purpose, email, token):
+                return True
+        except Exception as e:
+            logger.log_exception(f"Token store consume failed, using fallback: {e}")
+
+        return await self.fallback.consume(purpose, email, token)
+
+
+if TOKEN_STORE_BACKEND == "database":
+    token_store = DatabaseTokenStore()
+else:
+    token_store = FallbackTokenStore(RedisTokenStore(), DatabaseTokenStore())
@@ -0,0 +1,90 @@
+import json
+import time
+from collections import OrderedDict
+from sqlmodel import select
+from config import USER_CACHE_TTL, USER_CACHE_LOCAL_TTL, USER_CACHE_LOCAL_MAX_ENTRIES
+from helpers.logger import AppLogger
+from models.user import User
+from services.redis_client import redis_client
+
+logger = AppLogger(log_file="app.log")
+
+# user_id -> (expires_at, principal)
+local_user_cache = OrderedDict()
+
+
+def user_cache_key(user_id):
+    return f"user:principal:{user_id}"
+
+
+def to_principal(user):
+    return {
+        "id": user.id,
+        "email": user.email,
+        "role": user.role,
+        "is_verified": user.is_verified,
+    }
+
+
+def remember_locally(principal):
+    local_user_cache[principal["id"]] = (
+        time.monotonic() + USER_CACHE_LOCAL_TTL,
+        principal,
+    )
+    local_user_cache.move_to_end(principal["id"])
+    while len(local_user_cache) > USER_CACHE_LOCAL_MAX_ENTRIES:
+        local_user_cache.popitem(last=False)
+
+
+async def get_cached_user(user_id):
+    """Returns the cached principal from this process or Redis, or None."""
+    entry = local_user_cache.get(user_id)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+
+    try:
+        cached = await redis_client.get(user_cache_key(user_id))
+    except Exception as e:
+        logger.log_exception(f"User cache lookup failed: {e}")
+        return None
+
+    if cached is None:
+        return None
+
+    principal = json.loads(cached)
+    remember_locally(principal)
+    return principal
+
+
+async def cache_user(principal):
+    remember_locally(principal)
+    try:
+        await redis_client.setex(
+            user_cache_key(principal["id"]), USER_CACHE_TTL, json.dumps(principal)
+        )
+    except Exception as e:
+        logger.log_exception(f"User cache store failed: {e}")
+
+
+async def invalidate_user(user_id):
+    """Drops a cached principal after the user is verified, reset or deleted."""
+    local_user_cache.pop(user_id, None)
+    try:
+        await redis_client.delete(user_cache_key(user_id))
+    except Exception as e:
+        logger.log_exception(f"User cache invalidation failed for {user_id}: {e}")
+
+
+async def load_principal(session, user_id):
+    """Returns the principal for `user_id`, from the cache or the database, or None."""
+    principal = await get_cached_user(user_id)
+    if principal is not None:
+        return principal
+
+    user = (await session.exec(select(User).where(User.id == user_id))).first()
+    if user is None:
+        return None
+
+    principal = to_principal(user)
+    await cache_user(principal)
+    return principal
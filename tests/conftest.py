@@ -3,18 +3,31 @@ import sys
 import os
 import uuid
 from unittest.mock import MagicMock
-from models.user import User, UserCV
+from datetime import timedelta
+from models.user import User, UserCV, OneTimeToken, utc_now
 from helpers.auth import hash_password, sign_jwt
 from helpers.email_sender import EmailSender
 from fastapi.testclient import TestClient
 from sqlmodel import Session, delete
 from database import create_db_and_tables, engine
 from main import app
-from config import RESET_PASSWORD_TOKEN
+from services.pdf_pool import pdf_pool
+from config import RESET_PASSWORD_TOKEN, ACCOUNT_CONFIRMATION_TOKEN
+from services.token_store import token_digest, VERIFY_EMAIL, RESET_PASSWORD
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 
+def one_time_token(purpose, email, token, ttl):
+    """Stores a token in the token store's database fallback."""
+    return OneTimeToken(
+        token_hash=token_digest(token),
+        purpose=purpose,
+        email=email,
+        expires_at=utc_now() + timedelta(seconds=ttl),
+    )
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_database():
     """Ensures the real database is set up before tests start."""
@@ -22,10 +35,18 @@ def setup_database():
     create_db_and_tables()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Provides a FastAPI test client."""
-    return TestClient(app)
+    """
+    Provides a FastAPI test client.
+
+    The client is entered once per session so every request runs on the same
+    event loop as the app's shared async clients (Redis, OpenAI). PDF work
+    stays in-process so tests can patch the PDF helpers.
+    """
+    pdf_pool.max_workers = 0
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture
@@ -46,15 +67,19 @@ def test_user():
     verification_token = sign_jwt({"email": unique_test_email})
     hashed_password = hash_password(test_password)
 
-    user = User(
-        email=unique_test_email,
-        password_hash=hashed_password,
-        verification_token=verification_token,
-    )
+    user = User(email=unique_test_email, password_hash=hashed_password)
 
     try:
         with Session(engine) as session:
             session.add(user)
+            session.add(
+                one_time_token(
+                    VERIFY_EMAIL,
+                    unique_test_email,
+                    verification_token,
+                    ACCOUNT_CONFIRMATION_TOKEN,
+                )
+            )
             session.commit()
             session.refresh(user)
 
@@ -66,6 +91,9 @@ def test_user():
 
     finally:
         with Session(engine) as session:
+            session.exec(
+                delete(OneTimeToken).where(OneTimeToken.email == unique_test_email)
+            )
             session.exec(delete(User).where(User.email == unique_test_email))
             session.commit()
 
@@ -83,12 +111,18 @@ def verified_test_user():
             user = User(
                 email=unique_test_email,
                 password_hash=hashed_password,
-                verification_token="",
-                password_reset_token=password_reset_token,
                 is_verified=True,
             )
 
             session.add(user)
+            session.add(
+                one_time_token(
+                    RESET_PASSWORD,
+                    unique_test_email,
+                    password_reset_token,
+                    RESET_PASSWORD_TOKEN,
+                )
+            )
             session.commit()
             session.refresh(user)
 
@@ -114,5 +148,8 @@ def verified_test_user():
     finally:
         with Session(engine) as session:
             session.exec(delete(UserCV).where(UserCV.user_id == user_data["id"]))
+            session.exec(
+                delete(OneTimeToken).where(OneTimeToken.email == user_data["email"])
+            )
             session.exec(delete(User).where(User.email == user_data["email"]))
             session.commit()
@@ -0,0 +1,101 @@
+from unittest.mock import patch, AsyncMock
+from models.user import UserCV
+from sqlmodel import select, delete, Session
+from database import engine
+from helpers.auth import sign_jwt
+from config import JWT_ACCESS_TOKEN
+
+
+def auth_headers(user):
+    access_token = sign_jwt(
+        {"id": user["id"], "email": user["email"]}, JWT_ACCESS_TOKEN
+    )
+    return {"Authorization": f"Bearer {access_token}"}
+
+
+@patch("services.storage.presign_s3_post")
+def test_create_upload_url(mock_presign, client, verified_test_user):
+    mock_presign.return_value = {"url": "https://bucket.s3", "fields": {"key": "k"}}
+
+    response = client.post(
+        "/cvs/upload-url",
+        json={"filename": "cv.pdf"},
+        headers=auth_headers(verified_test_user),
+    )
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["url"] == "https://bucket.s3"
+    assert data["upload_token"]
+
+
+@patch("routers.cv.store_cv_text_from_storage", new_callable=AsyncMock)
+@patch("services.storage.get_s3_range", return_value=b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+@patch("services.storage.presign_s3_post")
+def test_complete_upload_success(
+    mock_presign, mock_range, mock_store_text, client, verified_test_user
+):
+    mock_presign.return_value = {"url": "https://bucket.s3", "fields": {}}
+    headers = auth_headers(verified_test_user)
+
+    upload_token = client.post(
+        "/cvs/upload-url", json={"filename": "cv.pdf"}, headers=headers
+    ).json()["data"]["upload_token"]
+
+    response = client.post(
+        "/cvs/complete", json={"upload_token": upload_token}, headers=headers
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"message": "CV uploaded successfully"}
+    mock_store_text.assert_awaited_once()
+
+    with Session(engine) as session:
+        stmt = select(UserCV).where(UserCV.user_id == verified_test_user["id"])
+        assert session.exec(stmt).first() is not None
+
+        session.exec(delete(UserCV).where(UserCV.user_id == verified_test_user["id"]))
+        session.commit()
+
+
+@patch("services.storage.delete_from_s3", return_value=True)
+@patch("services.storage.get_s3_range", return_value=b"MZ\x90\x00 not a pdf")
+def test_complete_upload_not_pdf(mock_range, mock_delete, client, verified_test_user):
+    upload_token = sign_jwt(
+        {
+            "purpose": "cv_upload",
+            "user_id": verified_test_user["id"],
+            "cv_id": "6f1c7a1e-2d0b-4c1e-9a3e-7a8f5b2c9d10",
+            "s3_key": "6f1c7a1e-2d0b-4c1e-9a3e-7a8f5b2c9d10.pdf",
+            "original_name": "cv.pdf",
+        }
+    )
+
+    response = client.post(
+        "/cvs/complete",
+        json={"upload_token": upload_token},
+        headers=auth_headers(verified_test_user),
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {"errors": "Uploaded file is not a valid PDF."}
+    mock_delete.assert_called_once_with("6f1c7a1e-2d0b-4c1e-9a3e-7a8f5b2c9d10.pdf")
+
+
+def test_complete_upload_rejects_other_tokens(client, verified_test_user):
+    upload_token = sign_jwt(
+        {
+            "user_id": verified_test_user["id"],
+            "cv_id": "6f1c7a1e-2d0b-4c1e-9a3e-7a8f5b2c9d10",
+            "s3_key": "6f1c7a1e-2d0b-4c1e-9a3e-7a8f5b2c9d10.pdf",
+            "original_name": "cv.pdf",
+        }
+    )
+
+    response = client.post(
+        "/cvs/complete",
+        json={"upload_token": upload_token},
+        headers=auth_headers(verified_test_user),
+    )
+
+    assert response.status_code == 403
@@ -1,12 +1,13 @@
 from helpers.auth import sign_jwt
-from unittest.mock import patch
+from unittest.mock import patch, AsyncMock
 from config import JWT_ACCESS_TOKEN
+from helpers.cv import ExtractionResult
 import pytest
 import uuid
 
 
 @pytest.mark.asyncio
-@patch("routers.letter.get_from_s3")
+@patch("services.storage.get_from_s3")
 async def test_generate_letter_success(mock_s3, client, verified_test_user):
     access_token = sign_jwt(
         {"id": verified_test_user["id"], "email": verified_test_user["email"]},
@@ -91,3 +92,73 @@ async def test_generate_letter_no_cv_in_db(client, verified_test_user):
 
     assert response.status_code == 404
     assert response.json() == {"errors": "CV not found"}
+
+
+@pytest.mark.asyncio
+@patch("services.letter.generate_cover_letter", new_callable=AsyncMock)
+@patch("services.letter.extract_text_from_pdf")
+@patch("services.storage.get_from_s3", return_value=b"%PDF-1.4")
+async def test_generate_letter_cache(
+    mock_s3, mock_extract, mock_generate, client, verified_test_user
+):
+    access_token = sign_jwt(
+        {"id": verified_test_user["id"], "email": verified_test_user["email"]},
+        JWT_ACCESS_TOKEN,
+    )
+    headers = {"Authorization": f"Bearer {access_token}"}
+    mock_extract.return_value = ExtractionResult(f"CV text {uuid.uuid4()}", 1, 1, False)
+    mock_generate.return_value = "Dear Hiring Manager"
+
+    letter_data = {
+        "cv_id": str(verified_test_user["user_cv_id"]),
+        "job_desc": f"{uuid.uuid4()} " * 5,
+    }
+
+    first = client.post("/letter", headers=headers, json=letter_data)
+    second = client.post("/letter", headers=headers, json=letter_data)
+    regenerated = client.post(
+        "/letter?regenerate=true", headers=headers, json=letter_data
+    )
+
+    assert first.headers["x-letter-cache"] == "MISS"
+    assert second.headers["x-letter-cache"] == "HIT"
+    assert second.content == first.content
+    assert regenerated.headers["x-letter-cache"] == "BYPASS"
+    assert mock_generate.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_generate_letter_job(client, verified_test_user):
+    access_token = sign_jwt(
+        {"id": verified_test_user["id"], "email": verified_test_user["email"]},
+        JWT_ACCESS_TOKEN,
+    )
+    headers = {"Authorization": f"Bearer {access_token}", "Prefer": "respond-async"}
+
+    letter_data = {
+        "cv_id": str(verified_test_user["user_cv_id"]),
+        "job_desc": "50charslong" * 10,
+    }
+
+    response = client.post("/letter", headers=headers, json=letter_data)
+
+    assert response.status_code == 202
+    job_id = response.json()["data"]["job_id"]
+
+    status = client.get(f"/letter/jobs/{job_id}", headers=headers)
+    assert status.status_code == 200
+    assert status.json()["data"]["status"] == "queued"
+
+
+@pytest.mark.asyncio
+async def test_get_letter_job_not_found(client, verified_test_user):
+    access_token = sign_jwt(
+        {"id": verified_test_user["id"], "email": verified_test_user["email"]},
+        JWT_ACCESS_TOKEN,
+    )
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    response = client.get(f"/letter/jobs/{uuid.uuid4()}", headers=headers)
+
+    assert response.status_code == 404
+    assert response.json() == {"errors": "Job not found"}
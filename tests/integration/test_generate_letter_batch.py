@@ -0,0 +1,61 @@
+from helpers.auth import sign_jwt
+from unittest.mock import patch, AsyncMock
+from config import JWT_ACCESS_TOKEN
+from helpers.cv import ExtractionResult
+import io
+import zipfile
+import pytest
+
+
+@pytest.mark.asyncio
+@patch("services.letter.build_letter", new_callable=AsyncMock)
+@patch(
+    "services.letter.extract_text_from_pdf",
+    return_value=ExtractionResult("CV text", 1, 1, False),
+)
+@patch("services.storage.get_from_s3", return_value=b"%PDF-1.4")
+async def test_generate_letter_batch_success(
+    mock_s3, mock_extract, mock_build, client, verified_test_user
+):
+    access_token = sign_jwt(
+        {"id": verified_test_user["id"], "email": verified_test_user["email"]},
+        JWT_ACCESS_TOKEN,
+    )
+    headers = {"Authorization": f"Bearer {access_token}"}
+    mock_build.return_value = ("Letter", b"%PDF-1.4 letter", "MISS")
+
+    batch_data = {
+        "cv_id": str(verified_test_user["user_cv_id"]),
+        "job_descs": ["50charslong" * 5, "60charslong" * 6],
+    }
+
+    response = client.post("/letter/batch", headers=headers, json=batch_data)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        assert sorted(archive.namelist()) == [
+            "cover_letter_01.pdf",
+            "cover_letter_02.pdf",
+        ]
+    assert mock_build.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_generate_letter_batch_invalid_item(client, verified_test_user):
+    access_token = sign_jwt(
+        {"id": verified_test_user["id"], "email": verified_test_user["email"]},
+        JWT_ACCESS_TOKEN,
+    )
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    batch_data = {
+        "cv_id": str(verified_test_user["user_cv_id"]),
+        "job_descs": ["50charslong" * 5, "too short"],
+    }
+
+    response = client.post("/letter/batch", headers=headers, json=batch_data)
+
+    assert response.status_code == 422
+    assert response.json()["errors"][0]["field"] == "body.job_descs.1"
@@ -1,8 +1,6 @@
 from helpers.auth import sign_jwt
 from config import JWT_ACCESS_TOKEN
-from typing import List
-from schemas.base import DataResponse
-from schemas.cv import CvListItem
+from schemas.cv import CvListItem, CvListResponse
 
 
 def test_get_cvs_success(client, verified_test_user):
@@ -15,13 +13,70 @@ def test_get_cvs_success(client, verified_test_user):
     response = client.get("/cvs", headers=headers)
     assert response.status_code == 200
 
-    parsed_response = DataResponse[List[CvListItem]].model_validate(response.json())
+    parsed_response = CvListResponse.model_validate(response.json())
 
     assert isinstance(parsed_response.data, list)
     for item in parsed_response.data:
         assert isinstance(item, CvListItem)
 
 
+def test_get_cvs_not_modified(client, verified_test_user):
+    access_token = sign_jwt(
+        {"id": verified_test_user["id"], "email": verified_test_user["email"]},
+        JWT_ACCESS_TOKEN,
+    )
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    response = client.get("/cvs", headers=headers)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    response = client.get("/cvs", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+
+def test_get_cvs_paginated(client, verified_test_user):
+    access_token = sign_jwt(
+        {"id": verified_test_user["id"], "email": verified_test_user["email"]},
+        JWT_ACCESS_TOKEN,
+    )
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    ids = []
+    cursor = None
+    while True:
+        params = {"limit": 1, "order": "asc"}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/cvs", headers=headers, params=params)
+        assert response.status_code == 200
+
+        page = CvListResponse.model_validate(response.json())
+        assert len(page.data) <= 1
+        ids += [item.id for item in page.data]
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert len(ids) == len(set(ids))
+    assert len(ids) >= 1
+
+
+def test_get_cvs_invalid_cursor(client, verified_test_user):
+    access_token = sign_jwt(
+        {"id": verified_test_user["id"], "email": verified_test_user["email"]},
+        JWT_ACCESS_TOKEN,
+    )
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    response = client.get("/cvs", headers=headers, params={"cursor": "bogus"})
+
+    assert response.status_code == 400
+    assert response.json() == {"errors": "Invalid cursor"}
+
+
 def test_get_cvs_no_user(client, verified_test_user):
 
     access_token = sign_jwt(
@@ -1,4 +1,10 @@
+import uuid
+import bcrypt
 import pytest
+from sqlmodel import Session, select, delete
+from database import engine
+from models.user import User
+from helpers.auth import password_needs_rehash
 
 
 @pytest.mark.asyncio
@@ -48,3 +54,29 @@ async def test_login_not_verified_user(client, test_user):
         data["errors"]
         == "Account not verified. Please verify your email or request a new verification link."
     )
+
+
+def test_login_rehashes_outdated_password(client):
+    email = f"rehash+{uuid.uuid4().hex}@example.com"
+    password = "RehashPassword123!"
+    old_hash = bcrypt.hashpw(password.encode(), bcrypt.gensalt(4)).decode()
+
+    with Session(engine) as session:
+        session.add(User(email=email, password_hash=old_hash, is_verified=True))
+        session.commit()
+
+    try:
+        response = client.post(
+            "/auth/login", json={"email": email, "password": password}
+        )
+        assert response.status_code == 200
+
+        with Session(engine) as session:
+            user = session.exec(select(User).where(User.email == email)).first()
+            assert user.password_hash != old_hash
+            assert not password_needs_rehash(user.password_hash)
+            assert bcrypt.checkpw(password.encode(), user.password_hash.encode())
+    finally:
+        with Session(engine) as session:
+            session.exec(delete(User).where(User.email == email))
+            session.commit()
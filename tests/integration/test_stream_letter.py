@@ -0,0 +1,73 @@
+from helpers.auth import sign_jwt
+from unittest.mock import patch
+from config import JWT_ACCESS_TOKEN
+from helpers.cv import ExtractionResult
+import json
+import pytest
+
+
+JOB_DESC = (
+    "50charslong50charslong50charslong50charslong50charslong"
+    "50charslong50charslong50charslong50charslong50charslong"
+)
+
+
+def parse_sse(body):
+    events = []
+    for block in body.strip().split("\n\n"):
+        event, data = block.split("\n")
+        events.append(
+            (event.removeprefix("event: "), json.loads(data.removeprefix("data: ")))
+        )
+    return events
+
+
+async def fake_stream(cv, job):
+    for delta in ["Dear ", "Hiring ", "Manager"]:
+        yield delta
+
+
+@pytest.mark.asyncio
+@patch("services.letter.stream_cover_letter", new=fake_stream)
+@patch(
+    "services.letter.extract_text_from_pdf",
+    return_value=ExtractionResult("CV text", 1, 1, False),
+)
+@patch("services.storage.get_from_s3", return_value=b"%PDF-1.4")
+async def test_stream_letter_success(mock_s3, mock_extract, client, verified_test_user):
+    access_token = sign_jwt(
+        {"id": verified_test_user["id"], "email": verified_test_user["email"]},
+        JWT_ACCESS_TOKEN,
+    )
+    headers = {"Authorization": f"Bearer {access_token}"}
+    letter_data = {"cv_id": str(verified_test_user["user_cv_id"]), "job_desc": JOB_DESC}
+
+    response = client.post("/letter/stream", headers=headers, json=letter_data)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = parse_sse(response.text)
+    tokens = [data["text"] for event, data in events if event == "token"]
+    assert "".join(tokens) == "Dear Hiring Manager"
+
+    event, data = events[-1]
+    assert event == "done"
+
+    pdf_response = client.get(data["pdf_url"], headers=headers)
+    assert pdf_response.status_code == 200
+    assert pdf_response.content.startswith(b"%PDF")
+
+
+@pytest.mark.asyncio
+async def test_download_letter_not_found(client, verified_test_user):
+    access_token = sign_jwt(
+        {"id": verified_test_user["id"], "email": verified_test_user["email"]},
+        JWT_ACCESS_TOKEN,
+    )
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    response = client.get("/letter/pdf/does-not-exist", headers=headers)
+
+    assert response.status_code == 404
+    assert response.json() == {"errors": "Letter not found"}
@@ -0,0 +1,113 @@
+import hashlib
+import io
+import uuid
+from unittest.mock import patch, AsyncMock
+from models.user import UserCV, CvObject
+from sqlmodel import select, delete, Session
+from database import engine
+from helpers.auth import sign_jwt
+from config import JWT_ACCESS_TOKEN
+from helpers.db import get_cv_object_by_hash
+
+
+@patch("routers.cv.store_cv_text_from_storage", new_callable=AsyncMock)
+@patch("routers.cv.storage")
+def test_upload_same_cv_twice(
+    mock_storage, mock_store_text, client, verified_test_user
+):
+    mock_storage.put_file = AsyncMock(return_value=True)
+    mock_storage.delete = AsyncMock(return_value=True)
+    access_token = sign_jwt(
+        {"id": verified_test_user["id"], "email": verified_test_user["email"]},
+        JWT_ACCESS_TOKEN,
+    )
+    headers = {"Authorization": f"Bearer {access_token}"}
+    content = b"%PDF-1.4 deduplicated CV " + uuid.uuid4().hex.encode()
+
+    for _ in range(2):
+        file = ("cv.pdf", io.BytesIO(content), "application/pdf")
+        response = client.post("/cvs", files={"file": file}, headers=headers)
+        assert response.status_code == 200
+
+    mock_storage.put_file.assert_awaited_once()
+
+    with Session(engine) as session:
+        cvs = session.exec(
+            select(UserCV).where(
+                (UserCV.user_id == verified_test_user["id"])
+                & (UserCV.original_name == "cv.pdf")
+            )
+        ).all()
+        assert len(cvs) == 2
+        assert cvs[0].s3_key == cvs[1].s3_key
+        s3_key = cvs[0].s3_key
+        assert session.get(CvObject, s3_key).ref_count == 2
+
+    for cv in cvs:
+        response = client.delete(f"/cvs?id={cv.id}", headers=headers)
+        assert response.status_code == 204
+
+    mock_storage.delete.assert_awaited_once_with(s3_key)
+
+    with Session(engine) as session:
+        assert session.get(CvObject, s3_key) is None
+        session.exec(delete(UserCV).where(UserCV.user_id == verified_test_user["id"]))
+        session.commit()
+
+
+@patch("routers.cv.store_cv_text_from_storage", new_callable=AsyncMock)
+@patch("routers.cv.storage")
+def test_upload_same_cv_concurrently(
+    mock_storage, mock_store_text, client, verified_test_user
+):
+    """The request that loses the race on cv_objects.sha256 shares the winner's file."""
+    mock_storage.put_file = AsyncMock(return_value=True)
+    mock_storage.delete = AsyncMock(return_value=True)
+    access_token = sign_jwt(
+        {"id": verified_test_user["id"], "email": verified_test_user["email"]},
+        JWT_ACCESS_TOKEN,
+    )
+    headers = {"Authorization": f"Bearer {access_token}"}
+    content = b"%PDF-1.4 concurrent CV " + uuid.uuid4().hex.encode()
+    shared_key = f"{uuid.uuid4()}.pdf"
+
+    # The concurrent upload commits its CvObject after this request's lookup
+    with Session(engine) as session:
+        session.add(
+            CvObject(
+                s3_key=shared_key,
+                sha256=hashlib.sha256(content).hexdigest(),
+                size=len(content),
+            )
+        )
+        session.commit()
+
+    lookups = []
+
+    async def lookup_after_race(session, sha256):
+        lookups.append(sha256)
+        if len(lookups) == 1:
+            return None
+        return await get_cv_object_by_hash(session, sha256)
+
+    with patch("routers.cv.get_cv_object_by_hash", lookup_after_race):
+        file = ("race.pdf", io.BytesIO(content), "application/pdf")
+        response = client.post("/cvs", files={"file": file}, headers=headers)
+
+    assert response.status_code == 200
+    own_key = mock_storage.put_file.await_args.args[0]
+    mock_storage.delete.assert_awaited_once_with(own_key)
+
+    with Session(engine) as session:
+        user_cv = session.exec(
+            select(UserCV).where(
+                (UserCV.user_id == verified_test_user["id"])
+                & (UserCV.original_name == "race.pdf")
+            )
+        ).one()
+        assert user_cv.s3_key == shared_key
+        assert session.get(CvObject, shared_key).ref_count == 2
+
+        session.delete(user_cv)
+        session.delete(session.get(CvObject, shared_key))
+        session.commit()
@@ -0,0 +1,53 @@
+from helpers.cv import PAGE_SEPARATOR
+from helpers.text_compaction import compact_cv_text, estimate_tokens
+
+PAGE_ONE = """Jane Doe | jane@example.com
+Senior   Backend    Engineer
+
+
+Experience
+•  Designed   event-driven   micro-
+   services for payments
+●	Mentored five engineers
+Page 1 of 2
+"""
+
+PAGE_TWO = """Jane Doe | jane@example.com
+Education
+▪ MSc Computer Science, Warsaw University of Technology
+Page 2 of 2
+"""
+
+
+def test_compact_cv_text():
+    text = PAGE_SEPARATOR.join([PAGE_ONE, PAGE_TWO])
+
+    result = compact_cv_text(text)
+
+    assert result == (
+        "Jane Doe | jane@example.com\n"
+        "Senior Backend Engineer\n"
+        "\n"
+        "Experience\n"
+        "- Designed event-driven microservices for payments\n"
+        "- Mentored five engineers\n"
+        "\n"
+        "Education\n"
+        "- MSc Computer Science, Warsaw University of Technology"
+    )
+    assert len(result) < len(text)
+
+
+def test_compact_cv_text_keeps_real_hyphens():
+    result = compact_cv_text("Worked with Jean-\nPierre on CI/CD\nself-taught")
+
+    assert result == "Worked with Jean-\nPierre on CI/CD\nself-taught"
+
+
+def test_compact_cv_text_token_cap():
+    text = "\n".join(f"Line {index} with some words" for index in range(1000))
+
+    result = compact_cv_text(text, max_tokens=100)
+
+    assert estimate_tokens(result) <= 100
+    assert result.endswith("with some words")
@@ -0,0 +1,11 @@
+from helpers.cv import compress_text, decompress_text
+
+
+def test_compress_text_roundtrip():
+    text = "Senior Engineer — Zürich\n" * 50
+
+    compressed = compress_text(text)
+
+    assert isinstance(compressed, bytes)
+    assert len(compressed) < len(text.encode("utf-8"))
+    assert decompress_text(compressed) == text
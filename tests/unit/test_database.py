@@ -1,18 +1,46 @@
 import sys
 import os
-from database import get_session
-from unittest.mock import patch, MagicMock
+import pytest
+from database import get_session, wait_for_database
+from unittest.mock import patch, MagicMock, AsyncMock
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 
-@patch("database.Session")
-def test_get_session(mock_session):
+@pytest.mark.asyncio
+@patch("database.async_session_maker")
+async def test_get_session(mock_session_maker):
     mock_db = MagicMock()
-    mock_session.return_value.__enter__.return_value = mock_db
+    mock_context = mock_session_maker.return_value
+    mock_context.__aenter__ = AsyncMock(return_value=mock_db)
+    mock_context.__aexit__ = AsyncMock(return_value=False)
 
-    session = next(get_session())
+    sessions = get_session()
+    session = await anext(sessions)
 
-    assert session is not None
-    mock_session.assert_called_once()
-    mock_session.return_value.__exit__.assert_called_once()
+    assert session is mock_db
+    mock_session_maker.assert_called_once()
+
+    await sessions.aclose()
+    mock_context.__aexit__.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch("database.check_database", new_callable=AsyncMock)
+async def test_wait_for_database_retries(mock_check):
+    mock_check.side_effect = [ConnectionError("down"), None]
+
+    await wait_for_database(retries=3, delay=0)
+
+    assert mock_check.await_count == 2
+
+
+@pytest.mark.asyncio
+@patch("database.check_database", new_callable=AsyncMock)
+async def test_wait_for_database_gives_up(mock_check):
+    mock_check.side_effect = ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        await wait_for_database(retries=2, delay=0)
+
+    assert mock_check.await_count == 2
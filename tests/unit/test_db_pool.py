@@ -0,0 +1,28 @@
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from helpers.db_pool import InstrumentedQueuePool, instrument_engine
+
+
+def sample(name):
+    return REGISTRY.get_sample_value(name, {"engine": "sync"}) or 0
+
+
+def test_instrument_engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=2,
+        max_overflow=0,
+    )
+    instrument_engine(engine, "sync")
+    checkouts = sample("db_pool_checkout_wait_seconds_count")
+    queries = sample("db_query_duration_seconds_count")
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        assert sample("db_pool_checked_out_connections") == 1
+
+    assert sample("db_pool_checked_out_connections") == 0
+    assert sample("db_pool_checkout_wait_seconds_count") == checkouts + 1
+    assert sample("db_query_duration_seconds_count") >= queries + 1
+    engine.dispose()
@@ -0,0 +1,120 @@
+import io
+import os
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from helpers.disk_cache import DiskLRUCache
+from services.storage import CachedStorage
+
+
+def test_disk_cache_roundtrip(tmp_path):
+    cache = DiskLRUCache(str(tmp_path), max_bytes=100)
+
+    assert cache.get("cv.pdf") is None
+    cache.put("cv.pdf", b"%PDF-1.4")
+
+    assert cache.get("cv.pdf") == b"%PDF-1.4"
+    assert [name for name in os.listdir(tmp_path) if name.startswith(".")] == []
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    cache = DiskLRUCache(str(tmp_path), max_bytes=10)
+    cache.put("a", b"aaaa")
+    cache.put("b", b"bbbb")
+    cache.get("a")
+
+    cache.put("c", b"cccc")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"aaaa"
+    assert cache.get("c") == b"cccc"
+    assert cache.size == 8
+
+
+def test_disk_cache_skips_oversized_entries(tmp_path):
+    cache = DiskLRUCache(str(tmp_path), max_bytes=4)
+    cache.put("a", b"too large")
+
+    assert cache.get("a") is None
+
+
+def test_disk_cache_rebuilds_index(tmp_path):
+    DiskLRUCache(str(tmp_path), max_bytes=100).put("a", b"aaaa")
+
+    cache = DiskLRUCache(str(tmp_path), max_bytes=100)
+
+    assert cache.get("a") == b"aaaa"
+    assert cache.size == 4
+
+
+def test_disk_cache_delete(tmp_path):
+    cache = DiskLRUCache(str(tmp_path), max_bytes=100)
+    cache.put("a", b"aaaa")
+
+    cache.delete("a")
+
+    assert cache.get("a") is None
+    assert cache.size == 0
+
+
+def test_disk_cache_keeps_other_process_temp_files(tmp_path):
+    cache = DiskLRUCache(str(tmp_path), max_bytes=100)
+    own = tmp_path / f"{cache.temp_prefix}own"
+    other = tmp_path / ".tmp-0-other"
+    stale = tmp_path / ".tmp-0-stale"
+    for file in (own, other, stale):
+        file.write_bytes(b"partial")
+    os.utime(stale, (0, 0))
+
+    cache.put("a", b"aaaa")
+
+    assert not own.exists()
+    assert other.exists()
+    assert not stale.exists()
+    assert cache.size == 4
+
+
+@pytest.mark.asyncio
+async def test_cached_storage_reads_through(tmp_path):
+    backend = AsyncMock()
+    backend.get.return_value = b"%PDF"
+    storage = CachedStorage(backend, DiskLRUCache(str(tmp_path), max_bytes=100))
+
+    assert await storage.get("cv.pdf") == b"%PDF"
+    assert await storage.get("cv.pdf") == b"%PDF"
+    backend.get.assert_awaited_once_with("cv.pdf")
+
+    await storage.delete("cv.pdf")
+    backend.delete.assert_awaited_once_with("cv.pdf")
+    assert storage.cache.get("cv.pdf") is None
+
+
+@pytest.mark.asyncio
+async def test_cached_storage_put_file_fills_cache(tmp_path):
+    backend = AsyncMock()
+    backend.put_file.return_value = True
+    storage = CachedStorage(backend, DiskLRUCache(str(tmp_path), max_bytes=100))
+    fileobj = io.BytesIO(b"%PDF-1.4")
+    fileobj.read()
+
+    assert await storage.put_file("cv.pdf", fileobj, "application/pdf") is True
+
+    assert storage.cache.get("cv.pdf") == b"%PDF-1.4"
+
+
+@pytest.mark.asyncio
+async def test_cached_storage_ignores_cache_errors():
+    backend = AsyncMock()
+    backend.get.return_value = b"%PDF"
+    backend.put_file.return_value = True
+    cache = MagicMock()
+    cache.get.side_effect = OSError("disk full")
+    cache.put.side_effect = OSError("disk full")
+    cache.put_file.side_effect = OSError("disk full")
+    cache.delete.side_effect = OSError("disk full")
+    storage = CachedStorage(backend, cache)
+
+    assert await storage.get("cv.pdf") == b"%PDF"
+    assert await storage.put_file("cv.pdf", io.BytesIO(b"%PDF"), "application/pdf")
+    await storage.delete("cv.pdf")
+
+    backend.delete.assert_awaited_once_with("cv.pdf")
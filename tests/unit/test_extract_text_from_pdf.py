@@ -1,21 +1,71 @@
 from unittest.mock import patch, MagicMock
-from helpers.cv import extract_text_from_pdf
+from helpers.cv import extract_text_from_pdf, PAGE_SEPARATOR
+
+
+def mock_document(page_texts):
+    mock_doc = MagicMock()
+    mock_doc.__enter__.return_value = mock_doc
+    mock_doc.page_count = len(page_texts)
+
+    pages = []
+    for text in page_texts:
+        page = MagicMock()
+        page.get_text.return_value = text
+        pages.append(page)
+    mock_doc.load_page.side_effect = lambda number: pages[number]
+
+    return mock_doc
 
 
 @patch("helpers.cv.fitz.open")
 def test_extract_text_from_pdf(mock_fitz_open):
-    mock_page1 = MagicMock()
-    mock_page1.get_text.return_value = "Hello "
-    mock_page2 = MagicMock()
-    mock_page2.get_text.return_value = "World!"
-
-    mock_doc = [mock_page1, mock_page2]
-    mock_fitz_open.return_value = mock_doc
+    mock_fitz_open.return_value = mock_document(["Hello ", "World!"])
 
     fake_binary_pdf = b"%PDF-1.4 fake content here"
 
     result = extract_text_from_pdf(fake_binary_pdf)
 
-    assert result == "Hello World!"
+    assert result.text == f"Hello {PAGE_SEPARATOR}World!"
+    assert result.pages_processed == 2
+    assert result.page_count == 2
+    assert result.truncated is False
 
     mock_fitz_open.assert_called_once()
+
+
+@patch("helpers.cv.fitz.open")
+def test_extract_text_from_pdf_page_budget(mock_fitz_open):
+    mock_doc = mock_document(["Page "] * 2000)
+    mock_fitz_open.return_value = mock_doc
+
+    result = extract_text_from_pdf(b"%PDF", max_pages=3)
+
+    assert result.text == PAGE_SEPARATOR.join(["Page "] * 3)
+    assert result.pages_processed == 3
+    assert result.page_count == 2000
+    assert result.truncated is True
+    assert mock_doc.load_page.call_count == 3
+
+
+@patch("helpers.cv.fitz.open")
+def test_extract_text_from_pdf_char_budget(mock_fitz_open):
+    mock_fitz_open.return_value = mock_document(["a" * 8, "b" * 8, "c" * 8])
+
+    result = extract_text_from_pdf(b"%PDF", max_chars=12)
+
+    assert result.text == "a" * 8 + PAGE_SEPARATOR + "b" * 4
+    assert result.pages_processed == 2
+    assert result.truncated is True
+
+
+@patch("helpers.cv.time.monotonic")
+@patch("helpers.cv.fitz.open")
+def test_extract_text_from_pdf_timeout(mock_fitz_open, mock_monotonic):
+    mock_fitz_open.return_value = mock_document(["Hello ", "World!", "Again"])
+    mock_monotonic.side_effect = [0, 1, 11]
+
+    result = extract_text_from_pdf(b"%PDF", timeout=10)
+
+    assert result.text == "Hello "
+    assert result.pages_processed == 1
+    assert result.truncated is True
@@ -0,0 +1,92 @@
+import uuid
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from config import CV_TEXT_EXTRACTION_VERSION
+from helpers.cv import compress_text
+from helpers.db import get_cv_text, get_cv_section_index, save_cv_text
+from models.user import UserCVText
+
+
+@pytest.mark.asyncio
+async def test_get_cv_text_success():
+    cv_id = uuid.uuid4()
+    mock_session = AsyncMock()
+    mock_session.add = MagicMock()
+    mock_session.get.return_value = UserCVText(
+        cv_id=cv_id,
+        content=compress_text("CV text"),
+        extraction_version=CV_TEXT_EXTRACTION_VERSION,
+    )
+
+    result = await get_cv_text(mock_session, cv_id)
+
+    mock_session.get.assert_awaited_once_with(UserCVText, cv_id)
+    assert result == "CV text"
+
+
+@pytest.mark.asyncio
+async def test_get_cv_text_missing():
+    mock_session = AsyncMock()
+    mock_session.add = MagicMock()
+    mock_session.get.return_value = None
+
+    assert await get_cv_text(mock_session, uuid.uuid4()) is None
+
+
+@pytest.mark.asyncio
+async def test_get_cv_text_outdated_version():
+    cv_id = uuid.uuid4()
+    mock_session = AsyncMock()
+    mock_session.add = MagicMock()
+    mock_session.get.return_value = UserCVText(
+        cv_id=cv_id,
+        content=compress_text("CV text"),
+        extraction_version=CV_TEXT_EXTRACTION_VERSION - 1,
+    )
+
+    assert await get_cv_text(mock_session, cv_id) is None
+
+
+@pytest.mark.asyncio
+async def test_save_cv_text():
+    cv_id = uuid.uuid4()
+    mock_session = AsyncMock()
+    mock_session.add = MagicMock()
+
+    await save_cv_text(mock_session, cv_id, "CV text")
+
+    saved = mock_session.merge.call_args.args[0]
+    assert saved.cv_id == cv_id
+    assert saved.extraction_version == CV_TEXT_EXTRACTION_VERSION
+    mock_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_save_cv_text_stores_section_index():
+    cv_id = uuid.uuid4()
+    mock_session = AsyncMock()
+    mock_session.add = MagicMock()
+
+    await save_cv_text(mock_session, cv_id, "Jane Doe\n\nSKILLS\nPython, SQL")
+    mock_session.get.return_value = mock_session.merge.call_args.args[0]
+
+    section_index = await get_cv_section_index(mock_session, cv_id)
+
+    assert [section["text"] for section in section_index["sections"]] == [
+        "Jane Doe",
+        "SKILLS\nPython, SQL",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_cv_section_index_missing():
+    cv_id = uuid.uuid4()
+    mock_session = AsyncMock()
+    mock_session.add = MagicMock()
+    mock_session.get.return_value = UserCVText(
+        cv_id=cv_id,
+        content=compress_text("CV text"),
+        extraction_version=CV_TEXT_EXTRACTION_VERSION,
+    )
+
+    assert await get_cv_section_index(mock_session, cv_id) is None
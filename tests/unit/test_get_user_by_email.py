@@ -1,28 +1,32 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 import pytest
 from fastapi import HTTPException
 from helpers.db import get_user_by_email
 
 
-def test_get_user_by_email_success():
+@pytest.mark.asyncio
+async def test_get_user_by_email_success():
     mock_email = "test@example.com"
 
-    mock_session = MagicMock()
+    mock_session = AsyncMock()
+    mock_session.exec.return_value = MagicMock()
     mock_session.exec.return_value.first.return_value = mock_email
 
-    result = get_user_by_email(mock_session, "test@example.com")
+    result = await get_user_by_email(mock_session, "test@example.com")
 
-    mock_session.exec.assert_called_once()
+    mock_session.exec.assert_awaited_once()
     assert result == mock_email
 
 
-def test_get_user_by_email_not_found():
-    mock_session = MagicMock()
+@pytest.mark.asyncio
+async def test_get_user_by_email_not_found():
+    mock_session = AsyncMock()
+    mock_session.exec.return_value = MagicMock()
     mock_session.exec.return_value.first.return_value = None
 
     with pytest.raises(HTTPException) as exc_info:
-        get_user_by_email(mock_session, "notfound@example.com")
+        await get_user_by_email(mock_session, "notfound@example.com")
 
-    mock_session.exec.assert_called_once()
+    mock_session.exec.assert_awaited_once()
     assert exc_info.value.status_code == 404
     assert exc_info.value.detail == "User not found"
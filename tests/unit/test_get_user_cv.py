@@ -0,0 +1,70 @@
+import uuid
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from helpers.db import get_user_cv, get_user_cvs
+from models.user import UserCV
+
+
+def session_returning(result):
+    mock_session = AsyncMock()
+    mock_session.exec.return_value = result
+    return mock_session
+
+
+def executed_sql(mock_session):
+    return str(mock_session.exec.await_args.args[0])
+
+
+@pytest.mark.asyncio
+async def test_get_user_cv_filters_by_owner_and_id():
+    user_cv = UserCV(user_id=1, s3_key="a.pdf", original_name="cv.pdf")
+    result = MagicMock()
+    result.first.return_value = user_cv
+    mock_session = session_returning(result)
+
+    assert await get_user_cv(mock_session, 1, user_cv.id) is user_cv
+    sql = executed_sql(mock_session)
+    assert "user_cvs.user_id = " in sql
+    assert "user_cvs.id = " in sql
+
+
+@pytest.mark.asyncio
+async def test_get_user_cv_not_found():
+    result = MagicMock()
+    result.first.return_value = None
+
+    assert await get_user_cv(session_returning(result), 1, uuid.uuid4()) is None
+
+
+@pytest.mark.asyncio
+async def test_get_user_cvs_selects_list_columns():
+    row = MagicMock()
+    row._asdict.return_value = {
+        "id": uuid.uuid4(),
+        "original_name": "cv.pdf",
+        "created_at": datetime.now(timezone.utc),
+    }
+    result = MagicMock()
+    result.all.return_value = [row]
+    mock_session = session_returning(result)
+
+    assert await get_user_cvs(mock_session, 1) == [row._asdict.return_value]
+    sql = executed_sql(mock_session)
+    assert "user_cvs.s3_key" not in sql
+    assert "WHERE user_cvs.user_id = " in sql
+
+
+@pytest.mark.asyncio
+async def test_get_user_cvs_keyset_page():
+    result = MagicMock()
+    result.all.return_value = []
+    mock_session = session_returning(result)
+    after = (datetime(2026, 1, 1), uuid.uuid4())
+
+    await get_user_cvs(mock_session, 1, limit=21, order="desc", after=after)
+
+    sql = executed_sql(mock_session)
+    assert "(user_cvs.created_at, user_cvs.id) < (" in sql
+    assert "ORDER BY user_cvs.created_at DESC, user_cvs.id DESC" in sql
+    assert "LIMIT" in sql
@@ -0,0 +1,78 @@
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+from services.letter_cache import (
+    letter_cache_key,
+    get_cached_letter,
+    cache_letter,
+    LETTER_CACHE_INDEX_KEY,
+)
+
+
+def test_letter_cache_key_ignores_whitespace():
+    key1 = letter_cache_key("Senior  Engineer\n\nPython", "Backend role ")
+    key2 = letter_cache_key("Senior Engineer Python", "  Backend\trole")
+
+    assert key1 == key2
+    assert key1.startswith("letter:cache:")
+
+
+def test_letter_cache_key_differs_by_content():
+    assert letter_cache_key("CV one", "Job") != letter_cache_key("CV two", "Job")
+    assert letter_cache_key("CV", "Job one") != letter_cache_key("CV", "Job two")
+
+
+@patch("services.letter_cache.OPENAI_LETTER_MODEL", "another-model")
+def test_letter_cache_key_differs_by_model():
+    with patch("services.letter_cache.OPENAI_LETTER_MODEL", "gpt-4o"):
+        key1 = letter_cache_key("CV", "Job")
+
+    assert letter_cache_key("CV", "Job") != key1
+
+
+@pytest.mark.asyncio
+@patch("services.letter_cache.redis_client")
+async def test_get_cached_letter_hit(mock_redis):
+    mock_redis.hgetall = AsyncMock(return_value={b"text": b"Letter", b"pdf": b"%PDF"})
+    mock_redis.zadd = AsyncMock()
+
+    result = await get_cached_letter("letter:cache:abc")
+
+    assert result == ("Letter", b"%PDF")
+    mock_redis.zadd.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch("services.letter_cache.redis_client")
+async def test_get_cached_letter_miss(mock_redis):
+    mock_redis.hgetall = AsyncMock(return_value={})
+
+    assert await get_cached_letter("letter:cache:abc") is None
+
+
+@pytest.mark.asyncio
+@patch("services.letter_cache.redis_client")
+async def test_get_cached_letter_redis_error(mock_redis):
+    mock_redis.hgetall = AsyncMock(side_effect=ConnectionError("Redis down"))
+
+    assert await get_cached_letter("letter:cache:abc") is None
+
+
+@pytest.mark.asyncio
+@patch("services.letter_cache.LETTER_CACHE_MAX_ENTRIES", 2)
+@patch("services.letter_cache.redis_client")
+async def test_cache_letter_evicts_oldest(mock_redis):
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[1, 1, True, 1, 3])
+    mock_redis.pipeline = MagicMock()
+    mock_redis.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+    mock_redis.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+    mock_redis.zpopmin = AsyncMock(return_value=[(b"letter:cache:old", 1.0)])
+    mock_redis.delete = AsyncMock()
+
+    await cache_letter("letter:cache:new", "Letter", b"%PDF")
+
+    pipe.hset.assert_called_once_with(
+        "letter:cache:new", mapping={"text": "Letter", "pdf": b"%PDF"}
+    )
+    mock_redis.zpopmin.assert_awaited_once_with(LETTER_CACHE_INDEX_KEY, 1)
+    mock_redis.delete.assert_awaited_once_with(b"letter:cache:old")
@@ -0,0 +1,99 @@
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+from fastapi import HTTPException
+from services.letter_jobs import (
+    get_letter_job,
+    run_letter_job,
+    letter_job_key,
+    LETTER_JOBS_QUEUE_KEY,
+)
+
+JOB = {
+    b"status": b"queued",
+    b"user_id": b"1",
+    b"cv_id": b"6f1c7a1e-2d0b-4c1e-9a3e-7a8f5b2c9d10",
+    b"job_desc": b"Backend developer",
+    b"regenerate": b"0",
+    b"attempts": b"0",
+}
+
+
+@pytest.fixture
+def mock_redis():
+    with patch("services.letter_jobs.redis_client") as mock_redis:
+        mock_redis.hgetall = AsyncMock(return_value=dict(JOB))
+        mock_redis.hincrby = AsyncMock(return_value=1)
+        mock_redis.hset = AsyncMock()
+        mock_redis.lpush = AsyncMock()
+        yield mock_redis
+
+
+@pytest.mark.asyncio
+async def test_get_letter_job_owner(mock_redis):
+    job = await get_letter_job(1, "job-id")
+
+    assert job["status"] == "queued"
+    mock_redis.hgetall.assert_awaited_once_with(letter_job_key("job-id"))
+
+
+@pytest.mark.asyncio
+async def test_get_letter_job_other_user(mock_redis):
+    assert await get_letter_job(2, "job-id") is None
+
+
+@pytest.mark.asyncio
+@patch("services.letter_jobs.async_session_maker", MagicMock())
+@patch("services.letter_jobs.build_letter", new_callable=AsyncMock)
+@patch("services.letter_jobs.prepare_cv_text", new_callable=AsyncMock)
+@patch("services.letter_jobs.get_selected_cv", new_callable=AsyncMock)
+async def test_run_letter_job_success(
+    mock_get_cv, mock_load_text, mock_build, mock_redis
+):
+    mock_build.return_value = ("Letter", b"%PDF", "MISS")
+
+    await run_letter_job("job-id")
+
+    mock_build.assert_awaited_once_with(
+        mock_load_text.return_value, "Backend developer", False
+    )
+    mock_redis.hset.assert_awaited_with(
+        letter_job_key("job-id"), mapping={"status": "done", "pdf": b"%PDF"}
+    )
+
+
+@pytest.mark.asyncio
+@patch("services.letter_jobs.async_session_maker", MagicMock())
+@patch("services.letter_jobs.get_selected_cv", new_callable=AsyncMock)
+async def test_run_letter_job_not_found(mock_get_cv, mock_redis):
+    mock_get_cv.side_effect = HTTPException(status_code=404, detail="CV not found")
+
+    await run_letter_job("job-id")
+
+    mock_redis.hset.assert_awaited_with(
+        letter_job_key("job-id"), mapping={"status": "failed", "error": "CV not found"}
+    )
+    mock_redis.lpush.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@patch("services.letter_jobs.async_session_maker", MagicMock())
+@patch("services.letter_jobs.get_selected_cv", new_callable=AsyncMock)
+async def test_run_letter_job_retries(mock_get_cv, mock_redis):
+    mock_get_cv.side_effect = TimeoutError("OpenAI timed out")
+
+    await run_letter_job("job-id")
+
+    mock_redis.lpush.assert_awaited_once_with(LETTER_JOBS_QUEUE_KEY, "job-id")
+
+
+@pytest.mark.asyncio
+@patch("services.letter_jobs.LETTER_JOB_MAX_ATTEMPTS", 1)
+@patch("services.letter_jobs.async_session_maker", MagicMock())
+@patch("services.letter_jobs.get_selected_cv", new_callable=AsyncMock)
+async def test_run_letter_job_gives_up(mock_get_cv, mock_redis):
+    mock_get_cv.side_effect = TimeoutError("OpenAI timed out")
+
+    await run_letter_job("job-id")
+
+    mock_redis.lpush.assert_not_awaited()
+    assert mock_redis.hset.await_args.kwargs["mapping"]["status"] == "failed"
@@ -0,0 +1,29 @@
+import io
+import json
+import zipfile
+import pytest
+from unittest.mock import patch
+from services.letter import letter_zip_stream
+
+
+async def fake_build_letter(cv_text, job_text, regenerate=False):
+    if job_text == "broken":
+        raise RuntimeError("OpenAI error")
+    return job_text, f"%PDF {job_text}".encode(), "MISS"
+
+
+@pytest.mark.asyncio
+@patch("services.letter.build_letter", new=fake_build_letter)
+async def test_letter_zip_stream():
+    chunks = [
+        chunk async for chunk in letter_zip_stream("CV", ["first", "broken", "third"])
+    ]
+
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as archive:
+        assert sorted(archive.namelist()) == [
+            "cover_letter_01.pdf",
+            "cover_letter_03.pdf",
+            "errors.json",
+        ]
+        assert archive.read("cover_letter_03.pdf") == b"%PDF third"
+        assert json.loads(archive.read("errors.json"))["failed"] == [2]
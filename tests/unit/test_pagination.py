@@ -0,0 +1,64 @@
+import base64
+import json
+import uuid
+import pytest
+from datetime import datetime
+from fastapi import HTTPException
+from helpers.pagination import encode_cursor, decode_cursor, weak_etag, etag_matches
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2026, 1, 1, 12, 30, 15, 123456)
+    id = uuid.uuid4()
+
+    assert decode_cursor(encode_cursor(created_at, id)) == (created_at, id)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "W10", "eyJhIjogMX0"])
+def test_decode_cursor_invalid(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor)
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail == "Invalid cursor"
+
+
+def test_decode_cursor_rejects_time_zone():
+    payload = json.dumps(["2026-01-01T00:00:00+00:00", str(uuid.uuid4())])
+    cursor = base64.urlsafe_b64encode(payload.encode()).decode()
+
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor)
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "payload", [["2026-01-01T00:00:00", 5], [20260101, "x"], ["2026-01-01T00:00:00"]]
+)
+def test_decode_cursor_rejects_wrong_types(payload):
+    cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor)
+
+    assert exc_info.value.status_code == 400
+
+
+def test_weak_etag_changes_with_parts():
+    etag = weak_etag(1, 3, "2026-01-01")
+
+    assert etag.startswith('W/"')
+    assert etag == weak_etag(1, 3, "2026-01-01")
+    assert etag != weak_etag(1, 2, "2026-01-01")
+
+
+def test_etag_matches():
+    etag = weak_etag(1)
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(etag.removeprefix("W/"), etag)
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('W/"other"', etag)
+    assert not etag_matches(None, etag)
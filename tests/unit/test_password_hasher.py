@@ -0,0 +1,55 @@
+import asyncio
+import threading
+import pytest
+from fastapi import HTTPException
+from helpers.auth import hash_password
+from services.password_hasher import PasswordHasher
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(max_workers=1, max_pending=1)
+    hasher.start()
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify(hasher):
+    password_hash = await hasher.hash("password123")
+
+    assert await hasher.verify("password123", password_hash) is True
+    assert await hasher.verify("wrong", password_hash) is False
+
+
+@pytest.mark.asyncio
+async def test_runs_on_bcrypt_threads(hasher):
+    thread_name = await hasher.run(lambda: threading.current_thread().name)
+
+    assert thread_name.startswith("bcrypt")
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_threadpool_before_start():
+    hasher = PasswordHasher()
+    password_hash = await hasher.hash("password123")
+
+    assert await hasher.verify("password123", password_hash) is True
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_too_many_pending(hasher):
+    release = threading.Event()
+
+    running = asyncio.create_task(hasher.run(release.wait))
+    waiting = asyncio.create_task(hasher.run(hash_password, "password123"))
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await hasher.run(hash_password, "password123")
+    assert exc_info.value.status_code == 503
+
+    release.set()
+    await running
+    await waiting
+    assert hasher.pending == 0
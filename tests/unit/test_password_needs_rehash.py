@@ -0,0 +1,26 @@
+import bcrypt
+import pytest
+from unittest.mock import patch
+from helpers.auth import hash_password, password_needs_rehash
+
+
+def test_password_needs_rehash_current_cost():
+    assert password_needs_rehash(hash_password("password123")) is False
+
+
+def test_password_needs_rehash_cost_changed():
+    password_hash = hash_password("password123")
+
+    with patch("helpers.auth.BCRYPT_SALT", 10):
+        assert password_needs_rehash(password_hash) is True
+
+
+@pytest.mark.parametrize("password_hash", ["", "not-a-hash", "$2b$xx$abc"])
+def test_password_needs_rehash_malformed(password_hash):
+    assert password_needs_rehash(password_hash) is True
+
+
+def test_password_needs_rehash_other_cost():
+    password_hash = bcrypt.hashpw(b"password123", bcrypt.gensalt(4)).decode()
+
+    assert password_needs_rehash(password_hash) is True
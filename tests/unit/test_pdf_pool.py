@@ -0,0 +1,54 @@
+import time
+import pytest
+from fastapi import HTTPException
+from unittest.mock import patch, AsyncMock
+from services.pdf_pool import PdfProcessPool
+
+
+@pytest.fixture(scope="module")
+def running_pool():
+    pool = PdfProcessPool(max_workers=1, task_timeout=10)
+    pool.start()
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_pdf_pool_runs_in_worker_process(running_pool):
+    result = await running_pool.run(sorted, [3, 1, 2])
+
+    assert result == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_pdf_pool_timeout(running_pool):
+    executor = running_pool.executor
+    workers = list(executor._processes.values())
+    running_pool.task_timeout = 0.2
+    try:
+        with pytest.raises(HTTPException) as e:
+            await running_pool.run(time.sleep, 1)
+    finally:
+        running_pool.task_timeout = 10
+
+    assert e.value.status_code == 504
+    assert e.value.detail == "PDF processing timed out"
+    assert running_pool.executor is not executor
+    for worker in workers:
+        worker.join(timeout=5)
+        assert not worker.is_alive()
+    assert await running_pool.run(sorted, [2, 1]) == [1, 2]
+
+
+@pytest.mark.asyncio
+@patch("services.pdf_pool.run_in_threadpool", new_callable=AsyncMock)
+async def test_pdf_pool_disabled_uses_threadpool(mock_run_in_threadpool):
+    pool = PdfProcessPool(max_workers=0)
+    pool.start()
+    mock_run_in_threadpool.return_value = [1, 2, 3]
+
+    result = await pool.run(sorted, [3, 1, 2])
+
+    assert pool.executor is None
+    assert result == [1, 2, 3]
+    mock_run_in_threadpool.assert_awaited_once_with(sorted, [3, 1, 2])
@@ -0,0 +1,42 @@
+import fitz
+import fpdf.fpdf
+from unittest.mock import patch
+from fpdf.ttfonts import TTFontFile
+from helpers.pdf_renderer import PdfRenderer, CachedTTFontFile, get_pdf_renderer
+
+
+def test_pdf_renderer_renders_text():
+    letter_content = "Dear Hiring Manager,\n\nZażółć gęślą jaźń.\nSincerely"
+
+    pdf_bytes = PdfRenderer().render(letter_content)
+
+    assert pdf_bytes.startswith(b"%PDF")
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        text = doc[0].get_text()
+    assert "Dear Hiring Manager," in text
+    assert "Zażółć gęślą jaźń." in text
+
+
+def test_pdf_renderer_reuses_font_subset():
+    renderer = PdfRenderer()
+    CachedTTFontFile.subsets.clear()
+
+    with patch.object(
+        TTFontFile, "makeSubset", autospec=True, side_effect=TTFontFile.makeSubset
+    ) as mock_make_subset:
+        first = renderer.render("First letter")
+        second = renderer.render("Second letter")
+
+    mock_make_subset.assert_called_once()
+    assert first.startswith(b"%PDF")
+    assert second.startswith(b"%PDF")
+
+
+def test_pdf_renderer_keeps_fpdf_globals():
+    PdfRenderer().render("Letter")
+
+    assert fpdf.fpdf.TTFontFile is TTFontFile
+
+
+def test_get_pdf_renderer_is_shared():
+    assert get_pdf_renderer() is get_pdf_renderer()
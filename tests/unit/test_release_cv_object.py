@@ -0,0 +1,36 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from helpers.db import release_cv_object
+from models.user import CvObject
+
+
+def session_with(cv_object):
+    mock_session = AsyncMock()
+    mock_session.add = MagicMock()
+    mock_session.exec.return_value = MagicMock()
+    mock_session.exec.return_value.first.return_value = cv_object
+    return mock_session
+
+
+@pytest.mark.asyncio
+async def test_release_cv_object_shared():
+    cv_object = CvObject(s3_key="a.pdf", sha256="abc", size=10, ref_count=2)
+    mock_session = session_with(cv_object)
+
+    assert await release_cv_object(mock_session, "a.pdf") is False
+    assert cv_object.ref_count == 1
+    mock_session.delete.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_release_cv_object_last_reference():
+    cv_object = CvObject(s3_key="a.pdf", sha256="abc", size=10, ref_count=1)
+    mock_session = session_with(cv_object)
+
+    assert await release_cv_object(mock_session, "a.pdf") is True
+    mock_session.delete.assert_awaited_once_with(cv_object)
+
+
+@pytest.mark.asyncio
+async def test_release_cv_object_legacy_upload():
+    assert await release_cv_object(session_with(None), "a.pdf") is True
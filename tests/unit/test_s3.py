@@ -1,5 +1,51 @@
+import base64
+import json
+from concurrent.futures import ThreadPoolExecutor
+import boto3
 from unittest.mock import patch, MagicMock
-from services.s3 import upload_to_s3, delete_from_s3, get_from_s3
+from config import S3_MAX_POOL_CONNECTIONS
+from helpers.metrics import S3_REQUEST_ERRORS
+from services.s3 import (
+    upload_to_s3,
+    delete_from_s3,
+    get_from_s3,
+    get_s3_client,
+    close_s3_client,
+    delete_many_from_s3,
+    presign_s3_post,
+)
+
+
+@patch("services.s3.boto3.client")
+def test_get_s3_client_is_shared(mock_boto_client):
+    close_s3_client()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        clients = set(executor.map(lambda _: get_s3_client(), range(32)))
+
+    assert clients == {mock_boto_client.return_value}
+    mock_boto_client.assert_called_once()
+    config = mock_boto_client.call_args.kwargs["config"]
+    assert config.max_pool_connections == S3_MAX_POOL_CONNECTIONS
+
+    close_s3_client()
+    mock_boto_client.return_value.close.assert_called_once()
+
+
+@patch("services.s3.boto3.client")
+def test_get_s3_client_after_close(mock_boto_client):
+    mock_boto_client.side_effect = [MagicMock(), MagicMock()]
+    close_s3_client()
+
+    first = get_s3_client()
+    close_s3_client()
+    second = get_s3_client()
+    close_s3_client()
+
+    assert second is not first
+    assert mock_boto_client.call_count == 2
+    first.close.assert_called_once()
+    second.close.assert_called_once()
 
 
 @patch("services.s3.get_s3_client")
@@ -104,3 +150,58 @@ def test_get_from_s3_client_error(mock_get_s3_client):
 
     mock_s3.get_object.assert_called_once()
     assert result is None
+
+
+@patch("services.s3.get_s3_client")
+def test_get_from_s3_counts_errors(mock_get_s3_client):
+    from botocore.exceptions import ClientError
+
+    errors = S3_REQUEST_ERRORS.labels(operation="get_object")
+    before = errors._value.get()
+    mock_get_s3_client.return_value.get_object.side_effect = ClientError(
+        error_response={"Error": {"Code": "NoSuchKey", "Message": "Missing"}},
+        operation_name="GetObject",
+    )
+
+    assert get_from_s3(key="test-file.pdf") is None
+    assert errors._value.get() == before + 1
+
+
+@patch("services.s3.get_s3_client")
+def test_delete_many_from_s3_batches(mock_get_s3_client):
+    mock_s3 = MagicMock()
+    mock_s3.delete_objects.side_effect = [
+        {"Errors": [{"Key": "cv-1.pdf", "Message": "Denied"}]},
+        {},
+    ]
+    mock_get_s3_client.return_value = mock_s3
+    keys = [f"cv-{index}.pdf" for index in range(1001)]
+
+    failed = delete_many_from_s3(keys)
+
+    assert mock_s3.delete_objects.call_count == 2
+    last_batch = mock_s3.delete_objects.call_args.kwargs["Delete"]["Objects"]
+    assert last_batch == [{"Key": "cv-1000.pdf"}]
+    assert failed == ["cv-1.pdf"]
+
+
+@patch("services.s3.S3_BUCKET_NAME", "cv-bucket")
+@patch("services.s3.get_s3_client")
+def test_presign_s3_post_policy(mock_get_s3_client):
+    mock_get_s3_client.return_value = boto3.client(
+        "s3",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+        region_name="eu-central-1",
+    )
+
+    presigned = presign_s3_post(
+        "cv.pdf", "application/pdf", 1024, 600, {"original_name": "a&b.pdf"}
+    )
+
+    fields = presigned["fields"]
+    policy = json.loads(base64.b64decode(fields["policy"]))
+    assert fields["key"] == "cv.pdf"
+    assert ["content-length-range", 1, 1024] in policy["conditions"]
+    assert {"Content-Type": "application/pdf"} in policy["conditions"]
+    assert "<Value>a&amp;b.pdf</Value>" in fields["tagging"]
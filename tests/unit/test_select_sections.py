@@ -0,0 +1,105 @@
+from helpers.cv_sections import (
+    build_section_index,
+    chunk_section,
+    select_sections,
+    split_sections,
+    is_heading,
+)
+from helpers.text_compaction import estimate_tokens
+
+CV = """Jane Doe
+jane@example.com
+
+Experience
+Backend developer at Acme, building Python and PostgreSQL APIs with FastAPI.
+
+Education
+BSc Computer Science, University of Warsaw
+
+Interests
+Mountain climbing, photography and chess
+
+Languages
+Polish, English, German"""
+
+
+def test_is_heading():
+    assert is_heading("EXPERIENCE")
+    assert is_heading("Work Experience:")
+    assert not is_heading("Backend developer at Acme.")
+    assert not is_heading("Built internal tools for the finance team")
+
+
+def test_split_sections():
+    sections = split_sections(CV)
+
+    assert sections[0] == "Jane Doe\njane@example.com"
+    assert [section.split("\n")[0] for section in sections[1:]] == [
+        "Experience",
+        "Education",
+        "Interests",
+        "Languages",
+    ]
+
+
+def test_select_sections_prefers_relevant_sections():
+    section_index = build_section_index(CV)
+    budget = section_index["sections"][0]["tokens"] + 25
+
+    selected = select_sections(section_index, "Python backend developer", budget)
+
+    assert selected.startswith("Jane Doe")
+    assert "PostgreSQL" in selected
+    assert "chess" not in selected
+
+
+def test_select_sections_keeps_original_order():
+    section_index = build_section_index(CV)
+
+    selected = select_sections(section_index, "chess and Python", 10_000)
+
+    assert selected == "\n\n".join(split_sections(CV))
+
+
+def test_select_sections_empty_cv():
+    assert select_sections(build_section_index(""), "Python", 100) == ""
+
+
+def headingless_cv():
+    lines = ["Jane Doe", "jane@example.com", ""]
+    for year in range(2000, 2024):
+        lines.append(
+            f"In {year} worked on distributed systems, data pipelines and "
+            f"internal tooling for project number {year}, shipping features."
+        )
+        lines.append("")
+    return "\n".join(lines * 8)
+
+
+def test_chunk_section_splits_long_sections():
+    chunks = chunk_section(headingless_cv(), max_tokens=200)
+
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 200 for chunk in chunks)
+    assert chunks[0].startswith("Jane Doe")
+
+
+def test_select_sections_single_section_within_budget():
+    cv_text = headingless_cv()
+    section_index = build_section_index(cv_text)
+    assert estimate_tokens(cv_text) > 5000
+
+    selected = select_sections(section_index, "distributed systems", 1500)
+
+    assert selected.startswith("Jane Doe")
+    assert estimate_tokens(selected) <= 1500
+
+
+def test_select_sections_oversized_first_section():
+    section_index = {
+        "sections": [{"text": "x" * 40_000, "tokens": 10_000, "length": 1, "tf": {}}],
+        "df": {},
+        "avgdl": 1,
+    }
+
+    assert estimate_tokens(select_sections(section_index, "Python", 1500)) <= 1500
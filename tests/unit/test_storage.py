@@ -0,0 +1,47 @@
+import io
+import pytest
+from unittest.mock import patch
+from services.storage import S3Storage
+
+storage = S3Storage()
+
+
+@pytest.mark.asyncio
+@patch("services.storage.upload_to_s3", return_value=True)
+async def test_storage_put(mock_upload):
+    result = await storage.put("cv.pdf", b"%PDF", "application/pdf", "a=1")
+
+    mock_upload.assert_called_once_with(b"%PDF", "cv.pdf", "application/pdf", "a=1")
+    assert result is True
+
+
+@pytest.mark.asyncio
+@patch("services.storage.get_from_s3", return_value=b"%PDF")
+async def test_storage_get(mock_get):
+    assert await storage.get("cv.pdf") == b"%PDF"
+    mock_get.assert_called_once_with("cv.pdf")
+
+
+@pytest.mark.asyncio
+@patch("services.storage.open_s3_object")
+async def test_storage_iter_chunks(mock_open):
+    body = io.BytesIO(b"abcdefg")
+    mock_open.return_value = body
+
+    chunks = [chunk async for chunk in storage.iter_chunks("cv.pdf", chunk_size=3)]
+
+    assert chunks == [b"abc", b"def", b"g"]
+    assert body.closed
+
+
+@pytest.mark.asyncio
+@patch("services.storage.open_s3_object", return_value=None)
+async def test_storage_iter_chunks_missing(mock_open):
+    assert [chunk async for chunk in storage.iter_chunks("cv.pdf")] == []
+
+
+@pytest.mark.asyncio
+@patch("services.storage.delete_many_from_s3", return_value=[])
+async def test_storage_delete_many(mock_delete_many):
+    assert await storage.delete_many(key for key in ["a.pdf", "b.pdf"]) == []
+    mock_delete_many.assert_called_once_with(["a.pdf", "b.pdf"])
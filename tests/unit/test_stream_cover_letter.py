@@ -0,0 +1,55 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch, AsyncMock
+from prompts import generate_letter_prompt
+from services.client_openai import stream_cover_letter
+
+
+class FakeStream:
+    def __init__(self, events):
+        self.events = events
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for event in self.events:
+            yield event
+
+
+@pytest.mark.asyncio
+@patch("services.client_openai.client")
+async def test_stream_cover_letter(mock_client):
+    events = [
+        SimpleNamespace(type="response.created"),
+        SimpleNamespace(type="response.output_text.delta", delta="Dear "),
+        SimpleNamespace(type="response.output_text.delta", delta="Hiring Manager"),
+        SimpleNamespace(type="response.completed"),
+    ]
+    mock_client.responses.create = AsyncMock(return_value=FakeStream(events))
+
+    deltas = [delta async for delta in stream_cover_letter("CV text", "Job")]
+
+    assert deltas == ["Dear ", "Hiring Manager"]
+    mock_client.responses.create.assert_awaited_once_with(
+        model="gpt-4o",
+        instructions=generate_letter_prompt,
+        input="<cv> CV text </cv> <job> Job </job>",
+        stream=True,
+    )
+
+
+@pytest.mark.asyncio
+@patch("services.client_openai.client")
+async def test_stream_cover_letter_error(mock_client):
+    events = [
+        SimpleNamespace(type="response.output_text.delta", delta="Dear "),
+        SimpleNamespace(type="error", message="Server overloaded"),
+    ]
+    mock_client.responses.create = AsyncMock(return_value=FakeStream(events))
+
+    with pytest.raises(RuntimeError) as e:
+        async for _ in stream_cover_letter("CV text", "Job"):
+            pass
+
+    assert "Server overloaded" in str(e.value)
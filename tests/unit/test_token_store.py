@@ -0,0 +1,135 @@
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+from services.token_store import (
+    RedisTokenStore,
+    DatabaseTokenStore,
+    FallbackTokenStore,
+    token_digest,
+    VERIFY_EMAIL,
+)
+
+EMAIL = "user@example.com"
+
+
+@pytest.fixture
+def mock_redis():
+    with patch("services.token_store.redis_client") as mock_redis:
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[True, None])
+        mock_redis.pipeline = MagicMock()
+        mock_redis.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+        mock_redis.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_redis.getdel = AsyncMock(return_value=None)
+        mock_redis.delete = AsyncMock()
+        mock_redis.pipe = pipe
+        yield mock_redis
+
+
+@pytest.mark.asyncio
+async def test_redis_issue_sets_token_with_ttl(mock_redis):
+    store = RedisTokenStore()
+
+    await store.issue(VERIFY_EMAIL, EMAIL, "token", 3600)
+
+    mock_redis.pipe.setex.assert_called_once_with(
+        store.token_key(VERIFY_EMAIL, token_digest("token")), 3600, EMAIL
+    )
+    mock_redis.delete.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_redis_issue_revokes_previous_token(mock_redis):
+    store = RedisTokenStore()
+    previous = token_digest("old-token")
+    mock_redis.pipe.execute.return_value = [True, previous.encode()]
+
+    await store.issue(VERIFY_EMAIL, EMAIL, "token", 3600)
+
+    mock_redis.delete.assert_awaited_once_with(store.token_key(VERIFY_EMAIL, previous))
+
+
+@pytest.mark.asyncio
+async def test_redis_consume(mock_redis):
+    store = RedisTokenStore()
+    mock_redis.getdel.return_value = EMAIL.encode()
+
+    assert await store.consume(VERIFY_EMAIL, EMAIL, "token") is True
+    mock_redis.getdel.assert_awaited_once_with(
+        store.token_key(VERIFY_EMAIL, token_digest("token"))
+    )
+
+
+@pytest.mark.asyncio
+async def test_redis_consume_other_email(mock_redis):
+    mock_redis.getdel.return_value = b"other@example.com"
+
+    assert await RedisTokenStore().consume(VERIFY_EMAIL, EMAIL, "token") is False
+
+
+@pytest.mark.asyncio
+async def test_redis_consume_missing(mock_redis):
+    assert await RedisTokenStore().consume(VERIFY_EMAIL, EMAIL, "token") is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("row, expected", [(("digest",), True), (None, False)])
+async def test_database_consume(row, expected):
+    mock_session = AsyncMock()
+    mock_session.execute.return_value = MagicMock()
+    mock_session.execute.return_value.first.return_value = row
+    session_maker = MagicMock()
+    session_maker.return_value.__aenter__ = AsyncMock(return_value=mock_session)
+    session_maker.return_value.__aexit__ = AsyncMock(return_value=False)
+
+    with patch("services.token_store.async_session_maker", session_maker):
+        assert await DatabaseTokenStore().consume(VERIFY_EMAIL, EMAIL, "t") is expected
+
+    sql = str(mock_session.execute.await_args.args[0])
+    assert sql.startswith("DELETE FROM one_time_tokens")
+    assert "RETURNING" in sql
+    mock_session.commit.assert_awaited_once()
+
+
+def stores():
+    return AsyncMock(), AsyncMock()
+
+
+@pytest.mark.asyncio
+async def test_fallback_issue_uses_primary():
+    primary, fallback = stores()
+
+    await FallbackTokenStore(primary, fallback).issue(VERIFY_EMAIL, EMAIL, "t", 60)
+
+    primary.issue.assert_awaited_once_with(VERIFY_EMAIL, EMAIL, "t", 60)
+    fallback.issue.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_fallback_issue_when_primary_fails():
+    primary, fallback = stores()
+    primary.issue.side_effect = ConnectionError("redis down")
+
+    await FallbackTokenStore(primary, fallback).issue(VERIFY_EMAIL, EMAIL, "t", 60)
+
+    fallback.issue.assert_awaited_once_with(VERIFY_EMAIL, EMAIL, "t", 60)
+
+
+@pytest.mark.asyncio
+async def test_fallback_consume_primary_hit():
+    primary, fallback = stores()
+    primary.consume.return_value = True
+
+    assert await FallbackTokenStore(primary, fallback).consume(VERIFY_EMAIL, EMAIL, "t")
+    fallback.consume.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error", [None, ConnectionError("redis down")])
+async def test_fallback_consume_checks_fallback(error):
+    primary, fallback = stores()
+    primary.consume.return_value = False
+    primary.consume.side_effect = error
+    fallback.consume.return_value = True
+
+    assert await FallbackTokenStore(primary, fallback).consume(VERIFY_EMAIL, EMAIL, "t")
+    fallback.consume.assert_awaited_once_with(VERIFY_EMAIL, EMAIL, "t")
@@ -0,0 +1,91 @@
+import json
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+from models.user import User
+from services.user_cache import (
+    load_principal,
+    invalidate_user,
+    local_user_cache,
+    user_cache_key,
+)
+
+PRINCIPAL = {"id": 1, "email": "user@example.com", "role": "user", "is_verified": True}
+
+
+@pytest.fixture(autouse=True)
+def clear_local_cache():
+    local_user_cache.clear()
+    yield
+    local_user_cache.clear()
+
+
+@pytest.fixture
+def mock_redis():
+    with patch("services.user_cache.redis_client") as mock_redis:
+        mock_redis.get = AsyncMock(return_value=None)
+        mock_redis.setex = AsyncMock()
+        mock_redis.delete = AsyncMock()
+        yield mock_redis
+
+
+def session_with(user):
+    mock_session = AsyncMock()
+    mock_session.exec.return_value = MagicMock()
+    mock_session.exec.return_value.first.return_value = user
+    return mock_session
+
+
+@pytest.mark.asyncio
+async def test_load_principal_from_database(mock_redis):
+    user = User(id=1, email="user@example.com", password_hash="x", is_verified=True)
+    mock_session = session_with(user)
+
+    assert await load_principal(mock_session, 1) == PRINCIPAL
+    mock_redis.setex.assert_awaited_once()
+    assert json.loads(mock_redis.setex.await_args.args[2]) == PRINCIPAL
+
+
+@pytest.mark.asyncio
+async def test_load_principal_from_redis(mock_redis):
+    mock_redis.get.return_value = json.dumps(PRINCIPAL)
+    mock_session = session_with(None)
+
+    assert await load_principal(mock_session, 1) == PRINCIPAL
+    mock_session.exec.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_load_principal_from_local_cache(mock_redis):
+    mock_session = session_with(
+        User(id=1, email="user@example.com", password_hash="x", is_verified=True)
+    )
+    await load_principal(mock_session, 1)
+    mock_session.exec.reset_mock()
+
+    assert await load_principal(mock_session, 1) == PRINCIPAL
+    mock_session.exec.assert_not_awaited()
+    mock_redis.get.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_load_principal_missing_user(mock_redis):
+    assert await load_principal(session_with(None), 1) is None
+    mock_redis.setex.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_load_principal_redis_down(mock_redis):
+    mock_redis.get.side_effect = ConnectionError("down")
+    user = User(id=1, email="user@example.com", password_hash="x", is_verified=True)
+
+    assert await load_principal(session_with(user), 1) == PRINCIPAL
+
+
+@pytest.mark.asyncio
+async def test_invalidate_user(mock_redis):
+    local_user_cache[1] = (float("inf"), PRINCIPAL)
+
+    await invalidate_user(1)
+
+    assert 1 not in local_user_cache
+    mock_redis.delete.assert_awaited_once_with(user_cache_key(1))
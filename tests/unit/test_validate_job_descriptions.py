@@ -0,0 +1,31 @@
+import uuid
+import pytest
+from pydantic import ValidationError
+from schemas.letter import GenerateCoverLetterBatch
+
+VALID_JOB = "50charslong" * 5
+
+
+def test_validate_job_descriptions_success():
+    batch = GenerateCoverLetterBatch(cv_id=uuid.uuid4(), job_descs=[VALID_JOB] * 3)
+
+    assert batch.job_descs == [VALID_JOB] * 3
+
+
+@pytest.mark.parametrize(
+    "job_descs, expected_message",
+    [
+        ([], "at least 1 item"),
+        ([VALID_JOB] * 51, "at most 50 items"),
+        ([VALID_JOB, "too short"], "Job description must be at least 50 characters"),
+        (
+            ["a" * 3001],
+            "Job description cannot be longer than 3000 characters long",
+        ),
+    ],
+)
+def test_validate_job_descriptions_errors(job_descs, expected_message):
+    with pytest.raises(ValidationError) as e:
+        GenerateCoverLetterBatch(cv_id=uuid.uuid4(), job_descs=job_descs)
+
+    assert expected_message in str(e.value)
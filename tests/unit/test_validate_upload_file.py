@@ -1,21 +1,52 @@
+import hashlib
+import io
 import pytest
 from fastapi import UploadFile, HTTPException
-from unittest.mock import AsyncMock, patch, MagicMock
+from starlette.datastructures import Headers
+from unittest.mock import patch
 from helpers.validate_upload_file import validate_upload_file
 
 
+def upload_file(content, content_type):
+    return UploadFile(
+        file=io.BytesIO(content), headers=Headers({"content-type": content_type})
+    )
+
+
 @pytest.mark.asyncio
 @patch("helpers.validate_upload_file.magic.from_buffer", return_value="application/pdf")
 async def test_validate_upload_file_success(mock_magic):
-    mock_file = MagicMock(spec=UploadFile)
-    mock_file.content_type = "application/pdf"
-    mock_file.read = AsyncMock(return_value=b"%PDF-1.4 valid content")
-    mock_file.seek = AsyncMock()
+    file = upload_file(b"%PDF-1.4 valid content", "application/pdf")
+
+    result = await validate_upload_file(file)
+
+    assert result.size == len(b"%PDF-1.4 valid content")
+    assert result.sha256 == hashlib.sha256(b"%PDF-1.4 valid content").hexdigest()
+    assert file.file.tell() == 0
+    mock_magic.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch("helpers.validate_upload_file.UPLOAD_CHUNK_SIZE", 4)
+@patch("helpers.validate_upload_file.magic.from_buffer", return_value="application/pdf")
+async def test_validate_upload_file_sniffs_first_chunk_only(mock_magic):
+    file = upload_file(b"%PDF-1.4 valid content", "application/pdf")
+
+    await validate_upload_file(file)
+
+    mock_magic.assert_called_once_with(b"%PDF", mime=True)
 
-    result = await validate_upload_file(mock_file)
 
-    assert result == b"%PDF-1.4 valid content"
-    mock_file.seek.assert_called_once_with(0)
+@pytest.mark.asyncio
+@patch("helpers.validate_upload_file.MAX_FILE_SIZE_MB", 1)
+@patch("helpers.validate_upload_file.magic.from_buffer", return_value="application/pdf")
+async def test_validate_upload_file_stops_reading_when_too_large(mock_magic):
+    file = upload_file(b"a" * (4 * 1024 * 1024), "application/pdf")
+
+    with pytest.raises(HTTPException):
+        await validate_upload_file(file)
+
+    assert file.file.tell() < 2 * 1024 * 1024
 
 
 @pytest.mark.asyncio
@@ -40,6 +71,12 @@ async def test_validate_upload_file_success(mock_magic):
             "application/octet-stream",
             "not a valid PDF",
         ),
+        (
+            b"",
+            "application/pdf",
+            "application/pdf",
+            "not a valid PDF",
+        ),
     ],
 )
 @patch("helpers.validate_upload_file.magic.from_buffer")
@@ -48,13 +85,8 @@ async def test_validate_upload_file_errors(
 ):
     mock_magic.return_value = fake_mime
 
-    mock_file = MagicMock(spec=UploadFile)
-    mock_file.content_type = content_type
-    mock_file.read = AsyncMock(return_value=content)
-    mock_file.seek = AsyncMock()
-
     with pytest.raises(HTTPException) as e:
-        await validate_upload_file(mock_file)
+        await validate_upload_file(upload_file(content, content_type))
 
     assert e.value.status_code == 400
     assert expected_error in e.value.detail
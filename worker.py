@@ -0,0 +1,35 @@
+import asyncio
+from config import LETTER_WORKER_CONCURRENCY, LETTER_WORKER_ID
+from services.letter_jobs import logger, requeue_orphaned_jobs, process_letter_jobs
+from database import async_engine, wait_for_database
+from services.pdf_pool import pdf_pool
+from services.s3 import get_s3_client, close_s3_client
+
+
+async def main():
+    """Runs LETTER_WORKER_CONCURRENCY concurrent consumers of the letter job queue."""
+    await wait_for_database()
+    await requeue_orphaned_jobs(LETTER_WORKER_ID)
+
+    logger.log_info(
+        f"Letter worker {LETTER_WORKER_ID} started with "
+        f"{LETTER_WORKER_CONCURRENCY} consumers"
+    )
+
+    get_s3_client()
+    pdf_pool.start()
+    try:
+        await asyncio.gather(
+            *[
+                process_letter_jobs(LETTER_WORKER_ID)
+                for _ in range(LETTER_WORKER_CONCURRENCY)
+            ]
+        )
+    finally:
+        pdf_pool.shutdown()
+        close_s3_client()
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())